@@ -0,0 +1,163 @@
+"""
+Two-tier cache shared by the application.
+
+Values live in the shared Django cache (Redis) and are mirrored in a small in-process LRU,
+so hot keys are served without a network round trip. Local copies expire after
+``LOCAL_CACHE_TIMEOUT`` seconds, which bounds how long other processes may see a value
+after it was deleted or replaced. Misses are recomputed once per key at a time, both within
+a process and across processes, and TTLs are jittered so keys set together do not expire together.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+
+MISSING = object()
+LOCK_TIMEOUT = 10  # seconds a recomputation may hold the lock of its key
+LOCK_POLL_INTERVAL = 0.05  # seconds
+
+
+class LocalLRUCache:
+    """Thread safe in-process LRU with a per-entry expiry"""
+
+    def __init__(self, max_entries: int, timeout: float):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default=MISSING):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, timeout: float | None = None):
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        with self._lock:
+            self._entries[key] = (value, time.time() + timeout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def jittered(timeout: float | None) -> float | None:
+    """Spread ``timeout`` by ``CACHE_TTL_JITTER`` in both directions, None means forever"""
+    if timeout is None:
+        return None
+    jitter = settings.CACHE_TTL_JITTER
+    return timeout * random.uniform(1 - jitter, 1 + jitter)
+
+
+class TwoTierCache:
+    def __init__(self, alias: str = "default", max_entries: int | None = None, local_timeout: float | None = None):
+        self.alias = alias
+        self.local = LocalLRUCache(
+            max_entries if max_entries is not None else settings.LOCAL_CACHE_MAX_ENTRIES,
+            local_timeout if local_timeout is not None else settings.LOCAL_CACHE_TIMEOUT,
+        )
+        self._key_locks = {}
+        self._key_locks_lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def get(self, key: str, default=None):
+        """Cached value of ``key``, falsy values like 0, "" or None are returned as stored"""
+        value = self.local.get(key)
+        if value is MISSING:
+            value = self.shared.get(key, MISSING)
+            if value is MISSING:
+                return default
+            self.local.set(key, value)
+        return value
+
+    def set(self, key: str, value, timeout: float | None):
+        timeout = jittered(timeout)
+        self.shared.set(key, value, timeout=timeout)
+        self.local.set(key, value, timeout)
+
+    def delete(self, key: str):
+        """Delete ``key`` everywhere, local copies in other processes expire after ``LOCAL_CACHE_TIMEOUT``"""
+        self.local.delete(key)
+        self.shared.delete(key)
+
+    def get_or_set(self, key: str, compute: Callable[[], Any], timeout: float | None):
+        """
+        Return the cached value of ``key`` or compute, store and return it.
+
+        Only one caller per key computes at a time: threads of this process wait on a lock and
+        other processes wait for the value while a shared lock key exists. A waiter that does not
+        see the value within ``LOCK_TIMEOUT`` computes it itself.
+        """
+        value = self.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        with self._key_lock(key):
+            value = self.get(key, MISSING)
+            if value is not MISSING:
+                return value
+
+            lock_key, token = f"{key}:lock", uuid4().hex
+            acquired = self.shared.add(lock_key, token, timeout=LOCK_TIMEOUT)
+            if not acquired:
+                value = self._wait_for(key)
+                if value is not MISSING:
+                    return value
+            try:
+                value = compute()
+                self.set(key, value, timeout)
+            finally:
+                if acquired:
+                    self._release(lock_key, token)
+            return value
+
+    def _release(self, lock_key: str, token: str):
+        """Delete the shared lock unless it expired meanwhile and another caller holds it now"""
+        if self.shared.get(lock_key) == token:
+            self.shared.delete(lock_key)
+
+    def _wait_for(self, key: str):
+        deadline = time.time() + LOCK_TIMEOUT
+        while time.time() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            value = self.shared.get(key, MISSING)
+            if value is not MISSING:
+                self.local.set(key, value)
+                return value
+        return MISSING
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._key_locks_lock:
+            if key not in self._key_locks:
+                if len(self._key_locks) >= self.local.max_entries:
+                    # drop locks nobody holds, so the registry does not grow with every key ever missed
+                    self._key_locks = {k: lock for k, lock in self._key_locks.items() if lock.locked()}
+                self._key_locks[key] = threading.Lock()
+            return self._key_locks[key]
+
+
+cache = TwoTierCache()
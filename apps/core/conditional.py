@@ -0,0 +1,102 @@
+"""
+Conditional GET support, ``ETag`` and ``Last-Modified`` validators answered with ``304 Not Modified``.
+
+Validators are computed without rendering the response: views decorated with ``conditional_response``
+get them from a cheap query before running, ``cached_response`` derives them from its cache key.
+"""
+
+import hashlib
+from datetime import datetime
+from functools import wraps
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+def make_etag(request, *parts) -> str:
+    """ETag of the response to ``request`` whose content is identified by ``parts``"""
+    # the renderer and the user are part of the representation, not only the data
+    key = f"{request.get_full_path()}:{request.accepted_media_type}:{request.user.pk}:{parts}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def collection_validators(request, queryset, field: str = "updated_at") -> tuple[str, None]:
+    """
+    Validators of a response listing rows of ``queryset``, from the latest ``field`` of its rows and their count.
+
+    The count catches deletions, which leave the latest timestamp of the remaining rows as it was,
+    so no ``Last-Modified`` is sent, it would not change on a deletion.
+    """
+    aggregate = queryset.order_by().aggregate(last_modified=Max(field), count=Count("pk"))
+    return make_etag(request, aggregate["last_modified"], aggregate["count"]), None
+
+
+def object_validators(request, queryset, field: str = "updated_at") -> tuple[str, datetime] | None:
+    """Validators of a response rendering the row of ``queryset`` from its ``field``, None when there is no row"""
+    try:
+        last_modified = queryset.values_list(field, flat=True).first()
+    except (TypeError, ValueError, ValidationError):
+        # a malformed lookup value, the view answers it with a 404
+        return None
+    if last_modified is None:
+        return None
+    return make_etag(request, last_modified), last_modified
+
+
+def not_modified(request, etag: str | None, last_modified: datetime | None = None):
+    """The ``304`` (or ``412``) response to ``request`` when its preconditions match the validators, else None"""
+    if request.method not in SAFE_METHODS:
+        return None
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=quote_etag(etag) if etag else None, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag: str | None, last_modified: datetime | None = None):
+    """Send the validators with ``response``, clients may keep its body but must revalidate it before reuse"""
+    if etag:
+        response["ETag"] = quote_etag(etag)
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def conditional_response(validators):
+    """
+    Answer GET requests of a view method with ``304 Not Modified`` while the client's copy is current.
+
+    ``validators(view, request, **kwargs)`` returns the ``(etag, last_modified)`` of the response,
+    either may be None, or None when the response can not be validated, e.g. the object does not exist.
+    It runs before the view method, so it must not depend on the rendered data.
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            if request.method not in SAFE_METHODS:
+                return view_method(view, request, *args, **kwargs)
+
+            current = validators(view, request, **kwargs)
+            if current is None:
+                return view_method(view, request, *args, **kwargs)
+
+            etag, last_modified = current
+            if (response := not_modified(request, etag, last_modified)) is not None:
+                return response
+
+            response = view_method(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                set_validators(response, etag, last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -6,3 +6,15 @@ class BadRequestException(APIException):
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = "Invalid request parameters"
     default_code = "BadRequestException"
+
+
+class ConflictException(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Request conflicts with another request in progress"
+    default_code = "ConflictException"
+
+
+class UnprocessableEntityException(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "Request can not be processed"
+    default_code = "UnprocessableEntityException"
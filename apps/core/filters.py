@@ -0,0 +1,42 @@
+from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
+
+from .geo import filter_near
+
+DEFAULT_RADIUS_KM = 10
+MAX_RADIUS_KM = 500
+
+
+class GeoProximityFilterSet(filters.FilterSet):
+    """Filter set of models with ``latitude`` and ``longitude`` columns, see ``apps.core.geo``"""
+
+    near = filters.CharFilter(method="filter_near", label="Only rows within radius km of this point, as lat,lng")
+    radius = filters.NumberFilter(
+        method="skip", label=f"Radius of near in km, {DEFAULT_RADIUS_KM} by default and at most {MAX_RADIUS_KM}"
+    )
+    ordering = filters.ChoiceFilter(
+        choices=[("distance", "distance")], method="skip", label="Sort rows by their distance to near"
+    )
+
+    def skip(self, queryset, name, value):
+        # used by filter_near
+        return queryset
+
+    def filter_near(self, queryset, name, value):
+        try:
+            latitude, longitude = (float(coordinate) for coordinate in value.split(","))
+        except ValueError:
+            raise ValidationError({"near": "Expected a point as lat,lng."}) from None
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValidationError({"near": "Latitude must be between -90 and 90, longitude between -180 and 180."})
+
+        radius = self.form.cleaned_data.get("radius")
+        if radius is None:
+            radius = DEFAULT_RADIUS_KM
+        if not 0 < radius <= MAX_RADIUS_KM:
+            raise ValidationError({"radius": f"Radius must be greater than 0 and at most {MAX_RADIUS_KM} km."})
+
+        queryset = filter_near(queryset, latitude, longitude, float(radius))
+        if self.form.cleaned_data.get("ordering") == "distance":
+            queryset = queryset.order_by("distance", "id")
+        return queryset
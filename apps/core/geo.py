@@ -0,0 +1,69 @@
+"""
+Proximity lookups on the ``latitude`` and ``longitude`` columns extracted from ``geo_location``.
+
+A bounding box around the point narrows the rows down on the coordinate index first,
+the exact great-circle distance is only computed for the rows inside it.
+"""
+
+import math
+
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def geo_coordinates(geo_location: dict | None) -> tuple[float | None, float | None]:
+    """Latitude and longitude of a ``geo_location`` value, both None when it has none"""
+    if not geo_location:
+        return None, None
+    return geo_location.get("latitude"), geo_location.get("longitude")
+
+
+def sync_coordinates(instance, update_fields=None):
+    """
+    Copy the coordinates of ``instance.geo_location`` into its ``latitude`` and ``longitude`` columns before a save,
+    returns ``update_fields`` extended by the columns when the save writes ``geo_location``.
+    """
+    instance.latitude, instance.longitude = geo_coordinates(instance.geo_location)
+    if update_fields is not None and "geo_location" in update_fields:
+        update_fields = {*update_fields, "latitude", "longitude"}
+    return update_fields
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Q:
+    """Rows whose coordinates lie in the smallest latitude/longitude box containing the circle"""
+    latitude_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    box = Q(latitude__gte=latitude - latitude_delta, latitude__lte=latitude + latitude_delta)
+    if abs(latitude) + latitude_delta >= 90:
+        # the circle contains a pole, every longitude is in range
+        return box
+
+    longitude_delta = math.degrees(
+        math.asin(min(math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(latitude)), 1))
+    )
+    west, east = longitude - longitude_delta, longitude + longitude_delta
+    if west < -180:
+        return box & (Q(longitude__gte=west + 360) | Q(longitude__lte=east))
+    if east > 180:
+        return box & (Q(longitude__gte=west) | Q(longitude__lte=east - 360))
+    return box & Q(longitude__gte=west, longitude__lte=east)
+
+
+def haversine_distance(latitude: float, longitude: float):
+    """Expression of the great-circle distance in km between the row's coordinates and the point"""
+    latitude_delta = Radians(F("latitude") - Value(latitude)) / 2
+    longitude_delta = Radians(F("longitude") - Value(longitude)) / 2
+    a = Power(Sin(latitude_delta), 2) + Cos(Radians(Value(latitude))) * Cos(Radians(F("latitude"))) * Power(
+        Sin(longitude_delta), 2
+    )
+    return Value(2 * EARTH_RADIUS_KM) * ASin(Sqrt(a), output_field=FloatField())
+
+
+def filter_near(queryset, latitude: float, longitude: float, radius_km: float):
+    """Rows within ``radius_km`` of the point, annotated with their ``distance`` in km"""
+    return (
+        queryset.filter(bounding_box(latitude, longitude, radius_km))
+        .annotate(distance=haversine_distance(latitude, longitude))
+        .filter(distance__lte=radius_km)
+    )
@@ -0,0 +1,119 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.response import Response
+from rest_framework.status import is_success
+
+from .exceptions import BadRequestException, ConflictException, UnprocessableEntityException
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+IN_FLIGHT = "in-flight"
+COMPLETED = "completed"
+POLL_INTERVAL = 0.1  # seconds
+
+idempotency_key_parameter = OpenApiParameter(
+    IDEMPOTENCY_HEADER,
+    description="Unique key of the request, retrying with the same key replays the first response.",
+    type=str,
+    location="header",
+    required=False,
+)
+
+
+def _cache_key(request, key: str) -> str:
+    digest = hashlib.sha256(f"{request.method}:{request.path}:{key}".encode()).hexdigest()
+    return f"idempotency:{request.user.pk}:{digest}"
+
+
+def _wait_for_completion(cache_key: str):
+    """
+    Poll the record of a request in progress until it completes. A record released by a failed request,
+    or gone for any other reason, is never claimed again by the waiter, it may not tell a finished request
+    from one still running, so the client has to retry.
+    """
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        record = cache.get(cache_key)
+        if record is None:
+            raise ConflictException("The request with the same idempotency key did not complete, retry it.")
+        if record["state"] == COMPLETED:
+            return record
+    raise ConflictException("A request with the same idempotency key is still in progress.")
+
+
+def _claim(cache_key: str, fingerprint: str):
+    """
+    Mark the key as in flight and return None, or return the completed record of an earlier
+    request with the same key, waiting for it while it is still in flight
+    """
+    in_flight_record = {"state": IN_FLIGHT, "fingerprint": fingerprint}
+    # outlives any request, so the record of a slow one never expires while a duplicate waits for it
+    while not cache.add(cache_key, in_flight_record, timeout=settings.IDEMPOTENCY_IN_FLIGHT_TTL):
+        record = cache.get(cache_key)
+        if record is None:
+            # the key got released between add() and get(), try to claim it again
+            continue
+        if record["fingerprint"] != fingerprint:
+            raise UnprocessableEntityException("Idempotency key was already used with a different request.")
+        if record["state"] == IN_FLIGHT:
+            return _wait_for_completion(cache_key)
+        return record
+    return None
+
+
+def idempotent(view_method):
+    """
+    Make a view method safe to retry with an ``Idempotency-Key`` header.
+
+    The first request with a key runs the view and its successful response is stored per user
+    for ``IDEMPOTENCY_KEY_TTL`` seconds, later requests with the same key get that response back.
+    A duplicate arriving while the first one still runs waits for it instead of running twice,
+    and gets a 409 when the first one fails. Failed requests release the key so the client can retry
+    them. Requests without the header are not affected.
+    """
+
+    @wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(view, request, *args, **kwargs)
+        if len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            raise BadRequestException(f"{IDEMPOTENCY_HEADER} must be at most {IDEMPOTENCY_KEY_MAX_LENGTH} characters.")
+
+        cache_key = _cache_key(request, key)
+        fingerprint = hashlib.sha256(request.body).hexdigest()
+
+        if (record := _claim(cache_key, fingerprint)) is not None:
+            return Response(record["data"], status=record["status"], headers={"Idempotent-Replayed": "true"})
+
+        try:
+            response = view_method(view, request, *args, **kwargs)
+        except Exception:
+            cache.delete(cache_key)
+            raise
+
+        if not is_success(response.status_code):
+            cache.delete(cache_key)
+            return response
+
+        completed_record = {
+            "state": COMPLETED,
+            "fingerprint": fingerprint,
+            "status": response.status_code,
+            "data": response.data,
+        }
+        # the response is only replayable once the changes it reports are committed
+        transaction.on_commit(
+            lambda: cache.set(cache_key, completed_record, timeout=settings.IDEMPOTENCY_KEY_TTL),
+            robust=True,
+        )
+        return response
+
+    return wrapper
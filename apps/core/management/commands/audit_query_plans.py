@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.query_audit import audit_query_plans
+
+
+class Command(BaseCommand):
+    help = "Explain the hot querysets registered in the hot_queries modules and flag sequential scans"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--plans", action="store_true", help="Print the query plan of every queryset")
+
+    def handle(self, *args, **options):
+        plans = audit_query_plans()
+        for plan in plans:
+            if plan.sequential_scans:
+                self.stdout.write(
+                    self.style.WARNING(f"{plan.name}: sequential scan of {', '.join(plan.sequential_scans)}")
+                )
+            else:
+                self.stdout.write(f"{plan.name}: ok")
+            if options["plans"]:
+                self.stdout.write(plan.plan)
+
+        flagged = sum(bool(plan.sequential_scans) for plan in plans)
+        if flagged:
+            raise CommandError(f"{flagged} of {len(plans)} hot queries scan a table sequentially.")
+        self.stdout.write(self.style.SUCCESS(f"All {len(plans)} hot queries use an index."))
@@ -0,0 +1,51 @@
+import logging
+import time
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    """Database execute wrapper counting the queries run through a connection and the time spent in them"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started_at
+
+
+class QueryCountMiddleware:
+    """
+    Record the number of queries and the database time of every request per view.
+
+    Requests running more than ``QUERY_COUNT_WARNING_THRESHOLD`` queries are logged as warnings.
+    With ``QUERY_COUNT_HEADERS`` on, the numbers are also sent back in ``X-Query-Count`` and
+    ``Server-Timing`` response headers.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = QueryStats()
+        with connection.execute_wrapper(stats):
+            response = self.get_response(request)
+
+        duration_ms = stats.duration * 1000
+        view_name = request.resolver_match.view_name if request.resolver_match else request.path
+        level = logging.WARNING if stats.count > settings.QUERY_COUNT_WARNING_THRESHOLD else logging.DEBUG
+        logger.log(level, "%s %s ran %d queries in %.1fms", request.method, view_name, stats.count, duration_ms)
+
+        if settings.QUERY_COUNT_HEADERS:
+            response["X-Query-Count"] = stats.count
+            response["Server-Timing"] = f'db;dur={duration_ms:.1f};desc="{stats.count} queries"'
+        return response
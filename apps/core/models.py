@@ -1,10 +1,136 @@
+import copy
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from django.db import models
+from django.db.models.fields.files import FieldFile
 
+_relaxed_validation = ContextVar("relaxed_validation", default=False)
 
-class BaseModel(models.Model):
+
+@contextmanager
+def relaxed_validation():
+    """
+    Saves of ``BaseModel`` instances in the block run the ``clean()`` business rules only, for trusted
+    batch jobs writing values the server built or validated before. The database constraints still apply.
+    """
+    token = _relaxed_validation.set(True)
+    try:
+        yield
+    finally:
+        _relaxed_validation.reset(token)
+
+
+def _comparable(value):
+    """Copy of a field value that later changes of the attribute do not reach"""
+    if isinstance(value, FieldFile):
+        return value.name
+    if isinstance(value, (dict, list)):
+        # JSON values changed in place would still compare equal to a shared snapshot
+        return copy.deepcopy(value)
+    return value
+
+
+class FieldTrackerMixin:
+    """
+    Remembers the column values an instance was loaded or last saved with, so changes and transitions,
+    e.g. of a status, are known without querying the stored row.
+
+    Columns deferred when loading are tracked once they are loaded, instances that were never saved
+    count every field as changed.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._track(field_names)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        if fields is None:
+            self._track()
+        else:
+            self._track(
+                field.attname for field in self._meta.concrete_fields if {field.name, field.attname} & {*fields}
+            )
+
+    def save_base(self, *args, update_fields=None, **kwargs):
+        super().save_base(*args, update_fields=update_fields, **kwargs)
+        if update_fields is None:
+            self._track()
+        else:
+            self._track(self._meta.get_field(name).attname for name in update_fields)
+
+    def _track(self, attnames=None):
+        """Remember the current values of ``attnames``, of every loaded column when None"""
+        if attnames is None:
+            deferred = self.get_deferred_fields()
+            attnames = [field.attname for field in self._meta.concrete_fields if field.attname not in deferred]
+        tracked = self.__dict__.setdefault("_tracked_values", {})
+        tracked.update((attname, _comparable(getattr(self, attname))) for attname in attnames)
+
+    def tracked_value(self, field_name: str):
+        """Value of ``field_name`` when the instance was loaded or last saved, None if it never was"""
+        attname = self._meta.get_field(field_name).attname
+        if attname in self.get_deferred_fields():
+            getattr(self, attname)  # loading a deferred column tracks it
+        return self.__dict__.get("_tracked_values", {}).get(attname)
+
+    def has_changed(self, field_name: str) -> bool:
+        return field_name in self.changed_fields
+
+    @property
+    def changed_fields(self) -> set[str]:
+        """Names of the concrete fields set to another value since the instance was loaded or last saved"""
+        tracked = self.__dict__.get("_tracked_values", {})
+        deferred = self.get_deferred_fields()
+        return {
+            field.name
+            for field in self._meta.concrete_fields
+            if field.attname not in deferred
+            and (field.attname not in tracked or tracked[field.attname] != _comparable(getattr(self, field.attname)))
+        }
+
+    def changed_update_fields(self, exclude=()) -> list[str]:
+        """``update_fields`` of a save writing just the changed columns, and the ``auto_now`` ones it refreshes"""
+        changed = self.changed_fields
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.name not in exclude
+            and (field.name in changed or getattr(field, "auto_now", False))
+        ]
+
+
+class BaseModel(FieldTrackerMixin, models.Model):
     public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
 
+    # unique fields the server fills, e.g. with fresh uuid4 defaults, their uniqueness is left to the
+    # database constraints instead of a SELECT per field on every save, see validate_on_save
+    server_generated_fields = ("public_id",)
+
     class Meta:
         abstract = True
+
+    def validate_on_save(self, exclude=()):
+        """
+        ``full_clean()`` of ``save()`` without the queries the database constraints make redundant.
+
+        Server generated fields, columns stored unchanged and foreign keys to related instances already
+        loaded are not validated again, ``clean()`` always runs. Within ``relaxed_validation()`` only
+        ``clean()`` does.
+        """
+        if _relaxed_validation.get():
+            self.clean()
+            return
+        changed = self.changed_fields
+        exclude = {
+            *exclude,
+            *self.server_generated_fields,
+            *(field.name for field in self._meta.concrete_fields if field.name not in changed),
+            *(field.name for field in self._meta.concrete_fields if field.many_to_one and field.is_cached(self)),
+        }
+        self.full_clean(exclude=exclude)
@@ -0,0 +1,166 @@
+import base64
+import json
+from functools import reduce
+from operator import and_, or_
+from types import SimpleNamespace
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+# for views documenting their paginated responses by hand
+cursor_parameter = OpenApiParameter(
+    "cursor", description="The pagination cursor value.", type=str, location="query", required=False
+)
+page_parameter = OpenApiParameter(
+    "page",
+    description="A page number within the paginated result set, switches to page number pagination.",
+    type=int,
+    location="query",
+    required=False,
+)
+
+
+def _invert(field: str) -> str:
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination over ``ordering``, which has to be a unique sort key of the paginated rows.
+
+    A page is selected by comparing the sort key with the one of the last row of the previous page
+    instead of skipping rows with an OFFSET, and no COUNT(*) is run, so deep pages cost as much as
+    the first one. Cursors are opaque, clients follow the ``next`` and ``previous`` links.
+
+    Clients that need page numbers opt in by sending the ``page`` query parameter, which pages
+    the same ordering with ``PageNumberPagination``. Querysets a filter ordered explicitly, like
+    search results by relevance or by distance, have no keyset and are always paged by number.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    page_query_param = "page"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self):
+        self.page_number_pagination = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.page_query_param in request.query_params or queryset.query.order_by:
+            if not queryset.query.order_by:
+                queryset = queryset.order_by(*self.ordering)
+            self.page_number_pagination = PageNumberPagination()
+            self.page_number_pagination.page_size = self.page_size
+            return self.page_number_pagination.paginate_queryset(queryset, request, view)
+
+        queryset = queryset.order_by(*self.ordering)
+        self.request = request
+        self.model = queryset.model
+        position, reverse = self.decode_cursor(request)
+        if reverse:
+            queryset = queryset.order_by(*(_invert(field) for field in self.ordering))
+        if position is not None:
+            queryset = queryset.filter(self._after(position, reverse))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # coming back from a later page means there is a next page, and the other way round
+        self.has_next = reverse or has_more
+        self.has_previous = has_more if reverse else position is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        if self.page_number_pagination is not None:
+            return self.page_number_pagination.get_paginated_response(data)
+        return Response({"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": cursor_parameter.description,
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_query_param,
+                "required": False,
+                "in": "query",
+                "description": page_parameter.description,
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, row, reverse: bool) -> str:
+        fields = [self._field(field) for field in self.ordering]
+        if isinstance(row, dict):
+            # a row of a values() queryset, see apps.core.projection
+            row = SimpleNamespace(**{field.attname: row[field.name] for field in fields})
+        position = [field.value_to_string(row) for field in fields]
+        cursor = base64.urlsafe_b64encode(json.dumps({"p": position, "r": int(reverse)}).encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request) -> tuple[list | None, bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            position = [
+                self._field(field).to_python(value) for field, value in zip(self.ordering, cursor["p"], strict=True)
+            ]
+            return position, bool(cursor["r"])
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message) from None
+
+    def _field(self, ordering_field: str):
+        return self.model._meta.get_field(ordering_field.lstrip("-"))
+
+    def _after(self, position: list, reverse: bool) -> Q:
+        """Rows following ``position`` in the (reversed) ordering, compared like a tuple"""
+        conditions = []
+        for index, field in enumerate(self.ordering):
+            descending = field.startswith("-") != reverse
+            name = field.lstrip("-")
+            equal = [
+                Q(**{other.lstrip("-"): value})
+                for other, value in zip(self.ordering[:index], position[:index], strict=True)
+            ]
+            after = Q(**{f"{name}__{'lt' if descending else 'gt'}": position[index]})
+            conditions.append(reduce(and_, [*equal, after]))
+        return reduce(or_, conditions)
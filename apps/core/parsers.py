@@ -0,0 +1,35 @@
+import codecs
+import io
+import re
+
+import orjson
+from rest_framework.parsers import JSONParser, get_encoding
+
+from .renderers import ORJSONRenderer
+
+# orjson reads integers beyond 64 bits as floats, JSONParser keeps them exact
+LONG_NUMBER = re.compile(rb"\d{20}")
+
+
+class ORJSONParser(JSONParser):
+    """
+    ``JSONParser`` decoding UTF-8 bodies with orjson.
+
+    Bodies orjson rejects, like lone surrogates, and bodies with numbers of 20 digits or more are parsed
+    by ``JSONParser``, so they are accepted, refused and read exactly as before.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        if codecs.lookup(get_encoding(parser_context)).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        content = stream.read()
+        if LONG_NUMBER.search(content):
+            return super().parse(io.BytesIO(content), media_type, parser_context)
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(content), media_type, parser_context)
@@ -0,0 +1,172 @@
+"""
+Fast read path of list endpoints, rows loaded with ``.values()`` and rendered without a serializer.
+
+A ``Projection`` resolves the fields of a ``ModelSerializer`` once, into the lookups to load and
+a converter per field, and turns each row into the dict the serializer would have rendered.
+Views opt in with ``ProjectionListMixin``, their serializer still documents the responses.
+"""
+
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .sparse_fields import FieldSelection, SparseFieldsMixin
+
+# fields whose to_representation returns database values of their column as they are
+PASSTHROUGH_FIELDS = (serializers.CharField, serializers.IntegerField, serializers.BooleanField)
+UNSUPPORTED_FIELDS = (RelatedField, ManyRelatedField, serializers.FileField, serializers.SerializerMethodField)
+# converter of datetimes rendered in ISO 8601 in the current time zone, see _iso_datetime
+ISO_DATETIME = object()
+
+
+def _iso_datetime(value, zone) -> str:
+    """``DateTimeField.to_representation`` of an aware datetime in ``zone``, which the field looks up per value"""
+    value = value.astimezone(zone).isoformat()
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+def _converter(field):
+    """
+    The cheapest converter rendering values of ``field`` like its ``to_representation``,
+    None when the values are kept as they are and ``ISO_DATETIME`` for ``_iso_datetime``.
+    """
+    if type(field) in PASSTHROUGH_FIELDS:
+        return None
+    if type(field) is serializers.UUIDField and field.uuid_format == "hex_verbose":
+        return str
+    if type(field) is serializers.DateTimeField and settings.USE_TZ and not hasattr(field, "timezone"):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if output_format is not None and output_format.lower() == ISO_8601:
+            return ISO_DATETIME
+    return field.to_representation
+
+
+class Projection:
+    """
+    Render rows of ``.values(*projection.lookups)`` exactly like ``serializer_class`` renders instances.
+
+    Supported are fields of model columns, also behind ``source`` paths, nested serializers and slug
+    fields of forward relations. Anything that needs an instance, like properties, method fields,
+    to-many or file fields, raises ``ImproperlyConfigured`` when the projection is built.
+    ``SparseFieldsMixin`` serializers are compiled for their ``selection``, see ``select``.
+    """
+
+    def __init__(self, serializer_class, selection: FieldSelection | None = None):
+        self.serializer_class = serializer_class
+        self.lookups = []
+        serializer = serializer_class(selection=selection) if selection is not None else serializer_class()
+        self._fields = self._compile(serializer, serializer_class.Meta.model, prefix="")
+
+    def select(self, selection: FieldSelection) -> "Projection":
+        """Projection of the fields ``selection`` picks, compiled once per selection"""
+        if selection == FieldSelection() or not issubclass(self.serializer_class, SparseFieldsMixin):
+            return self
+        return _selected(self.serializer_class, selection)
+
+    def render(self, rows) -> list[dict]:
+        zone = timezone.get_current_timezone()
+        return [self._render_row(row, self._fields, zone) for row in rows]
+
+    def _render_row(self, row, fields, zone) -> dict:
+        data = {}
+        for name, key, convert, nested in fields:
+            value = row[key]
+            if value is None:
+                data[name] = None
+            elif nested is not None:
+                data[name] = self._render_row(row, nested, zone)
+            elif convert is None:
+                data[name] = value
+            elif convert is ISO_DATETIME:
+                data[name] = _iso_datetime(value, zone)
+            else:
+                data[name] = convert(value)
+        return data
+
+    def _compile(self, serializer, model, prefix: str) -> list[tuple]:
+        fields = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            path = self._source_path(serializer, name, field)
+            try:
+                model_field = self._resolve(model, path)
+            except FieldDoesNotExist:
+                if not field.required and not hasattr(model, path[0]):
+                    # the serializer skips attributes its instances do not have
+                    continue
+                raise ImproperlyConfigured(f"{type(serializer).__name__}.{name} is not a model column.") from None
+
+            key = prefix + "__".join(path)
+            self.lookups.append(key)
+            if isinstance(field, serializers.BaseSerializer):
+                if not model_field.many_to_one and not model_field.one_to_one:
+                    raise ImproperlyConfigured(f"{type(serializer).__name__}.{name} is not a forward relation.")
+                # the relation column tells a missing related row apart from one with empty columns
+                nested = self._compile(field, model_field.related_model, prefix=f"{key}__")
+                fields.append((name, key, None, nested))
+            elif model_field.is_relation:
+                raise ImproperlyConfigured(
+                    f"{type(serializer).__name__}.{name} renders a relation without a serializer."
+                )
+            elif isinstance(field, serializers.SlugRelatedField):
+                fields.append((name, key, None, None))
+            else:
+                fields.append((name, key, _converter(field), None))
+        return fields
+
+    @staticmethod
+    def _source_path(serializer, name: str, field) -> list[str]:
+        """Attributes ``field`` renders the value of, ending in the slug column for slug fields"""
+        path = field.source.split(".")
+        if isinstance(field, serializers.SlugRelatedField):
+            return [*path, field.slug_field]
+        if isinstance(field, UNSUPPORTED_FIELDS) or isinstance(field, serializers.ListSerializer):
+            raise ImproperlyConfigured(f"{type(serializer).__name__}.{name} needs an instance to be rendered.")
+        return path
+
+    @staticmethod
+    def _resolve(model, path: list[str]):
+        """Model field at the end of a ``source`` path"""
+        for attribute in path[:-1]:
+            relation = model._meta.get_field(attribute)
+            # a to-many relation would turn each instance into several rows
+            if not relation.many_to_one and not relation.one_to_one:
+                raise FieldDoesNotExist(attribute)
+            model = relation.related_model
+        model_field = model._meta.get_field(path[-1])
+        if not model_field.concrete:
+            raise FieldDoesNotExist(path[-1])
+        return model_field
+
+
+@lru_cache(maxsize=128)
+def _selected(serializer_class, selection: FieldSelection) -> Projection:
+    return Projection(serializer_class, selection)
+
+
+# ``list`` rendering its rows through ``projection`` instead of the serializer when the view sets one.
+# Viewsets put it before ``ListModelMixin``, which lists views without a projection, plain API views
+# call ``list`` from ``get``. No docstring, drf-spectacular would take it as the description of the views.
+class ProjectionListMixin:
+    projection: Projection | None = None
+
+    def list(self, request, *args, **kwargs):
+        if self.projection is None:
+            return super().list(request, *args, **kwargs)
+
+        projection = self.projection.select(FieldSelection.from_request(request))
+        queryset = self.filter_queryset(self.get_queryset())
+        # the keyset paginator builds its cursors from the sort key of the rows
+        ordering = [field.lstrip("-") for field in getattr(self.paginator, "ordering", ())]
+        rows = queryset.values(*dict.fromkeys([*projection.lookups, *ordering]))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(projection.render(page))
+        return Response(projection.render(rows))
@@ -0,0 +1,62 @@
+"""
+Query plan audit of the hot querysets of the project.
+
+Apps register the querysets behind their busiest endpoints and tasks in a ``hot_queries`` module with
+``@hot_query``, the ``audit_query_plans`` command runs ``EXPLAIN`` on each and flags the tables they read
+with a sequential scan. On PostgreSQL sequential scans are disabled while explaining, so the planner picks
+any usable index even on the small tables of a development database, a remaining one means there is none.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.db import connections, transaction
+from django.db.models import QuerySet
+from django.utils.module_loading import autodiscover_modules
+
+_registry: dict[str, Callable[[], QuerySet]] = {}
+
+SEQUENTIAL_SCANS = {
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+    "sqlite": re.compile(r"\bSCAN (\w+)$", re.MULTILINE),
+}
+
+
+def hot_query(name: str):
+    """Register the function building the queryset audited as ``name``"""
+
+    def register(build: Callable[[], QuerySet]):
+        _registry[name] = build
+        return build
+
+    return register
+
+
+def hot_queries() -> dict[str, Callable[[], QuerySet]]:
+    autodiscover_modules("hot_queries")
+    return dict(sorted(_registry.items()))
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    name: str
+    plan: str
+    sequential_scans: tuple[str, ...]
+
+
+def explain(name: str, queryset: QuerySet) -> QueryPlan:
+    connection = connections[queryset.db]
+    with transaction.atomic(using=queryset.db):
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+
+    pattern = SEQUENTIAL_SCANS.get(connection.vendor)
+    scans = tuple(dict.fromkeys(pattern.findall(plan))) if pattern else ()
+    return QueryPlan(name=name, plan=plan, sequential_scans=scans)
+
+
+def audit_query_plans() -> list[QueryPlan]:
+    return [explain(name, build()) for name, build in hot_queries().items()]
@@ -0,0 +1,12 @@
+import redis
+from django.conf import settings
+
+_client = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Return the process wide client of the application Redis (``REDIS_URL``)"""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    return _client
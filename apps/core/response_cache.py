@@ -0,0 +1,114 @@
+import hashlib
+from functools import wraps
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+from .conditional import make_etag, not_modified, set_validators
+
+VERSION_KEY_PREFIX = "response-cache:version"
+
+
+def get_versions(*names: str) -> list[str]:
+    """Current values of the named versions, names without a version yet get a fresh one"""
+    keys = [f"{VERSION_KEY_PREFIX}:{name}" for name in names]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid4().hex, timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(*names: str):
+    """Invalidate every cached response keyed by one of the named versions"""
+    cache.set_many({f"{VERSION_KEY_PREFIX}:{name}": uuid4().hex for name in names}, timeout=None)
+
+
+def _cache_key(request, versions: list[str]) -> str:
+    query = sorted(request.query_params.lists())
+    digest = hashlib.sha256(f"{request.get_host()}:{request.path}:{query}:{versions}".encode()).hexdigest()
+    return f"response-cache:{digest}"
+
+
+def _etag(request, key: str, volatile, data) -> str:
+    """ETag of a response to ``request`` with ``data``, from the cache key and the values ``volatile`` returns"""
+    return make_etag(request, key, volatile(data) if volatile else None)
+
+
+def _validated(request, response, key: str, volatile):
+    """
+    ``response`` with an ETag of the cache key, which already covers everything the data depends on
+    but the fields ``volatile`` returns, or ``304 Not Modified`` when the client's copy is current.
+    """
+    if response.status_code != status.HTTP_200_OK:
+        return response
+    etag = _etag(request, key, volatile, response.data)
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+    return set_validators(response, etag)
+
+
+def _not_modified_before_view(request, key: str, refresh, volatile):
+    """
+    ``304 Not Modified`` for a conditional request whose client copy is current, checked without running the view.
+    The volatile values come from the cached data, None when they are needed but nothing is cached.
+    """
+    if "If-None-Match" not in request.headers:
+        return None
+    data = None
+    if volatile is not None:
+        if (data := cache.get(key)) is None:
+            return None
+        if refresh is not None:
+            data = refresh(data)
+    return not_modified(request, _etag(request, key, volatile, data))
+
+
+def cached_response(version_names, refresh=None, volatile=None):
+    """
+    Cache the data of successful anonymous GET responses of a view method.
+
+    ``version_names(request, **kwargs)`` returns the names of the versions the response depends on,
+    the cache key is built from the host, path, query string and the current value of those versions,
+    so bumping one of them with ``bump_versions`` makes every response depending on it stale.
+    Authenticated requests run the view unless their copy is current, their responses may depend on the user.
+
+    ``refresh(data)`` is called on data served from the cache and may update fields that change
+    more often than the versions are bumped, ``volatile(data)`` returns the values of those fields,
+    which must be the same for every user.
+
+    Every GET response carries an ETag of the cache key, the user and the volatile values, so conditional
+    requests are answered with ``304 Not Modified`` without running the view or rendering anything.
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            if request.method != "GET":
+                return view_method(view, request, *args, **kwargs)
+
+            key = _cache_key(request, get_versions(*version_names(request, **kwargs)))
+            if request.user.is_authenticated:
+                if (unchanged := _not_modified_before_view(request, key, refresh, volatile)) is not None:
+                    return unchanged
+                return _validated(request, view_method(view, request, *args, **kwargs), key, volatile)
+
+            data = cache.get(key)
+            if data is not None:
+                if refresh is not None:
+                    data = refresh(data)
+                return _validated(request, Response(data, headers={"X-Cache": "hit"}), key, volatile)
+
+            response = view_method(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(key, response.data, timeout=settings.RESPONSE_CACHE_TIMEOUT)
+                response["X-Cache"] = "miss"
+            return _validated(request, response, key, volatile)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,172 @@
+"""
+Sparse fieldsets and opt-in expansion of nested relations, picked with ``?fields=`` and ``?expand=``.
+
+Both take comma separated field names, dotted for the fields of nested serializers, e.g.
+``?fields=title,organization.name&expand=organization``. Without ``?fields=`` every field is rendered,
+without ``?expand=`` every nested relation is, so responses stay unchanged until a client asks for less.
+Relations left unexpanded render their ``Meta.expandable_fields`` slug instead, unknown names are ignored.
+"""
+
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+fields_parameter = OpenApiParameter(
+    "fields",
+    description="Comma separated fields to render, dotted for fields of nested objects, e.g. title,organization.name",
+    type=str,
+    location="query",
+    required=False,
+)
+expand_parameter = OpenApiParameter(
+    "expand",
+    description="Comma separated nested objects to render in full, the others are rendered as their identifier. "
+    "Every nested object is expanded when left out.",
+    type=str,
+    location="query",
+    required=False,
+)
+
+
+def _parse(value: str | None) -> frozenset | None:
+    if value is None:
+        return None
+    return frozenset(path.strip() for path in value.split(",") if path.strip())
+
+
+def _nested(paths: frozenset | None, name: str, whole) -> frozenset | None:
+    """Paths below ``name``, ``whole`` when ``name`` is named on its own"""
+    if paths is None:
+        return None
+    if name in paths:
+        return whole
+    return frozenset(path.removeprefix(f"{name}.") for path in paths if path.startswith(f"{name}."))
+
+
+@dataclass(frozen=True)
+class FieldSelection:
+    """Fields picked by ``?fields=`` and relations expanded by ``?expand=``, None for all of them"""
+
+    fields: frozenset | None = None
+    expand: frozenset | None = None
+
+    @classmethod
+    def from_request(cls, request) -> "FieldSelection":
+        """Selection of a read request, writes always render every field"""
+        if request is None or request.method not in SAFE_METHODS:
+            return cls()
+        return cls(_parse(request.query_params.get("fields")), _parse(request.query_params.get("expand")))
+
+    def includes(self, name: str) -> bool:
+        return self.fields is None or name in self.fields or any(path.startswith(f"{name}.") for path in self.fields)
+
+    def expands(self, name: str) -> bool:
+        return self.expand is None or name in self.expand or any(path.startswith(f"{name}.") for path in self.expand)
+
+    def nested(self, name: str) -> "FieldSelection":
+        """Selection of the serializer nested as ``name``, expanding nothing below it unless named"""
+        return FieldSelection(_nested(self.fields, name, None), _nested(self.expand, name, frozenset()))
+
+
+def _serializer_of(field):
+    """The serializer rendering a nested field, the child of a ``many=True`` one"""
+    if isinstance(field, serializers.ListSerializer):
+        return field.child
+    if isinstance(field, serializers.BaseSerializer):
+        return field
+    return None
+
+
+class SparseFieldsMixin:
+    """
+    ``ModelSerializer`` rendering only the fields of a ``FieldSelection``.
+
+    The root serializer reads the selection of the request in its context, nested serializers get
+    theirs from their parent. ``Meta.expandable_fields`` maps nested serializers to the slug field of
+    the related model rendered when they are not expanded. ``always_included_fields`` identify the
+    rendered objects and are kept in any case.
+    """
+
+    always_included_fields = ("public_id",)
+
+    def __init__(self, *args, selection: FieldSelection | None = None, **kwargs):
+        self._selection = selection
+        super().__init__(*args, **kwargs)
+
+    @property
+    def selection(self) -> FieldSelection:
+        if self._selection is None:
+            parent = self.parent.parent if isinstance(self.parent, serializers.ListSerializer) else self.parent
+            request = self.context.get("request") if parent is None else None
+            self._selection = FieldSelection.from_request(request)
+        return self._selection
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = self.selection
+        expandable = getattr(self.Meta, "expandable_fields", {})
+        for name, field in list(fields.items()):
+            if not selection.includes(name) and name not in self.always_included_fields:
+                del fields[name]
+            elif name in expandable and not selection.expands(name):
+                fields[name] = serializers.SlugRelatedField(
+                    slug_field=expandable[name],
+                    source=field.source,
+                    many=isinstance(field, serializers.ListSerializer),
+                    read_only=True,
+                )
+            elif isinstance(nested := _serializer_of(field), SparseFieldsMixin):
+                nested._selection = selection.nested(name)
+        return fields
+
+    def prune_queryset(self, queryset):
+        """
+        ``queryset`` loading only what the selected fields render.
+
+        Columns of fields left out are deferred and relations left out are not loaded. Relations
+        rendered as their slug load just that column, expanded ones are pruned by their own serializer.
+        """
+        model = queryset.model
+        selected = self.fields
+        deferred, prefetches = [], []
+        for name, field in super().get_fields().items():
+            source = field.source or name
+            if name not in selected:
+                model_field = self._model_field(model, source)
+                if model_field is not None and model_field.concrete and not model_field.is_relation:
+                    deferred.append(source)
+                continue
+
+            field = selected[name]
+            relation = self._model_field(model, source)
+            if relation is None or not relation.is_relation:
+                continue
+            related_manager = relation.related_model._default_manager
+            if isinstance(field, serializers.ManyRelatedField):
+                field = field.child_relation
+            if isinstance(field, serializers.SlugRelatedField):
+                related = related_manager.only(field.slug_field, *self._link_columns(relation))
+            elif isinstance(nested := _serializer_of(field), SparseFieldsMixin):
+                related = nested.prune_queryset(related_manager.all())
+            else:
+                related = related_manager.all()
+            prefetches.append(Prefetch(source, queryset=related))
+        return queryset.defer(*deferred).prefetch_related(*prefetches)
+
+    @staticmethod
+    def _model_field(model, source: str):
+        if "." in source:
+            return None
+        try:
+            return model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return None
+
+    @staticmethod
+    def _link_columns(relation) -> list[str]:
+        """Columns a prefetch of ``relation`` needs to attach its rows, the foreign key of reverse relations"""
+        return [relation.field.name] if relation.one_to_many else []
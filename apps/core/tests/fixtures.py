@@ -0,0 +1,30 @@
+import os
+
+import fakeredis
+import pytest
+import redis
+from django.core.cache import cache
+
+from apps.core import redis as core_redis
+from apps.core.cache import cache as two_tier_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Values cached by one test must not leak into the next one"""
+    cache.clear()
+    two_tier_cache.local.clear()
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """Application Redis backed by fakeredis, or by a real server when ``TEST_REDIS_URL`` is set"""
+    if test_redis_url := os.environ.get("TEST_REDIS_URL"):
+        client = redis.Redis.from_url(test_redis_url)
+    else:
+        client = fakeredis.FakeRedis()
+
+    client.flushdb()
+    monkeypatch.setattr(core_redis, "_client", client)
+    yield client
+    client.flushdb()
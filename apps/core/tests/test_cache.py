@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+import time_machine
+
+from apps.core.cache import MISSING, LocalLRUCache, TwoTierCache, jittered
+
+
+class TestTwoTierCache:
+    @pytest.fixture
+    def two_tier_cache(self):
+        return TwoTierCache(max_entries=2, local_timeout=5)
+
+    @pytest.mark.parametrize("value", [0, None, "", False, []])
+    def test_falsy_values_are_cached(self, two_tier_cache, value):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return value
+
+        two_tier_cache.get_or_set("key", compute, timeout=60)
+        two_tier_cache.local.clear()
+
+        assert two_tier_cache.get_or_set("key", compute, timeout=60) == value
+        assert len(calls) == 1
+
+    def test_local_tier_serves_hits_without_the_shared_tier(self, two_tier_cache):
+        two_tier_cache.set("key", 1, timeout=60)
+        two_tier_cache.shared.delete("key")
+
+        assert two_tier_cache.get("key") == 1
+
+    def test_local_copies_expire(self, two_tier_cache):
+        two_tier_cache.set("key", 1, timeout=60)
+        two_tier_cache.shared.set("key", 2)
+
+        with time_machine.travel(timedelta(seconds=6)):
+            assert two_tier_cache.get("key") == 2
+
+    def test_delete_removes_both_tiers(self, two_tier_cache):
+        two_tier_cache.set("key", 1, timeout=60)
+
+        two_tier_cache.delete("key")
+
+        assert two_tier_cache.get("key", "default") == "default"
+
+    def test_single_flight_on_miss(self, two_tier_cache):
+        calls = []
+        started = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: two_tier_cache.get_or_set("key", compute, timeout=60), range(8)))
+
+        assert results == [42] * 8
+        assert len(calls) == 1
+
+    def test_waits_for_other_process_holding_the_lock(self, two_tier_cache):
+        two_tier_cache.shared.add("key:lock", 1)
+        threading.Timer(0.1, lambda: two_tier_cache.shared.set("key", "theirs")).start()
+
+        assert two_tier_cache.get_or_set("key", lambda: "ours", timeout=60) == "theirs"
+
+    def test_waiter_computing_after_the_timeout_keeps_the_lock_of_its_holder(self, two_tier_cache, monkeypatch):
+        two_tier_cache.shared.add("key:lock", "theirs")
+        monkeypatch.setattr(two_tier_cache, "_wait_for", lambda key: MISSING)
+
+        assert two_tier_cache.get_or_set("key", lambda: "ours", timeout=60) == "ours"
+        assert two_tier_cache.shared.get("key:lock") == "theirs"
+
+    def test_lock_taken_over_after_it_expired_is_kept(self, two_tier_cache):
+        def compute():
+            # the lock expired during a slow computation and another process acquired it
+            two_tier_cache.shared.set("key:lock", "theirs")
+            return "ours"
+
+        assert two_tier_cache.get_or_set("key", compute, timeout=60) == "ours"
+        assert two_tier_cache.shared.get("key:lock") == "theirs"
+
+    def test_lock_is_released_by_its_holder(self, two_tier_cache):
+        two_tier_cache.get_or_set("key", lambda: "ours", timeout=60)
+
+        assert two_tier_cache.shared.get("key:lock") is None
+
+
+class TestLocalLRUCache:
+    def test_least_recently_used_entry_is_evicted(self):
+        local = LocalLRUCache(max_entries=2, timeout=60)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+
+        local.set("c", 3)
+
+        assert local.get("a") == 1
+        assert local.get("b", None) is None
+        assert local.get("c") == 3
+
+
+def test_jittered_timeout_stays_within_bounds(settings):
+    settings.CACHE_TTL_JITTER = 0.1
+
+    timeouts = {jittered(100) for _ in range(100)}
+
+    assert all(90 <= timeout <= 110 for timeout in timeouts)
+    assert len(timeouts) > 1
+    assert jittered(None) is None
+
+
+class TestOrganizationEventCount:
+    def test_zero_is_cached(self, organization, django_assert_num_queries):
+        assert organization.event_count == 0
+
+        with django_assert_num_queries(0):
+            assert organization.event_count == 0
+
+    def test_event_creation_and_deletion_invalidate_the_count(self, organization, event, create_event):
+        assert organization.event_count == 1
+
+        create_event(organization, event.start_date, event.end_date)
+        assert organization.event_count == 2
+
+        event.delete()
+        assert organization.event_count == 1
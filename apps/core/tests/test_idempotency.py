@@ -0,0 +1,114 @@
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.core.idempotency import IN_FLIGHT, _cache_key
+from apps.events.models import Ticket, TicketType
+from apps.payment.models import TicketTransaction
+
+
+class TestIdempotencyKey:
+    @pytest.fixture
+    def client(self, another_user):
+        client = APIClient()
+        client.force_authenticate(another_user)
+        return client
+
+    @pytest.fixture
+    def post(self, client, django_capture_on_commit_callbacks):
+        """Post like a committed request, responses are only stored once the transaction commits"""
+
+        def _post(url, data, **kwargs):
+            with django_capture_on_commit_callbacks(execute=True):
+                return client.post(url, data, format="json", **kwargs)
+
+        return _post
+
+    @pytest.fixture
+    def url(self, event):
+        return reverse("events:ticket-create-by-type", kwargs={"event_public_id": event.public_id})
+
+    @pytest.fixture
+    def data(self, ticket_type):
+        return [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}]
+
+    def test_retry_replays_the_first_response(self, post, url, data):
+        headers = {"Idempotency-Key": "purchase-1"}
+
+        first_response = post(url, data, headers=headers)
+        second_response = post(url, data, headers=headers)
+
+        assert first_response.status_code == second_response.status_code == status.HTTP_201_CREATED
+        assert second_response.json() == first_response.json()
+        assert second_response.headers["Idempotent-Replayed"] == "true"
+        assert TicketTransaction.objects.count() == 1
+        assert Ticket.objects.count() == 1
+
+    def test_requests_without_key_are_not_deduplicated(self, post, url, data):
+        post(url, data)
+        post(url, data)
+
+        assert TicketTransaction.objects.count() == 2
+
+    def test_key_is_scoped_to_the_user(self, post, url, data, user):
+        headers = {"Idempotency-Key": "purchase-1"}
+        other_client = APIClient()
+        other_client.force_authenticate(user)
+
+        post(url, data, headers=headers)
+        response = other_client.post(url, data, format="json", headers=headers)
+
+        assert "Idempotent-Replayed" not in response.headers
+        assert TicketTransaction.objects.count() == 2
+
+    def test_reusing_key_with_different_body_is_rejected(self, post, url, data, ticket_type):
+        headers = {"Idempotency-Key": "purchase-1"}
+        post(url, data, headers=headers)
+
+        response = post(url, [{"ticket_type_public_id": str(ticket_type.public_id), "count": 2}], headers=headers)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert TicketTransaction.objects.count() == 1
+
+    def test_failed_request_releases_the_key(self, post, url, data, ticket_type):
+        headers = {"Idempotency-Key": "purchase-1"}
+        TicketType.objects.filter(pk=ticket_type.pk).update(reserved=ticket_type.max_participants)
+
+        failed_response = post(url, data, headers=headers)
+        TicketType.objects.filter(pk=ticket_type.pk).update(reserved=0)
+        response = post(url, data, headers=headers)
+
+        assert failed_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == status.HTTP_201_CREATED
+        assert "Idempotent-Replayed" not in response.headers
+
+    def test_duplicate_of_request_in_progress_times_out_with_conflict(self, post, url, data, another_user, settings):
+        settings.IDEMPOTENCY_WAIT_TIMEOUT = 0.2
+        request = SimpleNamespace(method="POST", path=url, user=another_user)
+        fingerprint = hashlib.sha256(JSONRenderer().render(data)).hexdigest()
+        cache.set(_cache_key(request, "purchase-1"), {"state": IN_FLIGHT, "fingerprint": fingerprint})
+
+        response = post(url, data, headers={"Idempotency-Key": "purchase-1"})
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert TicketTransaction.objects.count() == 0
+
+    def test_duplicate_is_not_run_when_the_request_in_progress_disappears(
+        self, post, url, data, another_user, settings
+    ):
+        settings.IDEMPOTENCY_WAIT_TIMEOUT = 5
+        request = SimpleNamespace(method="POST", path=url, user=another_user)
+        fingerprint = hashlib.sha256(JSONRenderer().render(data)).hexdigest()
+        in_flight_record = {"state": IN_FLIGHT, "fingerprint": fingerprint}
+        cache.set(_cache_key(request, "purchase-1"), in_flight_record, timeout=1)
+
+        response = post(url, data, headers={"Idempotency-Key": "purchase-1"})
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert TicketTransaction.objects.count() == 0
@@ -0,0 +1,34 @@
+import logging
+
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+
+class TestQueryCountMiddleware:
+    def test_query_count_headers(self, user, settings):
+        settings.QUERY_COUNT_HEADERS = True
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.get(reverse("payment:user_transactions"))
+
+        assert response.headers["X-Query-Count"] == "1"
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+
+    def test_no_headers_by_default(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.get(reverse("payment:user_transactions"))
+
+        assert "X-Query-Count" not in response.headers
+
+    def test_requests_over_threshold_are_logged(self, user, settings, caplog):
+        settings.QUERY_COUNT_WARNING_THRESHOLD = 0
+        client = APIClient()
+        client.force_authenticate(user)
+
+        with caplog.at_level(logging.WARNING, logger="apps.core.middleware"):
+            client.get(reverse("payment:user_transactions"))
+
+        assert "GET payment:user_transactions ran 1 queries" in caplog.text
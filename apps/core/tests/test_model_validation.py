@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+import pytest
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+
+from apps.core.models import relaxed_validation
+from apps.events.models import Ticket
+from apps.payment.choices import BillStatusChoice
+from apps.payment.models import TicketTransaction
+from apps.payment.tasks import invalidate_transactions
+
+
+class TestValidateOnSave:
+    def test_new_ticket_skips_uniqueness_and_loaded_relation_queries(self, ticket_type, another_user):
+        ticket = Ticket(user=another_user, ticket_type=ticket_type, final_amount=10000, commission=0)
+
+        with CaptureQueriesContext(connection) as context:
+            ticket.save()
+
+        selects = [query["sql"] for query in context.captured_queries if query["sql"].startswith("SELECT")]
+        assert not any('"public_id" =' in sql or '"presence_key" =' in sql for sql in selects)
+        assert not any('FROM "users_user"' in sql or 'FROM "events_tickettype"' in sql for sql in selects)
+
+    def test_duplicate_server_generated_values_are_left_to_the_database(self, ticket):
+        duplicate = TicketTransaction(amount=10000, public_id=ticket.transaction.public_id)
+
+        with pytest.raises(IntegrityError):
+            duplicate.save()
+
+    def test_changed_fields_are_validated(self, ticket):
+        ticket.transaction.amount = -1
+
+        with pytest.raises(DjangoValidationError, match="amount"):
+            ticket.transaction.save()
+
+    def test_business_rules_are_validated(self, ticket, event):
+        event.start_date -= timedelta(days=30)
+        event.save()
+
+        with pytest.raises(ValidationError, match="past events"):
+            Ticket.objects.create(user=ticket.user, ticket_type=ticket.ticket_type, final_amount=10000, commission=0)
+
+
+class TestRelaxedValidation:
+    def test_skips_field_validation(self, ticket):
+        transaction = ticket.transaction
+        transaction.status = "unknown"
+
+        with relaxed_validation():
+            transaction.save()
+
+        transaction.refresh_from_db()
+        assert transaction.status == "unknown"
+
+    def test_still_runs_business_rules(self, event):
+        event.registration_opening = event.start_date + timedelta(hours=1)
+
+        with relaxed_validation(), pytest.raises(ValidationError, match="Registration opening"):
+            event.save()
+
+    def test_ends_with_the_block(self, ticket):
+        with relaxed_validation():
+            pass
+        ticket.transaction.status = "unknown"
+
+        with pytest.raises(DjangoValidationError, match="status"):
+            ticket.transaction.save()
+
+    def test_batch_cancel_of_expired_transactions(self, ticket):
+        TicketTransaction.objects.filter(pk=ticket.transaction_id).update(
+            status=BillStatusChoice.PENDING.value, created_at=ticket.created_at - timedelta(hours=1)
+        )
+
+        invalidate_transactions()
+
+        assert TicketTransaction.objects.get(pk=ticket.transaction_id).status == BillStatusChoice.CANCELLED
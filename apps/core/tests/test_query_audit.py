@@ -0,0 +1,40 @@
+import io
+from contextlib import nullcontext
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from apps.core.query_audit import audit_query_plans, explain, hot_queries
+from apps.news.models import News
+
+pytestmark = pytest.mark.django_db
+
+
+def test_hot_queries_are_discovered():
+    assert {"events.upcoming", "payment.transaction_by_authority", "verification.token"} <= hot_queries().keys()
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="matches the plans of SQLite")
+class TestExplain:
+    def test_flags_sequential_scans(self):
+        plan = explain("news.by_content", News.objects.filter(content="hamgerd"))
+
+        assert plan.sequential_scans == ("news_news",)
+
+    def test_indexed_queries_pass(self):
+        plans = {plan.name: plan for plan in audit_query_plans()}
+
+        assert plans["payment.expired_transactions"].sequential_scans == ()
+        assert "transaction_status_created_idx" in plans["payment.expired_transactions"].plan
+        assert plans["verification.expired_tokens"].sequential_scans == ()
+
+
+def test_command_reports_every_hot_query():
+    stdout = io.StringIO()
+
+    # iexact lookups cannot use the upper cased username index on SQLite
+    with pytest.raises(CommandError) if connection.vendor == "sqlite" else nullcontext():
+        call_command("audit_query_plans", stdout=stdout)
+
+    assert all(f"{name}:" in stdout.getvalue() for name in hot_queries())
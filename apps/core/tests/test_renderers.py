@@ -0,0 +1,115 @@
+import io
+import json
+import uuid
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient
+
+from apps.core.parsers import ORJSONParser
+from apps.core.renderers import ORJSONRenderer
+from apps.users.models import User
+
+DOCUMENTS = [
+    {"title": "رویداد", "quote": 'say "hi"\n\t\\ /', "separators": "a\u2028b\u2029c", "control": "\x00\x1f\x7f"},
+    {"numbers": [0, -1, 2**63 - 1, 1.5, 0.1, 35.6892], "flags": [True, False, None], "nested": {"empty": []}},
+    {
+        "utc": datetime(2025, 5, 1, 12, tzinfo=UTC),
+        "tehran": datetime(2025, 5, 1, 12, 30, tzinfo=ZoneInfo("Asia/Tehran")),
+    },
+    {"naive": datetime(2025, 5, 1, 12, 0, 0, 1500), "day": date(2025, 5, 1), "time": time(8, 15)},
+    {"price": Decimal("1500000"), "amount": Decimal("12.50"), "id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+    {"lazy": gettext_lazy("Not found."), "error": ErrorDetail("invalid", code="invalid"), 1: "integer key"},
+    {"big": 2**64, "set": {1}},
+]
+
+
+class TestORJSONRenderer:
+    @pytest.mark.parametrize("data", DOCUMENTS)
+    def test_renders_the_bytes_of_the_json_renderer(self, data):
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_escapes_line_and_paragraph_separators(self):
+        assert ORJSONRenderer().render(["\u2028\u2029"]) == b'["\\u2028\\u2029"]'
+
+    def test_indented_output_is_left_to_the_json_renderer(self):
+        rendered = ORJSONRenderer().render({"a": [1]}, "application/json; indent=2")
+
+        assert rendered == JSONRenderer().render({"a": [1]}, "application/json; indent=2")
+
+    def test_api_responses_are_unchanged(self, event, ticket_type):
+        client = APIClient()
+        for url in [
+            reverse("events:event-list"),
+            reverse("events:event-detail", kwargs={"public_id": event.public_id}),
+            reverse("events:speaker-list", kwargs={"event_public_id": event.public_id}),
+        ]:
+            response = client.get(url)
+
+            assert isinstance(response.accepted_renderer, ORJSONRenderer)
+            assert response.content == JSONRenderer().render(response.data)
+
+
+class TestORJSONParser:
+    def parse(self, parser, body: bytes):
+        return parser.parse(io.BytesIO(body), "application/json", {"encoding": "utf-8"})
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            '{"title": "رویداد", "count": 2, "price": 1.5, "tags": [null, true]}'.encode(),
+            b'{"big": 123456789012345678901234567890}',
+            b'{"surrogate": "\\ud800"}',
+        ],
+    )
+    def test_parses_like_the_json_parser(self, body):
+        assert self.parse(ORJSONParser(), body) == self.parse(JSONParser(), body)
+
+    @pytest.mark.parametrize("body", [b"{", b'{"a": NaN}', b"\xff"])
+    def test_rejects_like_the_json_parser(self, body):
+        with pytest.raises(ParseError) as expected:
+            self.parse(JSONParser(), body)
+        with pytest.raises(ParseError) as error:
+            self.parse(ORJSONParser(), body)
+
+        assert error.value.detail == expected.value.detail
+
+    def test_other_encodings_are_left_to_the_json_parser(self):
+        body = json.dumps({"title": "é"}).encode("utf-16")
+
+        data = ORJSONParser().parse(io.BytesIO(body), "application/json", {"encoding": "utf-16"})
+
+        assert data == {"title": "é"}
+
+    def test_request_bodies(self, db):
+        User.objects.create_user(email="sara@example.com", password="correct horse")
+
+        response = APIClient().post(
+            reverse("users:token_obtain_pair"),
+            {"email": "sara@example.com", "password": "correct horse"},
+            format="json",
+        )
+
+        assert "access" in response.data
+
+
+def test_registered_by_default():
+    assert api_settings.DEFAULT_RENDERER_CLASSES[0] is ORJSONRenderer
+    assert api_settings.DEFAULT_PARSER_CLASSES[0] is ORJSONParser
+
+
+def test_benchmark_command(event, capsys):
+    call_command("benchmark_json_rendering", rows=10, repeat=1)
+
+    output = capsys.readouterr().out
+    assert "events: 1 rows" in output
+    assert "tickets: 0 rows" in output
@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, using: str = DEFAULT_DB_ALIAS):
+    """Fail when the block runs more than ``max_queries`` queries, listing the queries it ran"""
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+
+    if len(context) > max_queries:
+        queries = "\n".join(f"{index}. {query['sql']}" for index, query in enumerate(context.captured_queries, 1))
+        pytest.fail(f"{len(context)} queries executed, {max_queries} allowed:\n{queries}")
+
+
+def assert_query_budget(request, max_queries: int, add_rows, using: str = DEFAULT_DB_ALIAS):
+    """
+    Check that ``request()`` stays within ``max_queries`` regardless of how many rows it returns.
+
+    The request runs once as is and once more after ``add_rows()`` put more rows on the page,
+    both runs have to fit into the same budget, so N+1 queries fail the check.
+    """
+    with assert_max_queries(max_queries, using):
+        request()
+    add_rows()
+    with assert_max_queries(max_queries, using):
+        request()
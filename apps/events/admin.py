@@ -1,10 +1,13 @@
 # Register your models here.
 from django.contrib import admin
 
-from .models import Event, EventCategory, Speaker, Ticket, TicketType
+from .models import Event, EventCategory, EventListing, FeaturedEvent, Speaker, Ticket, TicketOrder, TicketType
 
 admin.site.register(Event)
 admin.site.register(EventCategory)
 admin.site.register(Speaker)
 admin.site.register(Ticket)
 admin.site.register(TicketType)
+admin.site.register(TicketOrder)
+admin.site.register(EventListing)
+admin.site.register(FeaturedEvent)
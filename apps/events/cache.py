@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.response_cache import bump_versions
+
+from .models import Event
+
+# bumped on any change of the data event list responses render
+EVENTS_VERSION = "events"
+CATEGORIES_VERSION = "event-categories"
+# bumped when the featured ranking changed, see apps.events.services.featured
+FEATURED_VERSION = "featured-events"
+AVAILABILITY_KEY_PREFIX = "event-availability"
+
+
+def event_version(public_id) -> str:
+    return f"event:{public_id}"
+
+
+def bump_event_versions(public_ids):
+    """Invalidate the cached lists and the cached details of the given events"""
+    bump_versions(EVENTS_VERSION, *(event_version(public_id) for public_id in public_ids))
+
+
+def _event_items(data) -> list[dict]:
+    """Serialized events of a list, paginated list or detail response which render ``remaining_tickets``"""
+    if isinstance(data, list):
+        events = data
+    elif "results" in data:
+        events = data["results"]
+    else:
+        events = [data]
+    # sparse fieldsets may leave it out, public_id is always rendered
+    return [event for event in events if "remaining_tickets" in event]
+
+
+def refresh_availability(data):
+    """
+    Replace ``remaining_tickets`` of cached event responses with values at most
+    ``RESPONSE_CACHE_AVAILABILITY_TIMEOUT`` seconds old, ticket sales do not bump response versions.
+    """
+    events = _event_items(data)
+    keys = {f"{AVAILABILITY_KEY_PREFIX}:{event['public_id']}": event["public_id"] for event in events}
+    remaining = {keys[key]: value for key, value in cache.get_many(keys).items()}
+
+    if missing := [public_id for public_id in keys.values() if public_id not in remaining]:
+        fresh = {
+            str(event.public_id): event.remaining_tickets
+            for event in Event.objects.filter(public_id__in=missing).only(
+                "public_id", "capacity", "tickets_sold", "tickets_reserved"
+            )
+        }
+        cache.set_many(
+            {f"{AVAILABILITY_KEY_PREFIX}:{public_id}": value for public_id, value in fresh.items()},
+            timeout=settings.RESPONSE_CACHE_AVAILABILITY_TIMEOUT,
+        )
+        remaining.update(fresh)
+
+    for event in events:
+        if event["public_id"] in remaining:
+            event["remaining_tickets"] = remaining[event["public_id"]]
+    return data
+
+
+def availability_state(data) -> list[tuple]:
+    """Events of a response with their ``remaining_tickets``, the fields ``refresh_availability`` may change"""
+    return [(event["public_id"], event["remaining_tickets"]) for event in _event_items(data)]
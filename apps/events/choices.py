@@ -19,3 +19,9 @@ class TicketStatusChoice(TextChoices):
 class CommissionPayerChoice(TextChoices):
     BUYER = "b", "buyer"
     SELLER = "s", "seller"
+
+
+class TicketOrderStatusChoice(TextChoices):
+    QUEUED = "q", "queued"
+    COMPLETED = "c", "completed"
+    FAILED = "f", "failed"
@@ -1,12 +1,20 @@
 from django_filters import rest_framework as filters
 
+from apps.core.filters import GeoProximityFilterSet
+
 from .models import Event
 
 
-class EventFilter(filters.FilterSet):
+class EventFilter(GeoProximityFilterSet):
+    q = filters.CharFilter(
+        method="search", label="Search the title, description, organization and categories, best matches first"
+    )
     title = filters.CharFilter(lookup_expr="icontains")
     organization_username = filters.CharFilter(field_name="organization__username", lookup_expr="iexact")
 
     class Meta:
         model = Event
         fields = ["title"]
+
+    def search(self, queryset, name, value):
+        return queryset.search(value)
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.utils import timezone
+
+from apps.core.query_audit import hot_query
+
+from .choices import TicketStatusChoice
+from .models import Event, Ticket
+
+
+@hot_query("events.upcoming")
+def upcoming_events():
+    return Event.objects.filter(is_active=True, start_date__gte=timezone.now())
+
+
+@hot_query("events.featured")
+def featured_events():
+    return Event.get_featured_ranking()[: settings.FEATURED_EVENTS_COUNT]
+
+
+@hot_query("events.ended")
+def ended_events():
+    return Event.objects.filter(end_date__lt=timezone.now())
+
+
+@hot_query("events.tickets_of_ticket_type")
+def tickets_of_ticket_type():
+    return Ticket.objects.filter(ticket_type_id=0, status=TicketStatusChoice.PENDING.value)
+
+
+@hot_query("events.user_tickets")
+def user_tickets():
+    return Ticket.objects.filter(user_id=0).order_by("-created_at", "-id")[:24]
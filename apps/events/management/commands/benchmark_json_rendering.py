@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.events.services.benchmark import benchmark_json_rendering
+
+
+class Command(BaseCommand):
+    help = "Compare encoding event and ticket list responses with DRF's JSONRenderer and with orjson"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Number of the latest rows encoded")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per renderer, the best one counts")
+
+    def handle(self, *args, **options):
+        benchmarks = benchmark_json_rendering(rows=options["rows"], repeat=options["repeat"])
+        if not any(benchmark.rows for benchmark in benchmarks):
+            raise CommandError("There are no events to render, e.g. keep the data of stress_ticket_sales.")
+
+        for benchmark in benchmarks:
+            self.stdout.write(benchmark.summary())
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.events.services.featured import rank_featured_events
+
+
+class Command(BaseCommand):
+    help = "Rank the featured events now instead of waiting for the periodic rank_featured_events task"
+
+    def handle(self, *args, **options):
+        ranking = rank_featured_events()
+        self.stdout.write(self.style.SUCCESS(f"Ranked {len(ranking)} featured event(s)."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.events.services.listing import rebuild_event_listings
+
+
+class Command(BaseCommand):
+    help = "Rebuild the event listing read model from the events, to repair listings that drifted"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Number of events rebuilt per query")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_event_listings(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} event listing(s)."))
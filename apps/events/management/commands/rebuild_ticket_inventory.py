@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.events.models import TicketType
+from apps.events.services.inventory import rebuild_inventory_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild the sold/reserved inventory counters of ticket types from their ticket rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--event", help="Only rebuild the ticket types of the event with this public id")
+
+    def handle(self, *args, **options):
+        ticket_types = TicketType.objects.all()
+        if options["event"]:
+            ticket_types = ticket_types.filter(event__public_id=options["event"])
+
+        drifted = rebuild_inventory_counters(ticket_types)
+        for ticket_type in drifted:
+            self.stdout.write(f"{ticket_type.public_id}: sold={ticket_type.sold} reserved={ticket_type.reserved}")
+        self.stdout.write(self.style.SUCCESS(f"Repaired {len(drifted)} ticket type(s)."))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.events.models import TicketType
+from apps.events.services.inventory import repair_ticket_numbers
+
+
+class Command(BaseCommand):
+    help = "Renumber duplicated ticket numbers and resync the ticket number sequence of ticket types"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--event", help="Only repair the ticket types of the event with this public id")
+
+    def handle(self, *args, **options):
+        ticket_types = TicketType.objects.all()
+        if options["event"]:
+            ticket_types = ticket_types.filter(event__public_id=options["event"])
+
+        renumbered = repair_ticket_numbers(ticket_types)
+        self.stdout.write(self.style.SUCCESS(f"Renumbered {renumbered} ticket(s)."))
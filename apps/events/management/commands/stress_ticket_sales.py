@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.events.services.stress import run_ticket_stress, setup_stress_event, teardown_stress_data
+
+
+class Command(BaseCommand):
+    help = "Let many concurrent buyers purchase the same ticket types and report contention and overselling"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--buyers", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=50, help="Number of concurrent threads")
+        parser.add_argument("--ticket-types", type=int, default=1, help="Ticket types every buyer purchases")
+        parser.add_argument("--capacity", type=int, default=100, help="Seats per ticket type")
+        parser.add_argument("--tickets-per-buyer", type=int, default=1, help="Tickets per buyer and ticket type")
+        parser.add_argument("--keep", action="store_true", help="Keep the generated event, buyers and tickets")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("The stress harness needs PostgreSQL, other databases serialize writers.")
+
+        event, ticket_types, buyers = setup_stress_event(
+            buyers=options["buyers"], ticket_types=options["ticket_types"], capacity=options["capacity"]
+        )
+        try:
+            report = run_ticket_stress(
+                event, ticket_types, buyers, tickets_per_buyer=options["tickets_per_buyer"], workers=options["workers"]
+            )
+        finally:
+            if not options["keep"]:
+                teardown_stress_data()
+
+        for line in report.summary():
+            self.stdout.write(line)
+        if report.oversold or report.drifted_ticket_types:
+            raise CommandError("Tickets were oversold or inventory counters drifted.")
+        self.stdout.write(self.style.SUCCESS("No tickets were oversold."))
@@ -0,0 +1,240 @@
+from collections import Counter, defaultdict
+from functools import reduce
+from operator import and_
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections, models, transaction
+from django.db.models import Case, Exists, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+from .choices import TicketStatusChoice
+
+# Ticket statuses that hold a seat, mapped to the TicketType counter tracking them
+INVENTORY_COUNTERS = {
+    TicketStatusChoice.PENDING.value: "reserved",
+    TicketStatusChoice.SUCCESS.value: "sold",
+}
+
+# TicketType counters mapped to the Event columns holding their totals
+EVENT_COUNTERS = {
+    "sold": "tickets_sold",
+    "reserved": "tickets_reserved",
+}
+
+
+def _moved(field: str, delta: int):
+    """``field`` moved by ``delta``, never below 0"""
+    return F(field) + delta if delta >= 0 else Greatest(F(field) + delta, 0)
+
+
+# event texts are mostly Persian, which PostgreSQL has no stemmer for
+SEARCH_CONFIG = "simple"
+
+
+def listing_fields(event_model, prefix: str = "") -> list[str]:
+    """Columns of ``EventQuerySet.with_listing``, of the events at ``prefix`` when loaded through a relation"""
+    listing_model = event_model._meta.get_field("listing").related_model
+    fields = ["public_id", "start_date", *(f"listing__{field.name}" for field in listing_model._meta.concrete_fields)]
+    return [f"{prefix}{field}" for field in fields]
+
+
+class EventQuerySet(models.QuerySet):
+    def _capacity_expressions(self) -> dict:
+        """
+        Capacity and counter totals of each event computed from its ticket types.
+
+        Capacity is None as soon as one ticket type is unlimited, and 0 for an event without ticket types.
+        """
+        ticket_types = self.model._meta.get_field("ticket_types").related_model.objects.filter(event=OuterRef("pk"))
+
+        def total(field):
+            totals = ticket_types.order_by().values("event").annotate(total=Sum(field)).values("total")
+            return Coalesce(Subquery(totals), 0)
+
+        return {
+            "capacity": Case(
+                When(Exists(ticket_types.filter(max_participants__isnull=True)), then=Value(None)),
+                default=total("max_participants"),
+                output_field=models.PositiveIntegerField(null=True),
+            ),
+            "tickets_sold": total("sold"),
+            "tickets_reserved": total("reserved"),
+        }
+
+    def refresh_capacity(self) -> int:
+        """Recompute the stored capacity and counter totals of the selected events in a single UPDATE"""
+        return self.update(**self._capacity_expressions())
+
+    def _search_vector_expression(self):
+        """Weighted search document of each event: title A, organization name and category titles B, description C"""
+        organization_model = self.model._meta.get_field("organization").related_model
+        category_model = self.model._meta.get_field("categories").related_model
+        organization_name = organization_model.objects.filter(pk=OuterRef("organization_id")).values("name")
+        category_titles = (
+            category_model.objects.filter(events=OuterRef("pk"))
+            .order_by()
+            .values("events")
+            .annotate(titles=StringAgg("title", " "))
+            .values("titles")
+        )
+        return (
+            SearchVector("title", weight="A", config=SEARCH_CONFIG)
+            + SearchVector(Subquery(organization_name), Subquery(category_titles), weight="B", config=SEARCH_CONFIG)
+            + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+        )
+
+    def update_search_vector(self) -> int:
+        """Recompute ``search_vector`` of the selected events in a single UPDATE, only PostgreSQL has one"""
+        if connections[self.db].vendor != "postgresql":
+            return 0
+        return self.update(search_vector=self._search_vector_expression())
+
+    def search(self, query: str):
+        """
+        Events matching ``query``, best matches first.
+
+        PostgreSQL matches the query against the GIN indexed ``search_vector`` and ranks by its weights,
+        other databases fall back to unranked LIKE lookups where every word has to match one of the texts.
+        """
+        if connections[self.db].vendor == "postgresql":
+            search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+            return (
+                self.filter(search_vector=search_query)
+                .annotate(search_rank=SearchRank(F("search_vector"), search_query))
+                .order_by("-search_rank", "-start_date", "-id")
+            )
+
+        matches = reduce(
+            and_,
+            (
+                Q(title__icontains=word)
+                | Q(description__icontains=word)
+                | Q(organization__name__icontains=word)
+                | Q(categories__title__icontains=word)
+                for word in query.split()
+            ),
+            Q(),
+        )
+        return self.filter(pk__in=self.model.objects.filter(matches).values("pk")).order_by("-start_date", "-id")
+
+    def with_listing(self):
+        """Only the sort keys of the events and their listing, which is all the listing endpoints read"""
+        return self.select_related("listing").only(*listing_fields(self.model))
+
+
+class TicketTypeManager(models.Manager):
+    def reserve(self, ticket_type_id, count: int, status=TicketStatusChoice.PENDING.value) -> bool:
+        """Atomically claim ``count`` seats on a ticket type, returns False when there is not enough capacity left"""
+        return self.reserve_many({ticket_type_id: count}, status) is None
+
+    def reserve_many(self, counts: dict, status=TicketStatusChoice.PENDING.value):
+        """
+        Atomically claim seats on ticket types of one event, ``counts`` maps ticket type ids to seat counts.
+
+        The capacity check and the increment happen in a single conditional UPDATE per ticket type,
+        so concurrent buyers can never push ``sold + reserved`` over ``max_participants``. Ticket types are
+        updated in primary key order, so concurrent orders take their row locks in the same order and cannot
+        deadlock, and the totals of the event are moved once after all of them. Returns the id of the first
+        ticket type without enough capacity left, None when every seat was claimed. Callers roll back the
+        claimed seats of a failed reservation with their transaction.
+        """
+        counter = INVENTORY_COUNTERS[status]
+        for ticket_type_id, count in sorted(counts.items()):
+            has_capacity = Q(max_participants__isnull=True) | Q(max_participants__gte=F("sold") + F("reserved") + count)
+            if self.filter(has_capacity, pk=ticket_type_id).update(**{counter: F(counter) + count}) != 1:
+                return ticket_type_id
+
+        event_counter = EVENT_COUNTERS[counter]
+        events = self.filter(pk__in=counts).values("event")
+        self._update_event_totals(events, **{event_counter: _moved(event_counter, sum(counts.values()))})
+        return None
+
+    def _update_event_totals(self, events, **updates):
+        """Apply ``updates`` to the totals of ``events`` and to their listings, which mirror them"""
+        event_model = self.model._meta.get_field("event").related_model
+        listing_model = event_model._meta.get_field("listing").related_model
+        event_model.objects.filter(pk__in=events).update(**updates)
+        listing_model.objects.filter(event__in=events).update(**updates)
+
+    def allocate_ticket_numbers(self, ticket_type_id, count: int = 1) -> range:
+        """
+        Hand out a block of ``count`` consecutive ticket numbers of a ticket type.
+
+        ``next_number`` is bumped with a single ``UPDATE ... RETURNING``, which takes the row
+        lock, so concurrent buyers never get the same number.
+        """
+        connection = connections[self.db]
+        quote_name = connection.ops.quote_name
+        table = quote_name(self.model._meta.db_table)
+        pk_column = quote_name(self.model._meta.pk.column)
+        column = quote_name(self.model._meta.get_field("next_number").column)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET {column} = {column} + %s WHERE {pk_column} = %s RETURNING {column}",
+                [count, ticket_type_id],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            raise self.model.DoesNotExist(f"Ticket type {ticket_type_id} does not exist.")
+
+        next_number = row[0]
+        return range(next_number - count, next_number)
+
+    def transfer(self, ticket_type_id, count: int, from_status, to_status):
+        """Move ``count`` seats between counters after tickets changed from one status to another"""
+        self.transfer_many({(ticket_type_id, from_status): count}, to_status)
+
+    def transfer_many(self, transitions: dict, to_status):
+        """
+        Move seats between counters after tickets changed to ``to_status``, ``transitions`` counts
+        the changed tickets per ``(ticket_type_id, from_status)``.
+
+        Like ``reserve_many`` the ticket types are updated in primary key order and the totals
+        of each event once afterwards, so the lock order matches the one of purchases.
+        """
+        to_counter = INVENTORY_COUNTERS.get(to_status)
+        event_ids = dict(self.filter(pk__in={pk for pk, _ in transitions}).values_list("pk", "event_id"))
+        event_deltas = defaultdict(Counter)
+        for (ticket_type_id, from_status), count in sorted(transitions.items()):
+            from_counter = INVENTORY_COUNTERS.get(from_status)
+            if from_counter == to_counter:
+                continue
+            deltas = Counter()
+            if from_counter:
+                deltas[from_counter] -= count
+            if to_counter:
+                deltas[to_counter] += count
+            self.filter(pk=ticket_type_id).update(
+                **{counter: _moved(counter, delta) for counter, delta in deltas.items()}
+            )
+            event_deltas[event_ids[ticket_type_id]].update(
+                {EVENT_COUNTERS[counter]: delta for counter, delta in deltas.items()}
+            )
+
+        for event_id, deltas in sorted(event_deltas.items()):
+            updates = {counter: _moved(counter, delta) for counter, delta in deltas.items() if delta}
+            if updates:
+                self._update_event_totals([event_id], **updates)
+
+
+class TicketQuerySet(models.QuerySet):
+    def set_status(self, status) -> int:
+        """
+        Bulk-change the status of the selected tickets, keeping the inventory counters
+        of their ticket types in sync. Returns the number of changed tickets.
+        """
+        ticket_type_model = self.model._meta.get_field("ticket_type").related_model
+
+        with transaction.atomic():
+            rows = list(self.exclude(status=status).select_for_update().values_list("pk", "ticket_type_id", "status"))
+            if not rows:
+                return 0
+
+            self.model.objects.filter(pk__in=[pk for pk, _, _ in rows]).update(status=status)
+
+            transitions = Counter((ticket_type_id, old_status) for _, ticket_type_id, old_status in rows)
+            ticket_type_model.objects.transfer_many(transitions, status)
+
+        return len(rows)
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:32
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_inventory_counters(apps, schema_editor):
+    TicketType = apps.get_model("events", "TicketType")
+    ticket_types = TicketType.objects.annotate(
+        sold_count=Count("tickets", filter=Q(tickets__status="s")),
+        reserved_count=Count("tickets", filter=Q(tickets__status="p")),
+    )
+    for ticket_type in ticket_types:
+        ticket_type.sold = ticket_type.sold_count
+        ticket_type.reserved = ticket_type.reserved_count
+    TicketType.objects.bulk_update(ticket_types, ["sold", "reserved"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0007_event_commission_payer_ticket_commission_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tickettype",
+            name="reserved",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tickettype",
+            name="sold",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_inventory_counters, migrations.RunPython.noop),
+    ]
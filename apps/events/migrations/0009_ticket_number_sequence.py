@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:34
+
+from django.db import migrations, models
+
+
+def repair_ticket_numbers(apps, schema_editor):
+    """Renumber duplicated ticket numbers so the unique constraint of the next migration can be created"""
+    TicketType = apps.get_model("events", "TicketType")
+    Ticket = apps.get_model("events", "Ticket")
+
+    for ticket_type in TicketType.objects.only("pk"):
+        seen_numbers = set()
+        duplicates = []
+        for ticket in Ticket.objects.filter(ticket_type=ticket_type).order_by("created_at", "pk"):
+            if ticket.ticket_number in seen_numbers:
+                duplicates.append(ticket)
+            else:
+                seen_numbers.add(ticket.ticket_number)
+
+        next_number = max(seen_numbers, default=0) + 1
+        for ticket in duplicates:
+            ticket.ticket_number = next_number
+            next_number += 1
+
+        Ticket.objects.bulk_update(duplicates, ["ticket_number"], batch_size=500)
+        TicketType.objects.filter(pk=ticket_type.pk).update(next_number=next_number)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0008_tickettype_inventory_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tickettype",
+            name="next_number",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="ticket",
+            name="ticket_number",
+            field=models.PositiveIntegerField(editable=False),
+        ),
+        migrations.RunPython(repair_ticket_numbers, migrations.RunPython.noop),
+    ]
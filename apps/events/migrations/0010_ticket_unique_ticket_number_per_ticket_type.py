@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0009_ticket_number_sequence"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="ticket",
+            constraint=models.UniqueConstraint(
+                fields=("ticket_type", "ticket_number"), name="unique_ticket_number_per_ticket_type"
+            ),
+        ),
+    ]
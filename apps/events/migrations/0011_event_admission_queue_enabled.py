@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0010_ticket_unique_ticket_number_per_ticket_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="admission_queue_enabled",
+            field=models.BooleanField(default=False),
+        ),
+    ]
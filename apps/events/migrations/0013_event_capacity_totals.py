@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:48
+
+from django.db import migrations, models
+
+
+def backfill_capacity_totals(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    TicketType = apps.get_model("events", "TicketType")
+
+    events = []
+    for event in Event.objects.only("pk"):
+        ticket_types = list(TicketType.objects.filter(event=event).values("max_participants", "sold", "reserved"))
+        limits = [ticket_type["max_participants"] for ticket_type in ticket_types]
+        event.capacity = None if None in limits else sum(limits)
+        event.tickets_sold = sum(ticket_type["sold"] for ticket_type in ticket_types)
+        event.tickets_reserved = sum(ticket_type["reserved"] for ticket_type in ticket_types)
+        events.append(event)
+
+    Event.objects.bulk_update(events, ["capacity", "tickets_sold", "tickets_reserved"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0012_ticketorder"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="capacity",
+            field=models.PositiveIntegerField(default=0, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="tickets_reserved",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="tickets_sold",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_capacity_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0013_event_capacity_totals"),
+        ("organizations", "0005_organization_phone"),
+        ("payment", "0003_keyset_pagination_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["-start_date", "-id"], name="event_start_date_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(fields=["user", "-created_at", "-id"], name="ticket_user_created_at_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(fields=["-created_at", "-id"], name="ticket_created_at_id_idx"),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:10
+
+import django.contrib.postgres.search
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+SEARCH_INDEX_NAME = "event_search_vector_idx"
+
+
+def create_search_index(apps, schema_editor):
+    # GIN indexes only exist on PostgreSQL, the model does not declare this one so other databases still migrate
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Event = apps.get_model("events", "Event")
+    schema_editor.execute(
+        f"CREATE INDEX {schema_editor.quote_name(SEARCH_INDEX_NAME)} "
+        f"ON {schema_editor.quote_name(Event._meta.db_table)} USING gin (search_vector)"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(SEARCH_INDEX_NAME)}")
+
+
+def backfill_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Event = apps.get_model("events", "Event")
+    Organization = apps.get_model("organizations", "Organization")
+    EventCategory = apps.get_model("events", "EventCategory")
+
+    organization_name = Organization.objects.filter(pk=OuterRef("organization_id")).values("name")
+    category_titles = (
+        EventCategory.objects.filter(events=OuterRef("pk"))
+        .order_by()
+        .values("events")
+        .annotate(titles=StringAgg("title", " "))
+        .values("titles")
+    )
+    Event.objects.update(
+        search_vector=SearchVector("title", weight="A", config="simple")
+        + SearchVector(Subquery(organization_name), Subquery(category_titles), weight="B", config="simple")
+        + SearchVector("description", weight="C", config="simple")
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0014_keyset_pagination_indexes"),
+        ("organizations", "0006_organization_username_ci_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
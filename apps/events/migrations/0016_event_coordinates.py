@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:13
+
+from django.db import migrations, models
+
+
+def backfill_coordinates(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+
+    rows = []
+    for row in Event.objects.filter(geo_location__isnull=False).only("pk", "geo_location").iterator():
+        row.latitude = row.geo_location.get("latitude")
+        row.longitude = row.geo_location.get("longitude")
+        rows.append(row)
+
+    Event.objects.bulk_update(rows, ["latitude", "longitude"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0015_event_search_vector"),
+        ("organizations", "0007_organization_coordinates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="latitude",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="longitude",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["latitude", "longitude"], name="event_coordinates_idx"),
+        ),
+        migrations.RunPython(backfill_coordinates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_listings(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    EventListing = apps.get_model("events", "EventListing")
+
+    listings = []
+    for event in Event.objects.select_related("organization").prefetch_related("ticket_types", "categories"):
+        prices = [ticket_type.price for ticket_type in event.ticket_types.all()]
+        listings.append(
+            EventListing(
+                event=event,
+                public_id=event.public_id,
+                title=event.title,
+                image=event.image.name if event.image else None,
+                start_date=event.start_date,
+                end_date=event.end_date,
+                location=event.location,
+                organization_name=event.organization.name,
+                organization_username=event.organization.username,
+                organization_logo=event.organization.logo.name,
+                min_price=min(prices, default=None),
+                max_price=max(prices, default=None),
+                category_titles=[category.title for category in event.categories.all()],
+                capacity=event.capacity,
+                tickets_sold=event.tickets_sold,
+                tickets_reserved=event.tickets_reserved,
+            )
+        )
+
+    EventListing.objects.bulk_create(listings, batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0016_event_coordinates"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventListing",
+            fields=[
+                (
+                    "event",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="listing",
+                        serialize=False,
+                        to="events.event",
+                    ),
+                ),
+                ("public_id", models.UUIDField(editable=False, unique=True)),
+                ("title", models.CharField(max_length=255)),
+                ("image", models.ImageField(blank=True, null=True, upload_to="events/images/")),
+                ("start_date", models.DateTimeField()),
+                ("end_date", models.DateTimeField()),
+                ("location", models.CharField(blank=True, max_length=255)),
+                ("organization_name", models.CharField(max_length=255)),
+                ("organization_username", models.CharField(max_length=150)),
+                ("organization_logo", models.ImageField(blank=True, upload_to="organizations/images/")),
+                ("min_price", models.DecimalField(decimal_places=0, max_digits=12, null=True)),
+                ("max_price", models.DecimalField(decimal_places=0, max_digits=12, null=True)),
+                ("category_titles", models.JSONField(default=list)),
+                ("capacity", models.PositiveIntegerField(default=0, null=True)),
+                ("tickets_sold", models.PositiveIntegerField(default=0)),
+                ("tickets_reserved", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Event Listing",
+                "verbose_name_plural": "Event Listings",
+            },
+        ),
+        migrations.RunPython(backfill_listings, migrations.RunPython.noop),
+    ]
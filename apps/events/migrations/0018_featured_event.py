@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0017_event_listing"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FeaturedEvent",
+            fields=[
+                (
+                    "event",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="featured_rank",
+                        serialize=False,
+                        to="events.event",
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField(unique=True)),
+                ("score", models.FloatField()),
+                ("computed_at", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "Featured Event",
+                "verbose_name_plural": "Featured Events",
+                "ordering": ["rank"],
+            },
+        ),
+    ]
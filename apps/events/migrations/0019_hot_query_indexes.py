@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # indexes are built concurrently on PostgreSQL, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("events", "0018_featured_event"),
+        ("organizations", "0007_organization_coordinates"),
+        ("payment", "0004_hot_query_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="event",
+            index=models.Index(fields=["is_active", "start_date"], name="event_active_start_date_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="event",
+            index=models.Index(fields=["end_date"], name="event_end_date_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="ticket",
+            index=models.Index(fields=["ticket_type", "status"], name="ticket_type_status_idx"),
+        ),
+    ]
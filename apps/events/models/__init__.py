@@ -1,3 +1,4 @@
 from .event import Event, EventCategory
+from .listing import EventListing, FeaturedEvent
 from .speaker import Speaker
-from .ticket import Ticket, TicketStatusChoice, TicketType
+from .ticket import Ticket, TicketOrder, TicketStatusChoice, TicketType
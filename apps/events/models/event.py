@@ -1,12 +1,16 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from rest_framework.exceptions import NotAcceptable, ValidationError
 
+from apps.core.geo import sync_coordinates
 from apps.core.models import BaseModel
 from apps.core.validators import geo_location_validator
 from apps.organizations.models import Organization
 
 from ..choices import CommissionPayerChoice, EventStatusChoice
+from ..managers import EventQuerySet, listing_fields
 
 
 class EventCategory(BaseModel):
@@ -33,6 +37,9 @@ class Event(BaseModel):
     end_date = models.DateTimeField()
     location = models.CharField(blank=True, max_length=255)  # add blank=True
     geo_location = models.JSONField(null=True, blank=True, validators=[geo_location_validator])
+    # extracted from geo_location on save for proximity lookups, see apps.core.geo
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     is_active = models.BooleanField(default=True)
     commission_payer = models.CharField(
         max_length=3, choices=CommissionPayerChoice.choices, default=CommissionPayerChoice.SELLER
@@ -42,13 +49,35 @@ class Event(BaseModel):
     status = models.CharField(max_length=20, choices=EventStatusChoice.choices, default=EventStatusChoice.DRAFT.value)
     registration_opening = models.DateTimeField(blank=True, null=True)
     registration_deadline = models.DateTimeField(blank=True, null=True)
+    # buyers have to pass the admission queue before they can create tickets
+    admission_queue_enabled = models.BooleanField(default=False)
+    # totals over the ticket types, capacity is None when a ticket type is unlimited,
+    # kept in sync by TicketTypeManager and the ticket type signals, see EventQuerySet.refresh_capacity
+    capacity = models.PositiveIntegerField(default=0, null=True, editable=False)
+    tickets_sold = models.PositiveIntegerField(default=0, editable=False)
+    tickets_reserved = models.PositiveIntegerField(default=0, editable=False)
+    # weighted document of EventQuerySet.search, GIN indexed and kept up to date by signals on PostgreSQL only
+    search_vector = SearchVectorField(null=True, editable=False)
     # TODO: AB external_url for redirecting to user landing page
     # TODO: AE add faq field to get and return json
 
+    objects = EventQuerySet.as_manager()
+
+    COUNTER_FIELDS = ("capacity", "tickets_sold", "tickets_reserved")
+
     class Meta:
         ordering = ["-start_date"]
         verbose_name = "Event"
         verbose_name_plural = "Events"
+        indexes = [
+            # keyset pagination of the event list, see EventPagination
+            models.Index(fields=["-start_date", "-id"], name="event_start_date_id_idx"),
+            models.Index(fields=["latitude", "longitude"], name="event_coordinates_idx"),
+            # upcoming active events, see get_featured_events and the featured ranking
+            models.Index(fields=["is_active", "start_date"], name="event_active_start_date_idx"),
+            # events ending up, see the end_up_events_on_end_date task
+            models.Index(fields=["end_date"], name="event_end_date_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.organization.name}"
@@ -64,13 +93,39 @@ class Event(BaseModel):
         return cls.objects.filter(organization_id=organization_id, is_active=True)
 
     @classmethod
-    def get_featured_events(cls):
-        """Return all featured events"""
-        return cls.objects.filter(is_active=True, start_date__gte=timezone.now())[:10]
+    def get_featured_ranking(cls):
+        """Featured ranking of the upcoming active events with the events and listings the featured endpoint reads"""
+        featured_model = cls._meta.get_field("featured_rank").related_model
+        return (
+            featured_model.objects.filter(event__is_active=True, event__start_date__gte=timezone.now())
+            .select_related("event__listing")
+            .only("rank", *listing_fields(cls, prefix="event__"))
+            .order_by("rank")
+        )
+
+    @classmethod
+    def get_featured_events(cls) -> list["Event"]:
+        """
+        Upcoming active events in the order of the featured ranking, see apps.events.services.featured,
+        loaded like ``EventQuerySet.with_listing``. While fewer than ``FEATURED_EVENTS_COUNT`` events are
+        ranked, e.g. before the first ranking, unranked upcoming events fill the remaining places latest first.
+        """
+        count = settings.FEATURED_EVENTS_COUNT
+        events = [featured.event for featured in cls.get_featured_ranking()[:count]]
+        if len(events) < count:
+            unranked = cls.objects.filter(is_active=True, start_date__gte=timezone.now(), featured_rank__isnull=True)
+            events += unranked.order_by("-start_date", "-id").with_listing()[: count - len(events)]
+        return events
+
+    @property
+    def max_participants(self) -> int | None:
+        return self.capacity
 
     @property
-    def max_participants(self) -> int:
-        return sum([item.max_participants for item in self.ticket_types.all()])
+    def remaining_tickets(self) -> int | None:
+        if self.capacity is None:
+            return None
+        return max(self.capacity - self.tickets_sold - self.tickets_reserved, 0)
 
     def is_open_to_register(self):
         """
@@ -98,10 +153,11 @@ class Event(BaseModel):
                 raise ValidationError()
 
     def save(self, *args, **kwargs):
-        self.clean()
-        if self.pk:  # the object exists, so it's an update
-            old = self.__class__.objects.get(pk=self.pk)
-            if old.status == EventStatusChoice.COMPLETED.value:
-                raise NotAcceptable("Event is already completed.")
-        self.full_clean()
+        if self.tracked_value("status") == EventStatusChoice.COMPLETED.value:
+            raise NotAcceptable("Event is already completed.")
+        self.validate_on_save()
+        kwargs["update_fields"] = sync_coordinates(self, kwargs.get("update_fields"))
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # just the changed columns, never write back possibly stale totals loaded with this instance
+            kwargs["update_fields"] = self.changed_update_fields(exclude=self.COUNTER_FIELDS)
         super().save(*args, **kwargs)
@@ -0,0 +1,88 @@
+from django.db import models
+
+from .event import Event
+
+
+class EventListing(models.Model):
+    """
+    Denormalized listing card of an event, the list and featured endpoints read only this table.
+
+    Rows are rebuilt from the event, its organization, ticket types and categories by the signals of
+    those models, and the ticket totals follow every reservation through ``TicketTypeManager``,
+    see ``apps.events.services.listing``. ``rebuild_event_listings`` repairs drifted rows.
+    """
+
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name="listing")
+    public_id = models.UUIDField(unique=True, editable=False)
+    title = models.CharField(max_length=255)
+    image = models.ImageField(upload_to="events/images/", null=True, blank=True)
+    start_date = models.DateTimeField()
+    end_date = models.DateTimeField()
+    location = models.CharField(blank=True, max_length=255)
+    organization_name = models.CharField(max_length=255)
+    organization_username = models.CharField(max_length=150)
+    organization_logo = models.ImageField(upload_to="organizations/images/", blank=True)
+    min_price = models.DecimalField(max_digits=12, decimal_places=0, null=True)
+    max_price = models.DecimalField(max_digits=12, decimal_places=0, null=True)
+    category_titles = models.JSONField(default=list)
+    # same totals as on the event
+    capacity = models.PositiveIntegerField(default=0, null=True)
+    tickets_sold = models.PositiveIntegerField(default=0)
+    tickets_reserved = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Event Listing"
+        verbose_name_plural = "Event Listings"
+
+    def __str__(self):
+        return self.title
+
+    @classmethod
+    def from_event(cls, event: Event) -> "EventListing":
+        """Listing of ``event``, which should come with its organization, ticket types and categories loaded"""
+        prices = [ticket_type.price for ticket_type in event.ticket_types.all()]
+        return cls(
+            event=event,
+            public_id=event.public_id,
+            title=event.title,
+            image=event.image.name if event.image else None,
+            start_date=event.start_date,
+            end_date=event.end_date,
+            location=event.location,
+            organization_name=event.organization.name,
+            organization_username=event.organization.username,
+            organization_logo=event.organization.logo.name,
+            min_price=min(prices, default=None),
+            max_price=max(prices, default=None),
+            category_titles=[category.title for category in event.categories.all()],
+            capacity=event.capacity,
+            tickets_sold=event.tickets_sold,
+            tickets_reserved=event.tickets_reserved,
+        )
+
+    @property
+    def remaining_tickets(self) -> int | None:
+        if self.capacity is None:
+            return None
+        return max(self.capacity - self.tickets_sold - self.tickets_reserved, 0)
+
+
+class FeaturedEvent(models.Model):
+    """
+    Ranking of the featured endpoint, rewritten as a whole by the ``rank_featured_events`` task,
+    see ``apps.events.services.featured``. Holds the top ``FEATURED_EVENTS_COUNT`` events only.
+    """
+
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name="featured_rank")
+    rank = models.PositiveSmallIntegerField(unique=True)
+    score = models.FloatField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["rank"]
+        verbose_name = "Featured Event"
+        verbose_name_plural = "Featured Events"
+
+    def __str__(self):
+        return f"{self.rank}. {self.event_id}"
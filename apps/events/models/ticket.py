@@ -3,13 +3,16 @@ import uuid
 from django.conf import settings
 from django.core import validators
 from django.db import models
+from django.db.transaction import atomic
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from apps.core.exceptions import ConflictException
 from apps.core.models import BaseModel
 from apps.payment.models import TicketTransaction
 
-from ..choices import TicketStatusChoice
+from ..choices import TicketOrderStatusChoice, TicketStatusChoice
+from ..managers import INVENTORY_COUNTERS, TicketQuerySet, TicketTypeManager
 from ..validators import zero_or_greater_than_1000
 from .event import Event
 
@@ -21,17 +24,32 @@ class TicketType(BaseModel):
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="ticket_types")
     price = models.DecimalField(max_digits=12, decimal_places=0, validators=[zero_or_greater_than_1000])
     # currency = models.CharField(max_length=3, choices=CurrencyEnum.choices())
+    # inventory counters, only ever changed through conditional updates of TicketTypeManager
+    sold = models.PositiveIntegerField(default=0, editable=False)
+    reserved = models.PositiveIntegerField(default=0, editable=False)
+    # ticket number sequence, see TicketTypeManager.allocate_ticket_numbers
+    next_number = models.PositiveIntegerField(default=1, editable=False)
+
+    objects = TicketTypeManager()
+
+    COUNTER_FIELDS = ("sold", "reserved", "next_number")
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        self.validate_on_save()
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # never write back possibly stale counters loaded with this instance
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
 
     @property
-    def remaining_tickets(self):
-        unavailable_tickets_count = self.tickets.filter(
-            status__in=[TicketStatusChoice.SUCCESS.value, TicketStatusChoice.PENDING.value]
-        ).count()
-        return self.max_participants - unavailable_tickets_count
+    def remaining_tickets(self) -> int | None:
+        if self.max_participants is None:
+            return None
+        return max(self.max_participants - self.sold - self.reserved, 0)
 
 
 class Ticket(BaseModel):
@@ -40,7 +58,7 @@ class Ticket(BaseModel):
     status = models.CharField(
         max_length=20, choices=TicketStatusChoice.choices, default=TicketStatusChoice.PENDING.value
     )
-    ticket_number = models.PositiveSmallIntegerField(editable=False)
+    ticket_number = models.PositiveIntegerField(editable=False)
     final_amount = models.DecimalField(max_digits=12, decimal_places=0)
     commission = models.DecimalField(max_digits=12, decimal_places=0)
     notes = models.TextField(blank=True)
@@ -52,10 +70,27 @@ class Ticket(BaseModel):
     presence = models.BooleanField(default=False)
     presence_key = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
 
+    objects = TicketQuerySet.as_manager()
+
+    # ticket numbers come from the sequence of the ticket type, see TicketTypeManager.allocate_ticket_numbers
+    server_generated_fields = ("public_id", "presence_key", "ticket_number")
+
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Ticket"
         verbose_name_plural = "Tickets"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ticket_type", "ticket_number"], name="unique_ticket_number_per_ticket_type"
+            ),
+        ]
+        indexes = [
+            # keyset pagination of the tickets of a user and of all tickets, see TicketPagination
+            models.Index(fields=["user", "-created_at", "-id"], name="ticket_user_created_at_id_idx"),
+            models.Index(fields=["-created_at", "-id"], name="ticket_created_at_id_idx"),
+            # tickets of a ticket type by status, see the inventory rebuild and the featured ranking
+            models.Index(fields=["ticket_type", "status"], name="ticket_type_status_idx"),
+        ]
 
     def __str__(self):
         return f"Ticket {self.ticket_number} - {self.ticket_type.event.title}"
@@ -67,35 +102,103 @@ class Ticket(BaseModel):
         if event.start_date < timezone.now():
             raise ValidationError("Cannot create ticket for past events.")
 
-        if event.max_participants:
-            if self.ticket_type.remaining_tickets < 1:
-                raise ValidationError("Event has reached maximum participants.")
-
+    @atomic
     def save(self, *args, **kwargs):
-        if self.pk is None:
-            self.ticket_number = self.ticket_type.tickets.filter(status=TicketStatusChoice.SUCCESS).count() + 1
-        self.full_clean()
+        is_new = self.pk is None
+        if is_new:
+            self.ticket_number = TicketType.objects.allocate_ticket_numbers(self.ticket_type_id).start
+        self.validate_on_save()
+        if is_new:
+            if self.status in INVENTORY_COUNTERS:
+                if not TicketType.objects.reserve(self.ticket_type_id, 1, status=self.status):
+                    raise ValidationError("Event has reached maximum participants.")
+            super().save(*args, **kwargs)
+            return
+
+        # just the changed columns, never write back a possibly stale status loaded with this instance
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            update_fields = self.changed_update_fields()
+        if "status" in update_fields and self.has_changed("status"):
+            if not self._move_status(self.tracked_value("status"), self.status):
+                raise ConflictException("The ticket status was changed meanwhile, reload the ticket.")
+        kwargs["update_fields"] = [name for name in update_fields if name != "status"]
         super().save(*args, **kwargs)
 
+    def _move_status(self, from_status, to_status) -> bool:
+        """
+        Move the stored ticket from ``from_status`` to ``to_status`` with the counters of its ticket type.
+        The row is updated only while it still has ``from_status``, so of concurrent changes just one
+        moves the counters. False when the ticket had another status.
+        """
+        now = timezone.now()
+        if Ticket.objects.filter(pk=self.pk, status=from_status).update(status=to_status, updated_at=now) != 1:
+            return False
+        TicketType.objects.transfer(self.ticket_type_id, 1, from_status, to_status)
+        self.status, self.updated_at = to_status, now
+        self._track(["status", "updated_at"])
+        return True
+
+    @atomic
+    def _change_status(self, from_statuses, status) -> bool:
+        """Change the status, one of ``from_statuses``, to ``status``, False when the ticket was not changed"""
+        if self.status not in from_statuses:
+            return False
+        if not self._move_status(self.status, status):
+            # changed by somebody else since this instance was loaded
+            self.refresh_from_db(fields=["status", "updated_at"])
+            return False
+        return True
+
     def confirm(self):
         """Confirm the ticket"""
-        if self.status == TicketStatusChoice.PENDING.value:
-            self.status = TicketStatusChoice.SUCCESS.value
-            self.save()
-            return True
-        return False
+        return self._change_status([TicketStatusChoice.PENDING.value], TicketStatusChoice.SUCCESS.value)
 
     def cancel(self):
         """Cancel the ticket"""
-        if self.status in [TicketStatusChoice.PENDING.value, TicketStatusChoice.SUCCESS.value]:
-            self.status = TicketStatusChoice.CANCELLED.value
-            self.save()
-            return True
-        return False
+        return self._change_status(
+            [TicketStatusChoice.PENDING.value, TicketStatusChoice.SUCCESS.value], TicketStatusChoice.CANCELLED.value
+        )
 
     def user_attended(self, presence_key):
         if presence_key == self.presence_key:
             self.presence = True
-            self.save()
+            self.save(update_fields=["presence", "updated_at"])
             return True
         return False
+
+
+class TicketOrder(BaseModel):
+    """
+    Ticket purchase accepted while asynchronous ordering is on (``TICKET_ORDER_ASYNC``).
+
+    The web tier only stores the requested ticket types, a worker of the ticket orders queue
+    creates the tickets later and records the outcome on the order.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="ticket_orders")
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="ticket_orders")
+    items = models.JSONField(help_text="Requested ticket types as sent to create_by_type")
+    status = models.CharField(
+        max_length=1, choices=TicketOrderStatusChoice.choices, default=TicketOrderStatusChoice.QUEUED.value
+    )
+    result = models.JSONField(null=True, blank=True, help_text="Created tickets and transaction once completed")
+    errors = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Order {self.public_id} - {self.get_status_display()}"
+
+    def complete(self, result: dict):
+        self.status = TicketOrderStatusChoice.COMPLETED.value
+        self.result = result
+        self.save(update_fields=["status", "result", "updated_at"])
+
+    def fail(self, errors):
+        self.status = TicketOrderStatusChoice.FAILED.value
+        self.errors = errors
+        self.save(update_fields=["status", "errors", "updated_at"])
@@ -0,0 +1,9 @@
+from apps.core.pagination import KeysetPagination
+
+
+class EventPagination(KeysetPagination):
+    ordering = ("-start_date", "-id")
+
+
+class TicketPagination(KeysetPagination):
+    ordering = ("-created_at", "-id")
@@ -1,3 +1,3 @@
-from .event import EventCreateSerializer, EventSerializer
+from .event import EventCreateSerializer, EventListingSerializer, EventSerializer
 from .speaker import SpeakerSerializer
 from .ticket import TicketCreateSerializer, TicketSerializer, TicketTypeSerializer
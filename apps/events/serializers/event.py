@@ -1,10 +1,11 @@
 from rest_framework import serializers
 
 from apps.core.serializers import GeoLocationSerializer
+from apps.core.sparse_fields import SparseFieldsMixin
 from apps.organizations.models import Organization
 from apps.organizations.serializer import OrganizationSerializer
 
-from ..models import Event, EventCategory, TicketType
+from ..models import Event, EventCategory, EventListing, TicketType
 from .ticket import TicketTypeSerializer
 
 
@@ -14,7 +15,7 @@ class EventCategorySerializer(serializers.ModelSerializer):
         fields = ["title"]
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     organization = OrganizationSerializer(read_only=True)
     ticket_types = TicketTypeSerializer(many=True)
     categories = EventCategorySerializer(many=True)
@@ -34,15 +35,45 @@ class EventSerializer(serializers.ModelSerializer):
             "end_date",
             "registration_opening",
             "registration_deadline",
+            "admission_queue_enabled",
             "location",
             "geo_location",
             "max_participants",
+            "remaining_tickets",
             "is_active",
             "commission_payer",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["public_id", "created_at", "updated_at"]
+        expandable_fields = {"organization": "username", "ticket_types": "public_id", "categories": "title"}
+
+
+class EventListingSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """Listing card of an event, rendered from its ``EventListing`` row alone"""
+
+    categories = serializers.ListField(source="category_titles", child=serializers.CharField())
+    remaining_tickets = serializers.IntegerField(allow_null=True)
+
+    class Meta:
+        model = EventListing
+        fields = [
+            "public_id",
+            "title",
+            "image",
+            "start_date",
+            "end_date",
+            "location",
+            "organization_name",
+            "organization_username",
+            "organization_logo",
+            "min_price",
+            "max_price",
+            "categories",
+            "capacity",
+            "remaining_tickets",
+        ]
+        read_only_fields = fields
 
 
 class EventCreateSerializer(serializers.ModelSerializer):
@@ -80,6 +111,7 @@ class EventCreateSerializer(serializers.ModelSerializer):
             "end_date",
             "registration_opening",
             "registration_deadline",
+            "admission_queue_enabled",
             "location",
             "geo_location",
             "ticket_types",
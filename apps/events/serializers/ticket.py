@@ -1,7 +1,10 @@
 from rest_framework import serializers
 
+from apps.core.projection import Projection
+from apps.core.sparse_fields import SparseFieldsMixin
+
 from ...payment.serializer import TicketTransactionSerializerPublic
-from ..models import Ticket, TicketType
+from ..models import Ticket, TicketOrder, TicketType
 
 
 class TicketTypeSerializer(serializers.ModelSerializer):
@@ -10,7 +13,7 @@ class TicketTypeSerializer(serializers.ModelSerializer):
         fields = ["public_id", "title", "description", "max_participants", "price"]
 
 
-class TicketSerializer(serializers.ModelSerializer):
+class TicketSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     ticket_type = TicketTypeSerializer(read_only=True)
     transactions = TicketTransactionSerializerPublic(read_only=True, many=False)
 
@@ -27,6 +30,11 @@ class TicketSerializer(serializers.ModelSerializer):
             "transactions",
         ]
         read_only_fields = ["public_id", "created_at", "updated_at", "transactions", "status"]
+        expandable_fields = {"ticket_type": "public_id"}
+
+
+# fast read path of ticket lists, renders exactly what TicketSerializer does
+ticket_projection = Projection(TicketSerializer)
 
 
 class TicketCreateSerializer(serializers.Serializer):
@@ -42,3 +50,19 @@ class TicketsResponseDataSerialize(serializers.Serializer):
 class TicketCreateResponseSerializer(serializers.Serializer):
     ticket_data = TicketsResponseDataSerialize(many=True, allow_empty=False)
     transaction_public_id = serializers.UUIDField()
+
+
+class AdmissionStatusSerializer(serializers.Serializer):
+    position = serializers.IntegerField(help_text="Number of buyers ahead in the queue, 0 once admitted")
+    admission_token = serializers.CharField(
+        allow_null=True, help_text="Send as X-Admission-Token header when creating tickets"
+    )
+
+
+class TicketOrderSerializer(serializers.ModelSerializer):
+    result = TicketCreateResponseSerializer(read_only=True)
+
+    class Meta:
+        model = TicketOrder
+        fields = ["public_id", "status", "result", "errors", "created_at", "updated_at"]
+        read_only_fields = fields
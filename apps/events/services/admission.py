@@ -0,0 +1,155 @@
+import time
+from contextlib import contextmanager
+from uuid import uuid4
+
+from django.conf import settings
+from django.core import signing
+from rest_framework.exceptions import PermissionDenied
+
+from apps.core.redis import get_redis_client
+
+ADMISSION_TOKEN_SALT = "events.admission"
+QUEUE_KEY_TIMEOUT = 60 * 60 * 24
+
+
+class AdmissionQueue:
+    """
+    Virtual waiting room of an event.
+
+    Buyers join a Redis backed FIFO and get a sequence number. The head of the queue moves
+    forward at ``ADMISSION_QUEUE_ADMIT_RATE`` buyers per second from the last time it was set,
+    so polling a position only reads and no background worker is needed. Admitted buyers receive
+    a signed, short-lived admission token that ticket creation requires and consumes, buying again
+    takes another turn in the queue.
+    """
+
+    def __init__(self, event_public_id, client=None):
+        self.event_public_id = str(event_public_id)
+        self.client = client or get_redis_client()
+        self.admit_rate = settings.ADMISSION_QUEUE_ADMIT_RATE
+
+    def _key(self, name: str) -> str:
+        return f"admission:{self.event_public_id}:{name}"
+
+    def join(self, user) -> int:
+        """Put the user at the end of the queue and return their sequence number, joining twice is a no-op"""
+        members_key = self._key("members")
+        if (sequence := self.client.hget(members_key, user.pk)) is not None:
+            return int(sequence)
+
+        sequence = self.client.incr(self._key("tail"))
+        if not self.client.hsetnx(members_key, user.pk, sequence):
+            # a concurrent request of the same user won, its sequence number is the valid one
+            return int(self.client.hget(members_key, user.pk))
+
+        for name in ("tail", "members"):
+            self.client.expire(self._key(name), QUEUE_KEY_TIMEOUT)
+        self._limit_head(sequence)
+        return sequence
+
+    def position(self, user) -> int | None:
+        """Number of buyers ahead of the user, 0 once admitted and None if the user never joined"""
+        sequence = self.client.hget(self._key("members"), user.pk)
+        if sequence is None:
+            return None
+        head, head_at, tail = self.client.mget(self._key("head"), self._key("head_at"), self._key("tail"))
+        return max(int(sequence) - int(self._head(head, head_at, tail)), 0)
+
+    def _head(self, head, head_at, tail) -> float:
+        """Head of the queue moved forward by the time passed since ``head_at``, never past the tail"""
+        if head_at is None:
+            return int(tail or 0)
+        return min(int(tail or 0), float(head) + (time.time() - float(head_at)) * self.admit_rate)
+
+    def _limit_head(self, sequence: int):
+        """
+        Set the head back to let in at most a second worth of buyers up to ``sequence`` right away.
+
+        Without this the head would have gathered the admissions of all the time the queue was idle
+        and a following rush would pass at once. Only joins after an idle queue write the head.
+        """
+        head_key, head_at_key = self._key("head"), self._key("head_at")
+        limit = sequence - 1 + self.admit_rate
+
+        def limit_head(pipe):
+            head, head_at = pipe.mget(head_key, head_at_key)
+            if head_at is not None and float(head) + (time.time() - float(head_at)) * self.admit_rate <= limit:
+                return
+            pipe.multi()
+            pipe.set(head_key, limit, ex=QUEUE_KEY_TIMEOUT)
+            pipe.set(head_at_key, time.time(), ex=QUEUE_KEY_TIMEOUT)
+
+        self.client.transaction(limit_head, head_key, head_at_key)
+
+    def issue_token(self, user) -> str:
+        """
+        Admission token of an admitted user. Polls get the same single-use token until it is
+        consumed or ``ADMISSION_TOKEN_MAX_AGE`` passed since it was first issued.
+        """
+        nonce_key = self._key(f"nonce:{user.pk}")
+        self.client.set(nonce_key, uuid4().hex, nx=True, ex=settings.ADMISSION_TOKEN_MAX_AGE)
+        nonce = self.client.get(nonce_key)
+        return signing.dumps(
+            {"event": self.event_public_id, "user": user.pk, "nonce": nonce and nonce.decode()},
+            salt=ADMISSION_TOKEN_SALT,
+        )
+
+    def _load_token(self, token: str | None, user) -> dict | None:
+        if not token:
+            return None
+        try:
+            data = signing.loads(token, salt=ADMISSION_TOKEN_SALT, max_age=settings.ADMISSION_TOKEN_MAX_AGE)
+        except signing.BadSignature:
+            return None
+        if not isinstance(data, dict) or (data.get("event"), data.get("user")) != (self.event_public_id, user.pk):
+            return None
+        return data
+
+    def is_valid_token(self, token: str | None, user) -> bool:
+        data = self._load_token(token, user)
+        return data is not None and self.client.get(self._key(f"nonce:{user.pk}")) == str(data["nonce"]).encode()
+
+    def consume_token(self, token: str | None, user) -> bool:
+        """Use up a valid admission token and take the user out of the queue, False for invalid or used tokens"""
+        return self._consume(token, user) is not None
+
+    def _consume(self, token: str | None, user) -> tuple | None:
+        """``consume_token`` returning what ``_restore`` needs to give the admission back, None when invalid"""
+        data = self._load_token(token, user)
+        if data is None:
+            return None
+        nonce_key, members_key = self._key(f"nonce:{user.pk}"), self._key("members")
+
+        def consume(pipe):
+            nonce = pipe.get(nonce_key)
+            if nonce != str(data["nonce"]).encode():
+                return None
+            ttl, sequence = pipe.pttl(nonce_key), pipe.hget(members_key, user.pk)
+            pipe.multi()
+            pipe.delete(nonce_key)
+            pipe.hdel(members_key, user.pk)
+            return nonce, ttl, sequence
+
+        return self.client.transaction(consume, nonce_key, members_key, value_from_callable=True)
+
+    def _restore(self, user, nonce: bytes, ttl: int, sequence: bytes | None):
+        """Give back a consumed admission, with the token expiring when it would have"""
+        if ttl > 0:
+            self.client.set(self._key(f"nonce:{user.pk}"), nonce, px=ttl, nx=True)
+        if sequence is not None:
+            self.client.hsetnx(self._key("members"), user.pk, sequence)
+
+    @contextmanager
+    def admission(self, token: str | None, user):
+        """
+        Consume the admission token of ``user`` for a purchase made in the block, so a token buys once.
+        The admission is given back when the block raises, e.g. the tickets were sold out meanwhile.
+        """
+        consumed = self._consume(token, user)
+        if consumed is None:
+            raise PermissionDenied("An unused admission token is required to buy tickets for this event.")
+        try:
+            yield
+        except BaseException:
+            self._restore(user, *consumed)
+            raise
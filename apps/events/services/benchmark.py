@@ -0,0 +1,94 @@
+import time
+from dataclasses import dataclass
+
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.projection import Projection
+from apps.core.renderers import ORJSONRenderer
+from apps.payment.models import TicketTransaction
+from apps.payment.serializer import TicketTransactionSerializerPublic, transaction_projection
+
+from ..models import Event, Ticket
+from ..serializers import EventListingSerializer, TicketSerializer
+from ..serializers.ticket import ticket_projection
+from .listing import listings_of
+
+
+@dataclass
+class RenderingBenchmark:
+    name: str
+    rows: int
+    baseline: str
+    baseline_seconds: float
+    candidate: str
+    candidate_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        return self.baseline_seconds / self.candidate_seconds if self.candidate_seconds else 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.name}: {self.rows} rows, {self.baseline} {self.baseline_seconds * 1000:.1f} ms, "
+            f"{self.candidate} {self.candidate_seconds * 1000:.1f} ms, {self.speedup:.1f}x faster"
+        )
+
+
+def _best_of(repeat: int, render) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def benchmark_rendering(name: str, queryset, serializer_class, projection: Projection, repeat: int):
+    """
+    Time loading and rendering ``queryset`` with ``serializer_class`` and with ``projection``,
+    the best of ``repeat`` runs of each, like a list endpoint renders a page.
+    """
+    return RenderingBenchmark(
+        name=name,
+        rows=queryset.count(),
+        baseline="serializer",
+        baseline_seconds=_best_of(repeat, lambda: serializer_class(queryset.all(), many=True).data),
+        candidate="projection",
+        candidate_seconds=_best_of(repeat, lambda: projection.render(queryset.values(*projection.lookups))),
+    )
+
+
+def benchmark_list_rendering(rows: int = 1000, repeat: int = 5) -> list[RenderingBenchmark]:
+    """Rendering benchmarks of the ticket and transaction lists over the latest ``rows`` rows in the database"""
+    tickets = Ticket.objects.select_related("ticket_type").order_by("-created_at", "-id")[:rows]
+    transactions = TicketTransaction.objects.order_by("-created_at", "-id")[:rows]
+    return [
+        benchmark_rendering("tickets", tickets, TicketSerializer, ticket_projection, repeat),
+        benchmark_rendering(
+            "transactions", transactions, TicketTransactionSerializerPublic, transaction_projection, repeat
+        ),
+    ]
+
+
+def benchmark_json_encoding(name: str, data: list, repeat: int) -> RenderingBenchmark:
+    """Time encoding the response ``data`` with DRF's ``JSONRenderer`` and with ``ORJSONRenderer``"""
+    return RenderingBenchmark(
+        name=name,
+        rows=len(data),
+        baseline="json",
+        baseline_seconds=_best_of(repeat, lambda: JSONRenderer().render(data)),
+        candidate="orjson",
+        candidate_seconds=_best_of(repeat, lambda: ORJSONRenderer().render(data)),
+    )
+
+
+def benchmark_json_rendering(rows: int = 1000, repeat: int = 5) -> list[RenderingBenchmark]:
+    """Encoding benchmarks of the event cards and tickets of the latest ``rows`` rows in the database"""
+    events = list(Event.objects.with_listing().order_by("-created_at", "-id")[:rows])
+    tickets = Ticket.objects.order_by("-created_at", "-id")[:rows]
+    return [
+        benchmark_json_encoding("events", EventListingSerializer(listings_of(events), many=True).data, repeat),
+        benchmark_json_encoding(
+            "tickets", ticket_projection.render(tickets.values(*ticket_projection.lookups)), repeat
+        ),
+    ]
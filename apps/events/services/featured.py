@@ -0,0 +1,85 @@
+"""
+Featured ranking of upcoming events.
+
+Every upcoming active event is scored from three signals, each scaled to 0..1 and weighted by ``FEATURED_WEIGHTS``:
+
+- sales: tickets sold or reserved within the last ``FEATURED_SALES_WINDOW`` seconds, relative to the best seller
+- availability: share of the capacity still on sale, 1 for unlimited events and 0 for sold out ones
+- recency: 1 for an event published just now, halved every ``FEATURED_RECENCY_HALF_LIFE`` days
+
+The best ``FEATURED_EVENTS_COUNT`` events are written to ``FeaturedEvent`` by the periodic ``rank_featured_events``
+task, so the featured endpoint reads a handful of ranked rows instead of ranking on every request.
+"""
+
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.core.response_cache import bump_versions
+
+from ..cache import FEATURED_VERSION
+from ..managers import INVENTORY_COUNTERS
+from ..models import Event, FeaturedEvent
+
+
+def _availability(capacity: int | None, sold: int, reserved: int) -> float:
+    if capacity is None:
+        return 1.0
+    if not capacity:
+        return 0.0
+    return max(capacity - sold - reserved, 0) / capacity
+
+
+def _recency(created_at: datetime, now: datetime) -> float:
+    age_in_days = max((now - created_at).total_seconds(), 0) / (60 * 60 * 24)
+    return 0.5 ** (age_in_days / settings.FEATURED_RECENCY_HALF_LIFE)
+
+
+def score_events(now: datetime) -> list[tuple[float, datetime, int]]:
+    """``(score, start_date, pk)`` of every upcoming active event"""
+    since = now - timedelta(seconds=settings.FEATURED_SALES_WINDOW)
+    recent_sales = Q(
+        ticket_types__tickets__created_at__gte=since, ticket_types__tickets__status__in=list(INVENTORY_COUNTERS)
+    )
+    candidates = list(
+        Event.objects.filter(is_active=True, start_date__gte=now)
+        .annotate(recent_sales=Count("ticket_types__tickets", filter=recent_sales))
+        .values_list("pk", "start_date", "created_at", "capacity", "tickets_sold", "tickets_reserved", "recent_sales")
+    )
+
+    weights = settings.FEATURED_WEIGHTS
+    best_sales = max((candidate[-1] for candidate in candidates), default=0)
+    scores = []
+    for pk, start_date, created_at, capacity, sold, reserved, sales in candidates:
+        score = (
+            weights["sales"] * (sales / best_sales if best_sales else 0)
+            + weights["availability"] * _availability(capacity, sold, reserved)
+            + weights["recency"] * _recency(created_at, now)
+        )
+        scores.append((score, start_date, pk))
+    return scores
+
+
+def rank_featured_events(now: datetime | None = None) -> list[FeaturedEvent]:
+    """
+    Replace the featured ranking with the best scored events, the sooner one first on equal scores.
+    Cached featured responses are invalidated when the ranking changed.
+    """
+    now = now or timezone.now()
+    best = sorted(score_events(now), key=lambda item: (-item[0], item[1], item[2]))[: settings.FEATURED_EVENTS_COUNT]
+    ranking = [
+        FeaturedEvent(event_id=pk, rank=rank, score=score, computed_at=now)
+        for rank, (score, _, pk) in enumerate(best, start=1)
+    ]
+
+    with transaction.atomic():
+        previous = list(FeaturedEvent.objects.values_list("event_id", flat=True))
+        FeaturedEvent.objects.all().delete()
+        FeaturedEvent.objects.bulk_create(ranking)
+
+    if previous != [featured.event_id for featured in ranking]:
+        bump_versions(FEATURED_VERSION)
+    return ranking
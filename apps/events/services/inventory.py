@@ -0,0 +1,71 @@
+from django.db import transaction
+from django.db.models import Count, Q
+
+from ..choices import TicketStatusChoice
+from ..models import Event, Ticket, TicketType
+from .listing import refresh_event_listings
+
+
+def rebuild_inventory_counters(ticket_types=None) -> list[TicketType]:
+    """
+    Recompute the ``sold``/``reserved`` counters of ticket types from their ticket rows,
+    and the capacity and counter totals of their events and event listings.
+
+    Returns the ticket types whose counters had drifted, already carrying the repaired values.
+    """
+    if ticket_types is None:
+        ticket_types = TicketType.objects.all()
+
+    with transaction.atomic():
+        locked_ids = list(ticket_types.select_for_update().values_list("pk", flat=True))
+        actual_counts = TicketType.objects.filter(pk__in=locked_ids).annotate(
+            sold_count=Count("tickets", filter=Q(tickets__status=TicketStatusChoice.SUCCESS.value)),
+            reserved_count=Count("tickets", filter=Q(tickets__status=TicketStatusChoice.PENDING.value)),
+        )
+
+        drifted = []
+        for ticket_type in actual_counts:
+            if (ticket_type.sold, ticket_type.reserved) != (ticket_type.sold_count, ticket_type.reserved_count):
+                ticket_type.sold = ticket_type.sold_count
+                ticket_type.reserved = ticket_type.reserved_count
+                drifted.append(ticket_type)
+
+        TicketType.objects.bulk_update(drifted, ["sold", "reserved"])
+        event_ids = TicketType.objects.filter(pk__in=locked_ids).values("event")
+        Event.objects.filter(pk__in=event_ids).refresh_capacity()
+        refresh_event_listings(Event.objects.filter(pk__in=event_ids))
+
+    return drifted
+
+
+def repair_ticket_numbers(ticket_types=None) -> int:
+    """
+    Renumber tickets sharing a ticket number within their ticket type and resync ``next_number``.
+
+    The oldest ticket keeps a duplicated number, later ones get fresh numbers after the current maximum.
+    Returns the number of renumbered tickets.
+    """
+    if ticket_types is None:
+        ticket_types = TicketType.objects.all()
+
+    renumbered = 0
+    with transaction.atomic():
+        for ticket_type in ticket_types.select_for_update().only("pk"):
+            seen_numbers = set()
+            duplicates = []
+            for ticket in ticket_type.tickets.order_by("created_at", "pk").only("pk", "ticket_number"):
+                if ticket.ticket_number in seen_numbers:
+                    duplicates.append(ticket)
+                else:
+                    seen_numbers.add(ticket.ticket_number)
+
+            next_number = max(seen_numbers, default=0) + 1
+            for ticket in duplicates:
+                ticket.ticket_number = next_number
+                next_number += 1
+
+            Ticket.objects.bulk_update(duplicates, ["ticket_number"])
+            TicketType.objects.filter(pk=ticket_type.pk).update(next_number=next_number)
+            renumbered += len(duplicates)
+
+    return renumbered
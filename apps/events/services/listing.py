@@ -0,0 +1,42 @@
+from ..models import Event, EventListing
+
+# every column of a listing except the event it belongs to
+LISTING_FIELDS = [field.name for field in EventListing._meta.concrete_fields if not field.primary_key]
+
+
+def refresh_event_listings(events=None) -> int:
+    """Rebuild the listings of the given events, all events when None, returns the number of listings written"""
+    if events is None:
+        events = Event.objects.all()
+
+    events = events.select_related("organization").prefetch_related("ticket_types", "categories")
+    listings = [EventListing.from_event(event) for event in events]
+    EventListing.objects.bulk_create(
+        listings, update_conflicts=True, unique_fields=["event"], update_fields=LISTING_FIELDS
+    )
+    return len(listings)
+
+
+def rebuild_event_listings(batch_size: int = 500) -> int:
+    """Rebuild every listing in batches of ``batch_size`` events, returns the number of listings written"""
+    event_ids = list(Event.objects.order_by("pk").values_list("pk", flat=True))
+    rebuilt = 0
+    for start in range(0, len(event_ids), batch_size):
+        rebuilt += refresh_event_listings(Event.objects.filter(pk__in=event_ids[start : start + batch_size]))
+    return rebuilt
+
+
+def listings_of(events) -> list[EventListing]:
+    """
+    Listings of ``events`` in the same order, loaded with ``EventQuerySet.with_listing``.
+
+    Events created without signals, e.g. by fixtures or raw inserts, get their listing built on the spot.
+    """
+    missing = [event.pk for event in events if not hasattr(event, "listing")]
+    if missing:
+        refresh_event_listings(Event.objects.filter(pk__in=missing))
+        built = EventListing.objects.in_bulk(missing)
+        for event in events:
+            if event.pk in built:
+                event.listing = built[event.pk]
+    return [event.listing for event in events]
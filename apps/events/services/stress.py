@@ -0,0 +1,165 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError, connection
+from django.db.models import Count, Q
+from django.utils import timezone
+from rest_framework.exceptions import APIException
+
+from apps.organizations.models import Organization
+from apps.payment.models import TicketTransaction
+
+from ..choices import EventStatusChoice, TicketStatusChoice
+from ..models import Event, TicketType
+from .tickets import TicketCreationService
+
+STRESS_EMAIL_DOMAIN = "stress.invalid"
+DEADLOCK_SQLSTATE = "40P01"
+SERIALIZATION_FAILURE_SQLSTATE = "40001"
+
+
+@dataclass
+class StressReport:
+    workers: int
+    succeeded: int = 0
+    rejected: int = 0
+    deadlocks: int = 0
+    serialization_failures: int = 0
+    errors: int = 0
+    duration: float = 0
+    latencies: list[float] = field(default_factory=list)
+    oversold: int = 0
+    drifted_ticket_types: int = 0
+
+    @property
+    def attempts(self) -> int:
+        return self.succeeded + self.rejected + self.deadlocks + self.serialization_failures + self.errors
+
+    @property
+    def throughput(self) -> float:
+        """Finished purchase attempts per second"""
+        return self.attempts / self.duration if self.duration else 0
+
+    def percentile(self, percent: float) -> float:
+        """Latency percentile in seconds, nearest-rank method"""
+        if not self.latencies:
+            return 0
+        latencies = sorted(self.latencies)
+        rank = max(round(percent / 100 * len(latencies)), 1)
+        return latencies[rank - 1]
+
+    def summary(self) -> list[str]:
+        return [
+            f"workers: {self.workers}",
+            f"attempts: {self.attempts} in {self.duration:.2f}s ({self.throughput:.1f}/s)",
+            f"latency: p50={self.percentile(50) * 1000:.1f}ms p99={self.percentile(99) * 1000:.1f}ms",
+            f"succeeded: {self.succeeded}",
+            f"rejected: {self.rejected}",
+            f"deadlocks: {self.deadlocks}",
+            f"serialization failures: {self.serialization_failures}",
+            f"other errors: {self.errors}",
+            f"oversold tickets: {self.oversold}",
+            f"ticket types with drifted counters: {self.drifted_ticket_types}",
+        ]
+
+
+def setup_stress_event(buyers: int, ticket_types: int = 1, capacity: int = 100):
+    """Create a scheduled event with ``ticket_types`` free ticket types of ``capacity`` seats and ``buyers`` users"""
+    User = get_user_model()
+    run_id = f"{time.time_ns():x}"
+    password = make_password(None)
+
+    owner = User.objects.create_user(email=f"owner-{run_id}@{STRESS_EMAIL_DOMAIN}")
+    organization = Organization.objects.create(name=f"stress {run_id}", username=f"stress{run_id}", owner=owner)
+    event = Event.objects.create(
+        title=f"stress {run_id}",
+        description="Concurrency stress test event",
+        organization=organization,
+        start_date=timezone.now() + timedelta(days=7),
+        end_date=timezone.now() + timedelta(days=7, hours=2),
+        status=EventStatusChoice.SCHEDULED,
+    )
+    ticket_type_objs = [
+        TicketType.objects.create(title=f"stress {index}", max_participants=capacity, event=event, price=0)
+        for index in range(ticket_types)
+    ]
+    buyer_objs = User.objects.bulk_create(
+        User(email=f"buyer-{run_id}-{index}@{STRESS_EMAIL_DOMAIN}", password=password) for index in range(buyers)
+    )
+    return event, ticket_type_objs, buyer_objs
+
+
+def teardown_stress_data():
+    """Delete everything created by ``setup_stress_event`` and the purchases made on it"""
+    TicketTransaction.objects.filter(tickets__user__email__endswith=f"@{STRESS_EMAIL_DOMAIN}").delete()
+    get_user_model().objects.filter(email__endswith=f"@{STRESS_EMAIL_DOMAIN}").delete()
+
+
+def _sqlstate(error: DatabaseError) -> str | None:
+    cause = error.__cause__
+    # psycopg2 calls it pgcode, psycopg 3 sqlstate
+    return getattr(cause, "pgcode", None) or getattr(cause, "sqlstate", None)
+
+
+def run_ticket_stress(
+    event: Event, ticket_types: list[TicketType], buyers: list, tickets_per_buyer: int = 1, workers: int = 50
+):
+    """
+    Let every buyer try to buy ``tickets_per_buyer`` tickets of every ticket type at once from ``workers`` threads.
+
+    Every other buyer requests the ticket types in reverse order, so lock ordering problems show up as deadlocks.
+    Needs a database that allows concurrent writers, results on SQLite are meaningless.
+    """
+    report = StressReport(workers=workers)
+    lock = threading.Lock()
+    start = threading.Event()
+
+    def buy(index, buyer):
+        requested = [
+            {"ticket_type_public_id": ticket_type.public_id, "count": tickets_per_buyer}
+            for ticket_type in (ticket_types if index % 2 else reversed(ticket_types))
+        ]
+        start.wait()
+        outcome = "succeeded"
+        started_at = time.perf_counter()
+        try:
+            TicketCreationService().handle_ticket_creation(event=event, user=buyer, ticket_types=requested)
+        except APIException:
+            outcome = "rejected"
+        except DatabaseError as e:
+            outcome = {
+                DEADLOCK_SQLSTATE: "deadlocks",
+                SERIALIZATION_FAILURE_SQLSTATE: "serialization_failures",
+            }.get(_sqlstate(e), "errors")
+        except Exception:
+            outcome = "errors"
+        finally:
+            latency = time.perf_counter() - started_at
+            connection.close()
+
+        with lock:
+            setattr(report, outcome, getattr(report, outcome) + 1)
+            report.latencies.append(latency)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(buy, index, buyer) for index, buyer in enumerate(buyers)]
+        started_at = time.perf_counter()
+        start.set()
+        for future in futures:
+            future.result()
+        report.duration = time.perf_counter() - started_at
+
+    live = Q(tickets__status__in=[TicketStatusChoice.PENDING.value, TicketStatusChoice.SUCCESS.value])
+    for ticket_type in TicketType.objects.filter(pk__in=[t.pk for t in ticket_types]).annotate(
+        live=Count("tickets", filter=live)
+    ):
+        if ticket_type.max_participants is not None:
+            report.oversold += max(ticket_type.live - ticket_type.max_participants, 0)
+        if ticket_type.sold + ticket_type.reserved != ticket_type.live:
+            report.drifted_ticket_types += 1
+    return report
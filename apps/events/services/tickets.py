@@ -1,17 +1,22 @@
+import logging
 from collections import defaultdict
-from decimal import Decimal
+from uuid import UUID
 
 from django.conf import settings
-from django.db.transaction import atomic
-from rest_framework.exceptions import ValidationError
+from django.db.transaction import atomic, on_commit
+from django.utils import timezone
+from rest_framework.exceptions import APIException, ValidationError
 
 from apps.payment.models import CommissionRules, TicketTransaction
 
 from ...core.exceptions import BadRequestException
-from ...payment.choices import CommissionActionTypeChoice
-from ..choices import CommissionPayerChoice
-from ..models import Event, Ticket, TicketType
-from ..serializers.ticket import TicketCreateResponseSerializer
+from ..choices import CommissionPayerChoice, TicketOrderStatusChoice
+from ..models import Event, Ticket, TicketOrder, TicketType
+from ..serializers.ticket import TicketCreateResponseSerializer, TicketCreateSerializer
+
+logger = logging.getLogger(__name__)
+
+ORDER_FAILED_ERRORS = ["The order could not be processed, please try again."]
 
 
 class TicketCreationService:
@@ -20,10 +25,13 @@ class TicketCreationService:
         self, event: Event, user: settings.AUTH_USER_MODEL, ticket_types: list
     ) -> TicketCreateResponseSerializer:
         self._is_event_open_to_register(event)
-        self._is_ticket_types_valid(event, ticket_types)
-        self._is_enough_tickets_available(event, ticket_types)
+        self._is_event_not_started(event)
+        requested_counts = self._get_requested_counts(ticket_types)
+        ticket_type_objs = self._get_ticket_types(event, requested_counts)
+        self._is_enough_tickets_available(ticket_type_objs, requested_counts)
+        self._reserve_tickets(ticket_type_objs, requested_counts)
 
-        tickets = self._create_ticket_objects(user, ticket_types, event)
+        tickets = self._create_ticket_objects(user, ticket_type_objs, requested_counts)
         response_tickets_data = self._get_response_tickets_data(tickets)
         transaction = self._create_transaction(tickets, event)
 
@@ -32,22 +40,35 @@ class TicketCreationService:
         serializer.is_valid(raise_exception=True)
         return serializer
 
-    def _create_ticket_objects(self, user: settings.AUTH_USER_MODEL, ticket_types: list, event: Event):
+    def _create_ticket_objects(
+        self, user: settings.AUTH_USER_MODEL, ticket_type_objs: dict[UUID, TicketType], requested_counts: dict
+    ) -> list[Ticket]:
+        commissions = CommissionRules.objects.get_commissions(
+            ticket_type.price for ticket_type in ticket_type_objs.values()
+        )
         tickets = []
-        for ticket_type in ticket_types:
-            if ticket_type["count"] > 0:
-                ticket_type_obj = TicketType.objects.get(public_id=ticket_type["ticket_type_public_id"])
-                commission = self._get_commission(ticket_type_obj.price)
-                for _ in range(ticket_type["count"]):
-                    ticket = Ticket(
-                        user=user,
-                        ticket_type=ticket_type_obj,
-                        final_amount=ticket_type_obj.price,
-                        commission=commission,
-                    )
-                    tickets.append(ticket)
+        for public_id, count in requested_counts.items():
+            ticket_type_obj = ticket_type_objs[public_id]
+            commission = commissions[ticket_type_obj.price]
+            self._validate_amounts(final_amount=ticket_type_obj.price, commission=commission)
+            ticket_numbers = TicketType.objects.allocate_ticket_numbers(ticket_type_obj.pk, count)
+            for ticket_number in ticket_numbers:
+                ticket = Ticket(
+                    user=user,
+                    ticket_type=ticket_type_obj,
+                    ticket_number=ticket_number,
+                    final_amount=ticket_type_obj.price,
+                    commission=commission,
+                )
+                tickets.append(ticket)
         return tickets
 
+    @staticmethod
+    def _validate_amounts(**amounts):
+        """Validate the amounts the tickets of a ticket type share, ``bulk_create`` skips ``full_clean``"""
+        for name, amount in amounts.items():
+            Ticket._meta.get_field(name).clean(amount, None)
+
     @staticmethod
     def _is_event_open_to_register(event: Event):
         is_open = event.is_open_to_register()
@@ -55,30 +76,57 @@ class TicketCreationService:
             raise BadRequestException("Event is not open to register.")
 
     @staticmethod
-    def _is_ticket_types_valid(event: Event, ticket_types: list):
-        """Check if the ticket types belong to the given event"""
-        event_ticket_type_ids = event.ticket_types.values_list("public_id", flat=True)
-        if not all(ticket_type["ticket_type_public_id"] in event_ticket_type_ids for ticket_type in ticket_types):
+    def _is_event_not_started(event: Event):
+        if event.start_date < timezone.now():
+            raise ValidationError("Cannot create ticket for past events.")
+
+    @staticmethod
+    def _get_requested_counts(ticket_types: list) -> dict[UUID, int]:
+        """Sum the requested ticket count per ticket type public_id"""
+        requested_counts = defaultdict(int)
+        for ticket_type in ticket_types:
+            if ticket_type["count"] > 0:
+                requested_counts[ticket_type["ticket_type_public_id"]] += ticket_type["count"]
+        return dict(requested_counts)
+
+    @staticmethod
+    def _get_ticket_types(event: Event, requested_counts: dict) -> dict[UUID, TicketType]:
+        """Load all requested ticket types in one query and check that they belong to the given event"""
+        ticket_type_objs = {
+            ticket_type.public_id: ticket_type
+            for ticket_type in TicketType.objects.filter(event=event, public_id__in=requested_counts)
+        }
+        if len(ticket_type_objs) != len(requested_counts):
             raise ValidationError("Wrong ticket type is sent.")
+        return ticket_type_objs
 
     @staticmethod
-    def _is_enough_tickets_available(event: Event, ticket_types: list):
-        requested_types = list(filter(lambda ticket: ticket["count"] > 0, ticket_types))
-        public_ids = [type_["ticket_type_public_id"] for type_ in requested_types]
-        event_ticket_type_data = event.ticket_types.filter(public_id__in=public_ids, max_participants__isnull=False)
-        ticket_type_map = {tt.public_id: tt.remaining_tickets for tt in event_ticket_type_data}
-        for ticket_type in requested_types:
-            count = ticket_type["count"]
-            ticket_type_public_id = ticket_type["ticket_type_public_id"]
-            remaining_count = ticket_type_map.get(ticket_type_public_id)
-
-            if remaining_count is not None:
-                if remaining_count == 0:
-                    raise ValidationError(f"No ticket is available for {ticket_type_public_id} ticket type")
-                if count > remaining_count:
-                    raise ValidationError(
-                        f"Only {remaining_count} ticket is remaining for {ticket_type_public_id} ticket type"
-                    )
+    def _check_remaining(ticket_type: TicketType, count: int):
+        remaining_count = ticket_type.remaining_tickets
+        if remaining_count is not None:
+            if remaining_count == 0:
+                raise ValidationError(f"No ticket is available for {ticket_type.public_id} ticket type")
+            if count > remaining_count:
+                raise ValidationError(
+                    f"Only {remaining_count} ticket is remaining for {ticket_type.public_id} ticket type"
+                )
+
+    def _is_enough_tickets_available(self, ticket_type_objs: dict[UUID, TicketType], requested_counts: dict):
+        for public_id, count in requested_counts.items():
+            self._check_remaining(ticket_type_objs[public_id], count)
+
+    def _reserve_tickets(self, ticket_type_objs: dict[UUID, TicketType], requested_counts: dict):
+        """Claim the seats with one conditional update per ticket type, in a fixed order, see reserve_many"""
+        counts = {ticket_type_objs[public_id].pk: count for public_id, count in requested_counts.items()}
+        sold_out_id = TicketType.objects.reserve_many(counts)
+        if sold_out_id is not None:
+            # lost the race against another buyer, report with the fresh counters
+            ticket_type = next(
+                ticket_type for ticket_type in ticket_type_objs.values() if ticket_type.pk == sold_out_id
+            )
+            ticket_type.refresh_from_db(fields=TicketType.COUNTER_FIELDS)
+            self._check_remaining(ticket_type, counts[sold_out_id])
+            raise ValidationError(f"No ticket is available for {ticket_type.public_id} ticket type")
 
     @staticmethod
     def _get_response_tickets_data(tickets: list[Ticket]) -> list:
@@ -100,22 +148,58 @@ class TicketCreationService:
         else:
             raise ValueError("Unhandled Commission Payer")
 
-        tx = TicketTransaction.objects.create(amount=total_amount)
+        tx = TicketTransaction(amount=total_amount)
+        tx.save()
+
+        # seats are already reserved per ticket type, so tickets skip the per-row Ticket.save path
         for ticket in tickets:
             ticket.transaction = tx
-            ticket.save()
+        Ticket.objects.bulk_create(tickets)
         return tx
 
+
+class TicketOrderService:
+    """Accept ticket purchases right away and create the tickets later in a worker"""
+
+    @staticmethod
+    def handle_order_creation(event: Event, user: settings.AUTH_USER_MODEL, items: list) -> TicketOrder:
+        from ..tasks import process_ticket_order
+
+        order = TicketOrder.objects.create(event=event, user=user, items=items)
+        on_commit(lambda: process_ticket_order.delay(order.pk))
+        return order
+
+    @atomic
+    def process_order(self, order_id: int):
+        """Create the tickets of a queued order, a redelivered or already processed order is skipped"""
+        order = (
+            TicketOrder.objects.select_for_update()
+            .select_related("event", "user")
+            .filter(pk=order_id, status=TicketOrderStatusChoice.QUEUED.value)
+            .first()
+        )
+        if order is None:
+            return
+
+        try:
+            with atomic():
+                serializer = TicketCreateSerializer(data=order.items, many=True)
+                serializer.is_valid(raise_exception=True)
+                response_serializer = TicketCreationService().handle_ticket_creation(
+                    order.event, order.user, serializer.validated_data
+                )
+        except APIException as e:
+            order.fail(e.detail)
+        except Exception:
+            # the savepoint above is rolled back, failing the order keeps it from staying queued forever
+            logger.exception("Ticket order %s failed", order.pk)
+            order.fail(ORDER_FAILED_ERRORS)
+        else:
+            order.complete(response_serializer.data)
+
     @staticmethod
-    def _get_commission(ticket_type_price: Decimal):
-        commission_rule = CommissionRules.objects.get_commission_rule(ticket_type_price)
-        if commission_rule:
-            if commission_rule.action == CommissionActionTypeChoice.PERCENTAGE:
-                commission = commission_rule.amount * ticket_type_price / 100
-            elif commission_rule.action == CommissionActionTypeChoice.CONSTANT:
-                commission = commission_rule.amount
-            else:
-                raise ValueError("Unhandled commission type")
-            return commission
-
-        return 0
+    def fail_order(order_id: int):
+        """Fail a still queued order in a transaction of its own, once processing it gave up"""
+        TicketOrder.objects.filter(pk=order_id, status=TicketOrderStatusChoice.QUEUED.value).update(
+            status=TicketOrderStatusChoice.FAILED.value, errors=ORDER_FAILED_ERRORS, updated_at=timezone.now()
+        )
@@ -0,0 +1,120 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.core.cache import cache
+from apps.core.response_cache import bump_versions
+from apps.organizations.models import Organization, event_count_cache_key
+
+from .cache import CATEGORIES_VERSION, bump_event_versions
+from .choices import TicketStatusChoice
+from .managers import INVENTORY_COUNTERS
+from .models import Event, EventCategory, Speaker, Ticket, TicketType
+from .services.listing import refresh_event_listings
+
+
+@receiver([post_save, post_delete], sender=TicketType)
+def refresh_event_capacity(sender, instance, **kwargs):
+    Event.objects.filter(pk=instance.event_id).refresh_capacity()
+
+
+@receiver(post_delete, sender=Ticket)
+def release_seats_of_deleted_ticket(sender, instance, **kwargs):
+    # also for tickets deleted by cascade, e.g. with their user, their ticket type is deleted after them
+    if instance.status in INVENTORY_COUNTERS:
+        TicketType.objects.transfer(instance.ticket_type_id, 1, instance.status, TicketStatusChoice.CANCELLED.value)
+
+
+@receiver([post_save, post_delete], sender=Event)
+def invalidate_event_responses(sender, instance, **kwargs):
+    bump_event_versions([instance.public_id])
+
+
+@receiver([post_save, post_delete], sender=Event)
+def invalidate_organization_event_count(sender, instance, created=False, **kwargs):
+    if created or kwargs["signal"] is post_delete:
+        cache.delete(event_count_cache_key(instance.organization_id))
+        # the event count is part of the organization's responses, move their validators along
+        Organization.objects.filter(pk=instance.organization_id).update(updated_at=timezone.now())
+
+
+@receiver([post_save, post_delete], sender=TicketType)
+@receiver([post_save, post_delete], sender=Speaker)
+def invalidate_event_responses_of_related(sender, instance, **kwargs):
+    bump_event_versions(Event.objects.filter(pk=instance.event_id).values_list("public_id", flat=True))
+
+
+@receiver(m2m_changed, sender=Event.categories.through)
+def invalidate_event_responses_of_categories(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith("post_"):
+            bump_event_versions([instance.public_id])
+    elif action == "pre_clear":
+        bump_event_versions(instance.events.values_list("public_id", flat=True))
+    elif action in ("post_add", "post_remove"):
+        bump_event_versions(Event.objects.filter(pk__in=pk_set).values_list("public_id", flat=True))
+
+
+@receiver([post_save, post_delete], sender=Organization)
+def invalidate_organization_event_responses(sender, instance, **kwargs):
+    bump_event_versions(Event.objects.filter(organization_id=instance.pk).values_list("public_id", flat=True))
+
+
+@receiver([post_save, pre_delete], sender=EventCategory)
+def invalidate_category_responses(sender, instance, **kwargs):
+    # pre_delete, the events of a deleted category are gone by post_delete
+    bump_versions(CATEGORIES_VERSION)
+    bump_event_versions(instance.events.values_list("public_id", flat=True))
+
+
+# search documents and listings, see EventQuerySet.update_search_vector and services.listing
+
+
+def refresh_event_documents(events):
+    events.update_search_vector()
+    refresh_event_listings(events)
+
+
+@receiver(post_save, sender=Event)
+def refresh_documents_of_event(sender, instance, **kwargs):
+    refresh_event_documents(Event.objects.filter(pk=instance.pk))
+
+
+@receiver([post_save, post_delete], sender=TicketType)
+def refresh_listing_of_ticket_type(sender, instance, **kwargs):
+    # only existing listings, a listing deleted along with its event must not be written again
+    refresh_event_listings(Event.objects.filter(pk=instance.event_id, listing__isnull=False))
+
+
+@receiver(m2m_changed, sender=Event.categories.through)
+def refresh_documents_of_categories(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith("post_"):
+            refresh_event_documents(Event.objects.filter(pk=instance.pk))
+    elif action == "pre_clear":
+        # the cleared events are only known before the clear
+        instance._cleared_event_ids = list(instance.events.values_list("pk", flat=True))
+    elif action == "post_clear":
+        refresh_event_documents(Event.objects.filter(pk__in=instance._cleared_event_ids))
+    elif action in ("post_add", "post_remove"):
+        refresh_event_documents(Event.objects.filter(pk__in=pk_set))
+
+
+@receiver(post_save, sender=Organization)
+def refresh_documents_of_organization(sender, instance, **kwargs):
+    refresh_event_documents(Event.objects.filter(organization_id=instance.pk))
+
+
+@receiver(post_save, sender=EventCategory)
+def refresh_documents_of_category(sender, instance, **kwargs):
+    refresh_event_documents(Event.objects.filter(categories=instance))
+
+
+@receiver(pre_delete, sender=EventCategory)
+def collect_events_of_deleted_category(sender, instance, **kwargs):
+    instance._deleted_event_ids = list(instance.events.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=EventCategory)
+def refresh_documents_of_deleted_category(sender, instance, **kwargs):
+    refresh_event_documents(Event.objects.filter(pk__in=instance._deleted_event_ids))
@@ -1,8 +1,11 @@
 from celery import shared_task
+from django.db import DatabaseError
 from django.utils import timezone
 
 from .models import Event
 from .services.event import finalize_event
+from .services.featured import rank_featured_events as rank_featured
+from .services.tickets import TicketOrderService
 
 
 @shared_task
@@ -10,3 +13,20 @@ def end_up_events_on_end_date():
     finished_event_list = Event.objects.filter(end_date__lt=timezone.now())
     for event in finished_event_list:
         finalize_event(event)
+
+
+@shared_task
+def rank_featured_events():
+    rank_featured()
+
+
+@shared_task(bind=True, max_retries=3)
+def process_ticket_order(self, order_id: int):
+    try:
+        TicketOrderService().process_order(order_id)
+    except DatabaseError as e:
+        # the whole transaction failed, e.g. the connection dropped, the order is still queued
+        if self.request.retries >= self.max_retries:
+            TicketOrderService.fail_order(order_id)
+            raise
+        raise self.retry(exc=e, countdown=2**self.request.retries)
@@ -0,0 +1,126 @@
+from datetime import timedelta
+
+import pytest
+import time_machine
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.events.models import EventCategory, Speaker
+from apps.events.services.tickets import TicketCreationService
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+def revalidate(client, url, response):
+    return client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+
+class TestEventConditionalRequests:
+    @pytest.fixture
+    def list_url(self):
+        return reverse("events:event-list")
+
+    @pytest.fixture
+    def detail_url(self, event):
+        return reverse("events:event-detail", kwargs={"public_id": event.public_id})
+
+    def test_current_copy_is_not_modified(self, client, list_url, ticket_type, django_assert_max_num_queries):
+        response = client.get(list_url)
+        client.get(list_url)  # caches the availability of the listed events
+
+        with django_assert_max_num_queries(0):
+            revalidated = revalidate(client, list_url, response)
+
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        assert revalidated["ETag"] == response["ETag"]
+        assert not revalidated.content
+
+    def test_event_change_modifies_list_and_detail(self, client, list_url, detail_url, event):
+        list_response = client.get(list_url)
+        detail_response = client.get(detail_url)
+
+        event.title = "renamed"
+        event.save()
+
+        assert revalidate(client, list_url, list_response).status_code == status.HTTP_200_OK
+        assert revalidate(client, detail_url, detail_response).status_code == status.HTTP_200_OK
+
+    def test_availability_change_modifies_detail(self, client, detail_url, event, ticket_type, another_user, settings):
+        response = client.get(detail_url)
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+
+        with time_machine.travel(timedelta(seconds=settings.RESPONSE_CACHE_AVAILABILITY_TIMEOUT + 1)):
+            revalidated = revalidate(client, detail_url, response)
+
+        assert revalidated.status_code == status.HTTP_200_OK
+        assert revalidated.data["remaining_tickets"] == ticket_type.max_participants - 2
+
+    def test_authenticated_requests_are_validated_per_user(self, client, list_url, event, user, another_user):
+        anonymous_response = client.get(list_url)
+        client.force_authenticate(user)
+        response = client.get(list_url)
+
+        assert revalidate(client, list_url, anonymous_response).status_code == status.HTTP_200_OK
+        assert revalidate(client, list_url, response).status_code == status.HTTP_304_NOT_MODIFIED
+        client.force_authenticate(another_user)
+        assert revalidate(client, list_url, response).status_code == status.HTTP_200_OK
+
+    def test_authenticated_copy_is_validated_before_running_the_view(
+        self, client, list_url, ticket_type, user, django_assert_max_num_queries
+    ):
+        client.get(list_url)
+        client.get(list_url)  # caches the availability of the listed events
+        client.force_authenticate(user)
+        response = client.get(list_url)
+
+        with django_assert_max_num_queries(0):
+            revalidated = revalidate(client, list_url, response)
+
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        assert revalidated["ETag"] == response["ETag"]
+
+    def test_category_list(self, client, db):
+        url = reverse("events:category-list")
+        EventCategory.objects.create(title="music")
+        response = client.get(url)
+        assert revalidate(client, url, response).status_code == status.HTTP_304_NOT_MODIFIED
+
+        EventCategory.objects.create(title="jazz")
+
+        assert revalidate(client, url, response).status_code == status.HTTP_200_OK
+
+
+class TestSpeakerConditionalRequests:
+    @pytest.fixture
+    def speaker(self, event):
+        return Speaker.objects.create(name="speaker", event=event)
+
+    def test_list_covers_every_speaker(self, client, event, speaker):
+        url = reverse("events:speaker-list", kwargs={"event_public_id": event.public_id})
+        Speaker.objects.create(name="another", event=event)
+        response = client.get(url)
+        assert revalidate(client, url, response).status_code == status.HTTP_304_NOT_MODIFIED
+
+        speaker.delete()
+
+        assert revalidate(client, url, response).status_code == status.HTTP_200_OK
+
+    def test_detail_is_validated_by_its_last_modification(self, client, event, speaker):
+        url = reverse(
+            "events:speaker-detail", kwargs={"event_public_id": event.public_id, "public_id": speaker.public_id}
+        )
+        response = client.get(url)
+
+        revalidated = client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+        with time_machine.travel(timedelta(minutes=1)):
+            speaker.name = "renamed"
+            speaker.save()
+        assert client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code == status.HTTP_200_OK
+        assert revalidate(client, url, response).status_code == status.HTTP_200_OK
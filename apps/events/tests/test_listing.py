@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.events.models import Event, EventCategory, EventListing, Ticket, TicketStatusChoice
+from apps.events.services.tickets import TicketCreationService
+
+
+class TestEventListing:
+    def listing(self, event) -> EventListing:
+        return EventListing.objects.get(event=event)
+
+    def test_listing_follows_event_ticket_types_and_categories(self, event, create_ticket_type):
+        event.title = "renamed"
+        event.save()
+        create_ticket_type(max_participants=10, event=event, price=10000)
+        expensive = create_ticket_type(max_participants=5, event=event, price=50000)
+        event.categories.add(EventCategory.objects.create(title="music"))
+
+        listing = self.listing(event)
+        assert listing.title == "renamed"
+        assert (listing.min_price, listing.max_price) == (Decimal(10000), Decimal(50000))
+        assert listing.capacity == 15
+        assert listing.category_titles == ["music"]
+
+        expensive.delete()
+        EventCategory.objects.get(title="music").delete()
+
+        listing = self.listing(event)
+        assert listing.max_price == Decimal(10000)
+        assert listing.capacity == 10
+        assert listing.category_titles == []
+
+    def test_listing_follows_organization_and_category_changes(self, event, organization):
+        category = EventCategory.objects.create(title="music")
+        event.categories.add(category)
+
+        organization.name = "renamed"
+        organization.save()
+        category.title = "jazz"
+        category.save()
+
+        listing = self.listing(event)
+        assert listing.organization_name == "renamed"
+        assert listing.category_titles == ["jazz"]
+
+    def test_listing_follows_ticket_counters(self, event, ticket_type, another_user):
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+        assert self.listing(event).remaining_tickets == ticket_type.max_participants - 2
+
+        Ticket.objects.filter(ticket_type=ticket_type).set_status(TicketStatusChoice.CANCELLED)
+        assert self.listing(event).remaining_tickets == ticket_type.max_participants
+
+    def test_event_deletion_removes_the_listing(self, event, ticket_type):
+        event.delete()
+
+        assert not EventListing.objects.exists()
+
+    def test_rebuild_command_repairs_drift(self, event, ticket_type):
+        EventListing.objects.filter(event=event).update(title="stale", tickets_sold=7)
+
+        call_command("rebuild_event_listings")
+
+        listing = self.listing(event)
+        assert (listing.title, listing.tickets_sold) == (event.title, 0)
+
+    def test_missing_listings_are_built_when_listed(self, event):
+        EventListing.objects.all().delete()
+
+        response = APIClient().get(reverse("events:event-list"))
+
+        assert response.data["results"][0]["title"] == event.title
+        assert Event.objects.filter(listing__isnull=False).count() == 1
@@ -2,10 +2,13 @@ from datetime import timedelta
 
 import pytest
 import time_machine
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework.exceptions import NotAcceptable, ValidationError
 
 from apps.events.choices import CommissionPayerChoice, EventStatusChoice
+from apps.events.models import Event
 from apps.events.services.event import finalize_event
 from apps.payment.choices import BalanceTypeChoice
 from apps.payment.models import OrganizationAccounting
@@ -150,3 +153,45 @@ class TestEventModel:
         with pytest.raises(NotAcceptable, match="Event is already completed."):
             event.end_date = timezone.now() + timedelta(days=1)
             event.save()
+
+
+class TestEventFieldTracking:
+    def test_loaded_event_has_no_changes(self, event):
+        loaded = Event.objects.get(pk=event.pk)
+
+        assert loaded.changed_fields == set()
+        assert loaded.tracked_value("title") == event.title
+
+    def test_changes_are_tracked_until_saved(self, event):
+        event.geo_location = {"latitude": 35.7, "longitude": 51.4, "zoom": 12}
+        event.save()
+
+        event.title = "renamed"
+        event.geo_location["latitude"] = 35.8
+
+        assert event.changed_fields == {"title", "geo_location"}
+        assert event.has_changed("title") and not event.has_changed("description")
+
+        event.save()
+
+        assert event.changed_fields == set()
+        assert event.tracked_value("title") == "renamed"
+
+    def test_deferred_fields_are_tracked_once_loaded(self, event):
+        loaded = Event.objects.only("title").get(pk=event.pk)
+
+        assert loaded.changed_fields == set()
+        assert loaded.tracked_value("status") == event.status
+
+    def test_update_saves_just_the_changed_columns_without_reading_the_row(self, event):
+        loaded = Event.objects.get(pk=event.pk)
+        Event.objects.filter(pk=event.pk).update(description="changed meanwhile")
+        loaded.title = "renamed"
+
+        with CaptureQueriesContext(connection) as context:
+            loaded.save()
+
+        update = context.captured_queries[0]["sql"]
+        assert update.startswith("UPDATE") and '"title"' in update and '"description"' not in update
+        event.refresh_from_db()
+        assert (event.title, event.description) == ("renamed", "changed meanwhile")
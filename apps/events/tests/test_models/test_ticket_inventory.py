@@ -0,0 +1,264 @@
+from datetime import timedelta
+
+import pytest
+import time_machine
+from django.core.management import call_command
+from rest_framework.exceptions import ValidationError
+
+from apps.core.exceptions import ConflictException
+from apps.events.choices import TicketStatusChoice
+from apps.events.models import Event, Ticket, TicketType
+from apps.events.services.tickets import TicketCreationService
+from apps.payment.choices import BillStatusChoice
+from apps.payment.models import TicketTransaction
+from apps.payment.tasks import invalidate_transactions
+
+
+class TestTicketInventoryCounters:
+    def test_purchase_reserves_tickets(self, ticket_type, event, another_user):
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 3}]
+
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+        ticket_type.refresh_from_db()
+
+        assert ticket_type.reserved == 3
+        assert ticket_type.sold == 0
+        assert ticket_type.remaining_tickets == ticket_type.max_participants - 3
+
+    def test_reserve_fails_when_capacity_is_exceeded(self, ticket_type):
+        assert TicketType.objects.reserve(ticket_type.pk, ticket_type.max_participants) is True
+        assert TicketType.objects.reserve(ticket_type.pk, 1) is False
+
+        ticket_type.refresh_from_db()
+        assert ticket_type.reserved == ticket_type.max_participants
+
+    def test_reserve_on_unlimited_ticket_type_always_succeeds(self, create_ticket_type, event):
+        ticket_type = create_ticket_type(max_participants=None, event=event, price=0)
+
+        assert TicketType.objects.reserve(ticket_type.pk, 1000) is True
+        ticket_type.refresh_from_db()
+        assert ticket_type.remaining_tickets is None
+
+    def test_ticket_creation_fails_when_ticket_type_is_sold_out(self, create_ticket_type, event, another_user):
+        ticket_type = create_ticket_type(max_participants=1, event=event, price=0)
+        Ticket.objects.create(user=another_user, ticket_type=ticket_type, final_amount=0, commission=0)
+
+        with pytest.raises(ValidationError, match="Event has reached maximum participants."):
+            Ticket.objects.create(user=another_user, ticket_type=ticket_type, final_amount=0, commission=0)
+
+    def test_ticket_confirm_and_cancel_move_counters(self, ticket, ticket_type):
+        ticket.confirm()
+        ticket_type.refresh_from_db()
+        assert (ticket_type.sold, ticket_type.reserved) == (1, 0)
+
+        ticket.cancel()
+        ticket_type.refresh_from_db()
+        assert (ticket_type.sold, ticket_type.reserved) == (0, 0)
+
+    def test_concurrent_cancel_moves_counters_once(self, ticket, ticket_type):
+        stale_ticket = Ticket.objects.get(pk=ticket.pk)
+
+        assert ticket.cancel() is True
+        assert stale_ticket.cancel() is False
+        ticket_type.refresh_from_db()
+        assert (ticket_type.sold, ticket_type.reserved) == (0, 0)
+        assert stale_ticket.status == TicketStatusChoice.CANCELLED
+
+    def test_confirm_of_a_ticket_cancelled_meanwhile_is_refused(self, ticket, ticket_type):
+        stale_ticket = Ticket.objects.get(pk=ticket.pk)
+        ticket.cancel()
+
+        assert stale_ticket.confirm() is False
+        ticket_type.refresh_from_db()
+        assert (ticket_type.sold, ticket_type.reserved) == (0, 0)
+        assert Ticket.objects.get(pk=ticket.pk).status == TicketStatusChoice.CANCELLED
+
+    def test_status_changed_with_save_moves_counters(self, ticket, ticket_type):
+        ticket.status = TicketStatusChoice.SUCCESS.value
+        ticket.save()
+
+        ticket_type.refresh_from_db()
+        assert (ticket_type.sold, ticket_type.reserved) == (1, 0)
+
+    def test_saving_a_stale_status_is_refused(self, ticket, ticket_type):
+        stale_ticket = Ticket.objects.get(pk=ticket.pk)
+        ticket.cancel()
+
+        stale_ticket.status = TicketStatusChoice.SUCCESS.value
+        with pytest.raises(ConflictException):
+            stale_ticket.save()
+
+        ticket_type.refresh_from_db()
+        assert (ticket_type.sold, ticket_type.reserved) == (0, 0)
+        assert Ticket.objects.get(pk=ticket.pk).status == TicketStatusChoice.CANCELLED
+
+    def test_attendance_of_a_stale_ticket_keeps_the_status(self, ticket):
+        stale_ticket = Ticket.objects.get(pk=ticket.pk)
+        ticket.cancel()
+
+        assert stale_ticket.user_attended(stale_ticket.presence_key) is True
+
+        stored = Ticket.objects.get(pk=ticket.pk)
+        assert (stored.status, stored.presence) == (TicketStatusChoice.CANCELLED, True)
+
+    def test_deleting_tickets_releases_their_seats(self, ticket, ticket_type, event):
+        ticket.delete()
+
+        ticket_type.refresh_from_db()
+        event.refresh_from_db()
+        assert (ticket_type.sold, ticket_type.reserved) == (0, 0)
+        assert (event.tickets_sold, event.tickets_reserved) == (0, 0)
+
+    def test_deleting_the_user_releases_the_seats_of_their_tickets(self, ticket, ticket_type):
+        ticket.confirm()
+
+        ticket.user.delete()
+
+        ticket_type.refresh_from_db()
+        assert (ticket_type.sold, ticket_type.reserved) == (0, 0)
+
+    def test_deleting_a_ticket_type_with_tickets(self, ticket, ticket_type, event):
+        ticket_type.delete()
+
+        event.refresh_from_db()
+        assert (event.tickets_sold, event.tickets_reserved) == (0, 0)
+
+    def test_saving_stale_ticket_type_keeps_counters(self, ticket_type, ticket):
+        stale_ticket_type = TicketType.objects.get(pk=ticket_type.pk)
+        ticket.confirm()
+
+        stale_ticket_type.title = "renamed"
+        stale_ticket_type.save()
+        ticket_type.refresh_from_db()
+
+        assert ticket_type.title == "renamed"
+        assert (ticket_type.sold, ticket_type.reserved) == (1, 0)
+
+    def test_transaction_confirm_sells_reserved_tickets(self, ticket_type, event, another_user):
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+
+        TicketTransaction.objects.get().confirm("ref-id")
+        ticket_type.refresh_from_db()
+
+        assert (ticket_type.sold, ticket_type.reserved) == (2, 0)
+        assert Ticket.objects.filter(status=TicketStatusChoice.SUCCESS).count() == 2
+
+    def test_invalidate_transactions_releases_reserved_tickets(self, ticket_type, event, another_user):
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+
+        with time_machine.travel(timedelta(minutes=16)):
+            invalidate_transactions()
+            invalidate_transactions()
+        ticket_type.refresh_from_db()
+
+        assert TicketTransaction.objects.get().status == BillStatusChoice.CANCELLED
+        assert (ticket_type.sold, ticket_type.reserved) == (0, 0)
+
+    def test_rebuild_command_repairs_drifted_counters(self, ticket_type, ticket):
+        TicketType.objects.filter(pk=ticket_type.pk).update(sold=7, reserved=0)
+
+        call_command("rebuild_ticket_inventory")
+        ticket_type.refresh_from_db()
+
+        assert (ticket_type.sold, ticket_type.reserved) == (0, 1)
+
+
+class TestTicketNumberAllocation:
+    def test_allocate_ticket_numbers_hands_out_consecutive_blocks(self, ticket_type):
+        assert TicketType.objects.allocate_ticket_numbers(ticket_type.pk, 3) == range(1, 4)
+        assert TicketType.objects.allocate_ticket_numbers(ticket_type.pk) == range(4, 5)
+
+    def test_allocate_ticket_numbers_fails_for_missing_ticket_type(self, db):
+        with pytest.raises(TicketType.DoesNotExist):
+            TicketType.objects.allocate_ticket_numbers(0)
+
+    def test_pending_tickets_get_distinct_numbers(self, ticket_type, event, another_user):
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+        Ticket.objects.create(user=another_user, ticket_type=ticket_type, final_amount=0, commission=0)
+
+        ticket_numbers = sorted(Ticket.objects.values_list("ticket_number", flat=True))
+        assert ticket_numbers == [1, 2, 3]
+
+    def test_repair_command_resyncs_ticket_number_sequence(self, ticket_type, ticket):
+        TicketType.objects.filter(pk=ticket_type.pk).update(next_number=1)
+
+        call_command("repair_ticket_numbers")
+        new_ticket = Ticket.objects.create(user=ticket.user, ticket_type=ticket_type, final_amount=0, commission=0)
+
+        assert new_ticket.ticket_number == ticket.ticket_number + 1
+
+
+class TestEventCapacity:
+    def test_capacity_sums_ticket_types(self, event, create_ticket_type):
+        create_ticket_type(max_participants=10, event=event, price=0)
+        create_ticket_type(max_participants=20, event=event, price=0)
+        event.refresh_from_db()
+
+        assert event.max_participants == 30
+        assert event.remaining_tickets == 30
+
+    def test_unlimited_ticket_type_makes_capacity_unlimited(self, event, create_ticket_type):
+        create_ticket_type(max_participants=10, event=event, price=0)
+        create_ticket_type(max_participants=None, event=event, price=0)
+        event.refresh_from_db()
+
+        assert event.max_participants is None
+        assert event.remaining_tickets is None
+
+    def test_event_without_ticket_types_has_no_capacity(self, event):
+        assert event.max_participants == 0
+
+    def test_capacity_follows_ticket_type_changes(self, event, ticket_type):
+        ticket_type.max_participants = 25
+        ticket_type.save()
+        event.refresh_from_db()
+        assert event.max_participants == 25
+
+        ticket_type.delete()
+        event.refresh_from_db()
+        assert event.max_participants == 0
+
+    def test_totals_follow_purchases_and_status_changes(self, ticket_type, event, another_user):
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 3}]
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+        event.refresh_from_db()
+        assert (event.tickets_sold, event.tickets_reserved, event.remaining_tickets) == (0, 3, 7)
+
+        TicketTransaction.objects.get().confirm("ref-id")
+        event.refresh_from_db()
+        assert (event.tickets_sold, event.tickets_reserved, event.remaining_tickets) == (3, 0, 7)
+
+        Ticket.objects.first().cancel()
+        event.refresh_from_db()
+        assert (event.tickets_sold, event.tickets_reserved, event.remaining_tickets) == (2, 0, 8)
+
+    def test_saving_stale_event_keeps_totals(self, event, ticket_type, ticket):
+        stale_event = Event.objects.get(pk=event.pk)
+        ticket.confirm()
+
+        stale_event.title = "renamed"
+        stale_event.save()
+        event.refresh_from_db()
+
+        assert event.title == "renamed"
+        assert (event.capacity, event.tickets_sold, event.tickets_reserved) == (10, 1, 0)
+
+    def test_refresh_capacity_is_none_with_an_unlimited_ticket_type(self, event, ticket_type):
+        TicketType.objects.bulk_create([TicketType(event=event, title="free", max_participants=None, price=0)])
+
+        Event.objects.filter(pk=event.pk).refresh_capacity()
+        event.refresh_from_db()
+
+        assert event.capacity is None
+        assert event.remaining_tickets is None
+
+    def test_rebuild_command_repairs_drifted_event_totals(self, event, ticket_type, ticket):
+        Event.objects.filter(pk=event.pk).update(capacity=3, tickets_sold=5, tickets_reserved=0)
+
+        call_command("rebuild_ticket_inventory")
+        event.refresh_from_db()
+
+        assert (event.capacity, event.tickets_sold, event.tickets_reserved) == (10, 0, 1)
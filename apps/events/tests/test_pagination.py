@@ -0,0 +1,91 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.core.pagination import KeysetPagination
+from apps.events.models import Ticket
+from apps.events.pagination import EventPagination
+
+
+class TestEventKeysetPagination:
+    @pytest.fixture
+    def events(self, organization, create_event, monkeypatch):
+        monkeypatch.setattr(EventPagination, "page_size", 2)
+        start_date = timezone.now() + timedelta(days=7)
+        # two events share a start date, the id breaks the tie
+        start_dates = [start_date, start_date, start_date + timedelta(days=1), start_date + timedelta(days=2)]
+        return [create_event(organization, date, date + timedelta(hours=2)) for date in start_dates]
+
+    @pytest.fixture
+    def client(self, user):
+        client = APIClient()
+        client.force_authenticate(user)  # not served from the response cache
+        return client
+
+    def test_pages_follow_start_date_and_id(self, client, events):
+        first_page = client.get(reverse("events:event-list")).data
+        second_page = client.get(first_page["next"]).data
+
+        public_ids = [event["public_id"] for event in first_page["results"] + second_page["results"]]
+        expected = sorted(events, key=lambda event: (event.start_date, event.id), reverse=True)
+        assert public_ids == [str(event.public_id) for event in expected]
+        assert "count" not in first_page
+        assert first_page["previous"] is None
+        assert second_page["next"] is None
+
+    def test_previous_link_returns_the_previous_page(self, client, events):
+        first_page = client.get(reverse("events:event-list")).data
+        second_page = client.get(first_page["next"]).data
+
+        previous_page = client.get(second_page["previous"]).data
+
+        assert previous_page["results"] == first_page["results"]
+        assert previous_page["previous"] is None
+        assert previous_page["next"] == first_page["next"]
+
+    def test_rows_added_before_the_cursor_do_not_shift_the_next_page(self, client, events, organization, create_event):
+        first_page = client.get(reverse("events:event-list")).data
+        start_date = timezone.now() + timedelta(days=30)
+        create_event(organization, start_date, start_date + timedelta(hours=2))
+
+        second_page = client.get(first_page["next"]).data
+
+        assert [event["public_id"] for event in second_page["results"]] == [
+            str(events[1].public_id),
+            str(events[0].public_id),
+        ]
+
+    def test_page_numbers_are_opt_in(self, client, events):
+        response = client.get(reverse("events:event-list"), {"page": 2})
+
+        assert response.data["count"] == 4
+        assert [event["public_id"] for event in response.data["results"]] == [
+            str(events[1].public_id),
+            str(events[0].public_id),
+        ]
+
+    def test_invalid_cursor(self, client, events):
+        response = client.get(reverse("events:event-list"), {"cursor": "not-a-cursor"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestTicketKeysetPagination:
+    def test_user_tickets_are_paged_by_creation(self, ticket_type, another_user, monkeypatch):
+        monkeypatch.setattr(KeysetPagination, "page_size", 2)
+        tickets = [
+            Ticket.objects.create(user=another_user, ticket_type=ticket_type, final_amount=0, commission=0)
+            for _ in range(3)
+        ]
+        client = APIClient()
+        client.force_authenticate(another_user)
+
+        first_page = client.get(reverse("events:user-tickets")).data
+        second_page = client.get(first_page["next"]).data
+
+        public_ids = [ticket["public_id"] for ticket in first_page["results"] + second_page["results"]]
+        assert public_ids == [str(ticket.public_id) for ticket in reversed(tickets)]
@@ -0,0 +1,72 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core.projection import Projection
+from apps.events.models import Ticket
+from apps.events.pagination import TicketPagination
+from apps.events.serializers import EventSerializer, TicketSerializer
+from apps.events.serializers.ticket import ticket_projection
+from apps.events.services.tickets import TicketCreationService
+from apps.payment.models import TicketTransaction
+from apps.payment.serializer import TicketTransactionSerializerPublic, transaction_projection
+
+
+@pytest.fixture
+def bought_tickets(event, ticket_type, another_user):
+    ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 3}]
+    TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+    return Ticket.objects.filter(user=another_user)
+
+
+class TestProjection:
+    def test_renders_like_the_serializer(self, bought_tickets):
+        tickets = bought_tickets.order_by("pk")
+
+        rows = ticket_projection.render(tickets.values(*ticket_projection.lookups))
+
+        assert rows == TicketSerializer(tickets, many=True).data
+
+    def test_renders_transactions_like_the_serializer(self, bought_tickets):
+        transactions = TicketTransaction.objects.all()
+
+        rows = transaction_projection.render(transactions.values(*transaction_projection.lookups))
+
+        assert rows == TicketTransactionSerializerPublic(transactions, many=True).data
+
+    def test_instance_only_fields_are_rejected(self):
+        with pytest.raises(ImproperlyConfigured):
+            Projection(EventSerializer)
+
+
+class TestProjectedLists:
+    def test_user_ticket_pages_match_the_serializer(self, bought_tickets, another_user, monkeypatch):
+        monkeypatch.setattr(TicketPagination, "page_size", 2)
+        client = APIClient()
+        client.force_authenticate(another_user)
+
+        first_page = client.get(reverse("events:user-tickets")).json()
+        second_page = client.get(first_page["next"]).json()
+
+        tickets = bought_tickets.order_by("-created_at", "-id")
+        assert first_page["results"] + second_page["results"] == TicketSerializer(tickets, many=True).data
+        assert second_page["next"] is None
+
+    def test_transaction_list_matches_the_serializer(self, bought_tickets, another_user):
+        client = APIClient()
+        client.force_authenticate(another_user)
+
+        response = client.get(reverse("payment:user_transactions"))
+
+        transactions = TicketTransaction.objects.order_by("-created_at", "-id")
+        assert response.json()["results"] == TicketTransactionSerializerPublic(transactions, many=True).data
+
+
+def test_benchmark_command(bought_tickets, capsys):
+    call_command("benchmark_list_rendering", rows=10, repeat=1)
+
+    output = capsys.readouterr().out
+    assert "tickets: 3 rows" in output
+    assert "transactions: 1 rows" in output
@@ -0,0 +1,103 @@
+import math
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.core.geo import EARTH_RADIUS_KM, filter_near
+from apps.events.models import Event
+from apps.organizations.models import Organization
+
+TEHRAN = (35.6892, 51.3890)
+KARAJ = (35.8400, 50.9391)  # about 44 km from Tehran
+ISFAHAN = (32.6539, 51.6660)  # about 340 km from Tehran
+
+
+def haversine_km(start, end):
+    latitude_delta = math.radians(end[0] - start[0]) / 2
+    longitude_delta = math.radians(end[1] - start[1]) / 2
+    a = (
+        math.sin(latitude_delta) ** 2
+        + math.cos(math.radians(start[0])) * math.cos(math.radians(end[0])) * math.sin(longitude_delta) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def geo_location(point):
+    return {"latitude": point[0], "longitude": point[1], "zoom": 12}
+
+
+class TestEventProximity:
+    @pytest.fixture
+    def events(self, event, organization, create_event):
+        located = {}
+        for name, point in [("tehran", TEHRAN), ("karaj", KARAJ), ("isfahan", ISFAHAN)]:
+            located[name] = create_event(organization, event.start_date, event.end_date)
+            located[name].geo_location = geo_location(point)
+            located[name].save()
+        return located
+
+    def near(self, params) -> list[str]:
+        response = APIClient().get(reverse("events:event-list"), params)
+        assert response.status_code == status.HTTP_200_OK
+        return [event["public_id"] for event in response.data["results"]]
+
+    def test_coordinates_follow_geo_location(self, event):
+        event.geo_location = geo_location(TEHRAN)
+        event.save()
+        assert Event.objects.values_list("latitude", "longitude").get(pk=event.pk) == TEHRAN
+
+        event.geo_location = None
+        event.save()
+        assert Event.objects.values_list("latitude", "longitude").get(pk=event.pk) == (None, None)
+
+    def test_near_filters_by_radius(self, events):
+        public_ids = self.near({"near": "35.7,51.4", "radius": 50})
+
+        assert sorted(public_ids) == sorted([str(events["tehran"].public_id), str(events["karaj"].public_id)])
+
+    def test_near_orders_by_distance(self, events):
+        public_ids = self.near({"near": f"{KARAJ[0]},{KARAJ[1]}", "radius": 500, "ordering": "distance"})
+
+        assert public_ids == [str(events[name].public_id) for name in ["karaj", "tehran", "isfahan"]]
+
+    def test_distance_is_exact_haversine(self, events):
+        distances = dict(filter_near(Event.objects.all(), *TEHRAN, 500).values_list("public_id", "distance"))
+
+        assert distances[events["isfahan"].public_id] == pytest.approx(haversine_km(TEHRAN, ISFAHAN))
+        assert distances[events["karaj"].public_id] == pytest.approx(haversine_km(TEHRAN, KARAJ))
+
+    @pytest.mark.parametrize("params", [{"near": "tehran"}, {"near": "91,0"}, {"near": "35.7,51.4", "radius": 0}])
+    def test_invalid_parameters(self, params):
+        response = APIClient().get(reverse("events:event-list"), params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_organizations_near(self, organization, user):
+        organization.geo_location = geo_location(ISFAHAN)
+        organization.save()
+        Organization.objects.create(name="tehran", username="tehran", owner=user, geo_location=geo_location(TEHRAN))
+
+        response = APIClient().get(reverse("organizations:organization-list"), {"near": "32.6,51.6"})
+
+        assert [row["username"] for row in response.data["results"]] == [organization.username]
+
+
+@pytest.mark.parametrize("point, radius", [(TEHRAN, 50), ((89.9, 10), 100), ((10, 179.9), 100), ((-10, -179.9), 100)])
+def test_points_on_the_circle_pass_the_bounding_box(event, point, radius):
+    angle = radius * 0.999 / EARTH_RADIUS_KM
+    latitude, longitude = math.radians(point[0]), math.radians(point[1])
+    for bearing in map(math.radians, range(0, 360, 15)):
+        on_circle = math.asin(
+            math.sin(latitude) * math.cos(angle) + math.cos(latitude) * math.sin(angle) * math.cos(bearing)
+        )
+        on_circle_longitude = longitude + math.atan2(
+            math.sin(bearing) * math.sin(angle) * math.cos(latitude),
+            math.cos(angle) - math.sin(latitude) * math.sin(on_circle),
+        )
+        Event.objects.filter(pk=event.pk).update(
+            latitude=math.degrees(on_circle), longitude=(math.degrees(on_circle_longitude) + 540) % 360 - 180
+        )
+
+        assert filter_near(Event.objects.all(), *point, radius).exists()
@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.core.tests.utils import assert_query_budget
+from apps.events.models import EventCategory, Ticket
+from apps.events.services.featured import rank_featured_events
+
+
+@pytest.fixture
+def add_events(organization, create_event, create_ticket_type):
+    def _add_events(count: int = 3):
+        category = EventCategory.objects.create(title="music")
+        for _ in range(count):
+            event = create_event(
+                organization, timezone.now() + timedelta(days=7), timezone.now() + timedelta(days=7, hours=2)
+            )
+            create_ticket_type(max_participants=10, event=event, price=10000)
+            create_ticket_type(max_participants=20, event=event, price=20000)
+            event.categories.add(category)
+
+    return _add_events
+
+
+class TestEventQueryBudgets:
+    def test_event_list(self, add_events):
+        add_events(1)
+        client = APIClient()
+
+        assert_query_budget(lambda: client.get(reverse("events:event-list")), 1, add_events)
+
+    def test_featured_events(self, add_events):
+        def add_featured_events(count: int = 3):
+            add_events(count)
+            rank_featured_events()
+
+        add_featured_events(1)
+        client = APIClient()
+
+        # the ranking and the unranked events topping up a short one
+        assert_query_budget(lambda: client.get(reverse("events:event-featured")), 2, add_featured_events)
+
+    def test_event_list_renders_listings(self, add_events, organization):
+        add_events(2)
+
+        response = APIClient().get(reverse("events:event-list"))
+
+        for event_data in response.data["results"]:
+            assert event_data["organization_name"] == organization.name
+            assert (event_data["min_price"], event_data["max_price"]) == ("10000", "20000")
+            assert event_data["categories"] == ["music"]
+            assert event_data["capacity"] == 30
+
+    def test_event_detail(self, event, ticket_type):
+        client = APIClient()
+        url = reverse("events:event-detail", kwargs={"public_id": event.public_id})
+
+        assert_query_budget(lambda: client.get(url), 5, lambda: None)
+
+
+class TestTicketQueryBudgets:
+    @pytest.fixture
+    def client(self, another_user):
+        client = APIClient()
+        client.force_authenticate(another_user)
+        return client
+
+    @pytest.fixture
+    def add_tickets(self, ticket_type, another_user):
+        def _add_tickets(count: int = 3):
+            for _ in range(count):
+                Ticket.objects.create(user=another_user, ticket_type=ticket_type, final_amount=0, commission=0)
+
+        return _add_tickets
+
+    def test_event_ticket_list(self, client, event, add_tickets):
+        add_tickets(1)
+        url = reverse("events:ticket-list", kwargs={"event_public_id": event.public_id})
+
+        assert_query_budget(lambda: client.get(url), 1, add_tickets)
+
+    def test_user_ticket_list(self, client, add_tickets):
+        add_tickets(1)
+
+        assert_query_budget(lambda: client.get(reverse("events:user-tickets")), 1, add_tickets)
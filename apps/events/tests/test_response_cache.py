@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+import pytest
+import time_machine
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.events.models import EventCategory, Speaker
+from apps.events.services.tickets import TicketCreationService
+
+
+class TestEventResponseCache:
+    @pytest.fixture
+    def client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def list_url(self):
+        return reverse("events:event-list")
+
+    @pytest.fixture
+    def detail_url(self, event):
+        return reverse("events:event-detail", kwargs={"public_id": event.public_id})
+
+    def test_repeated_anonymous_request_is_served_from_cache(
+        self, client, list_url, ticket_type, django_assert_max_num_queries
+    ):
+        first_response = client.get(list_url)
+        client.get(list_url)  # caches the availability of the listed events
+
+        with django_assert_max_num_queries(0):
+            response = client.get(list_url)
+
+        assert first_response.headers["X-Cache"] == "miss"
+        assert response.headers["X-Cache"] == "hit"
+        assert response.json() == first_response.json()
+
+    def test_query_string_is_part_of_the_key(self, client, list_url, event):
+        client.get(list_url)
+
+        response = client.get(list_url, {"title": "nothing matches"})
+
+        assert response.headers["X-Cache"] == "miss"
+        assert response.data["results"] == []
+
+    def test_authenticated_requests_bypass_the_cache(self, client, list_url, event, user):
+        client.get(list_url)
+        client.force_authenticate(user)
+
+        response = client.get(list_url)
+
+        assert "X-Cache" not in response.headers
+
+    def test_event_change_invalidates_list_and_detail(self, client, list_url, detail_url, event):
+        client.get(list_url)
+        client.get(detail_url)
+
+        event.title = "renamed"
+        event.save()
+
+        assert client.get(list_url).data["results"][0]["title"] == "renamed"
+        assert client.get(detail_url).data["title"] == "renamed"
+
+    def test_ticket_type_speaker_and_category_changes_invalidate_detail(self, client, detail_url, event, ticket_type):
+        client.get(detail_url)
+        ticket_type.title = "vip"
+        ticket_type.save()
+        assert client.get(detail_url).data["ticket_types"][0]["title"] == "vip"
+
+        Speaker.objects.create(name="speaker", event=event)
+        assert client.get(detail_url).headers["X-Cache"] == "miss"
+
+        category = EventCategory.objects.create(title="music")
+        event.categories.add(category)
+        assert client.get(detail_url).data["categories"] == [{"title": "music"}]
+
+        category.title = "jazz"
+        category.save()
+        assert client.get(detail_url).data["categories"] == [{"title": "jazz"}]
+
+    def test_organization_change_invalidates_its_events(self, client, detail_url, event, organization):
+        client.get(detail_url)
+
+        organization.name = "renamed"
+        organization.save()
+
+        assert client.get(detail_url).data["organization"]["name"] == "renamed"
+
+    def test_availability_is_refreshed_after_its_own_timeout(
+        self, client, detail_url, event, ticket_type, another_user, settings
+    ):
+        client.get(detail_url)
+        client.get(detail_url)  # caches the availability of the event
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+
+        stale_response = client.get(detail_url)
+        with time_machine.travel(timedelta(seconds=settings.RESPONSE_CACHE_AVAILABILITY_TIMEOUT + 1)):
+            response = client.get(detail_url)
+
+        assert stale_response.data["remaining_tickets"] == ticket_type.max_participants
+        assert response.headers["X-Cache"] == "hit"
+        assert response.data["remaining_tickets"] == ticket_type.max_participants - 2
+
+    def test_category_list_is_invalidated_by_category_changes(self, client, db):
+        url = reverse("events:category-list")
+        EventCategory.objects.create(title="music")
+        client.get(url)
+
+        EventCategory.objects.create(title="jazz")
+
+        assert client.get(url).data["count"] == 2
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.models import Event, EventCategory
+from apps.organizations.models import Organization
+
+
+class TestEventSearch:
+    @pytest.fixture
+    def create_searchable_event(self, organization, create_event):
+        def _create_searchable_event(title: str, description: str = "", organization=organization):
+            start_date = timezone.now() + timedelta(days=7)
+            event = create_event(organization, start_date, start_date + timedelta(hours=2))
+            event.title = title
+            event.description = description or "an evening out"
+            event.save()
+            return event
+
+        return _create_searchable_event
+
+    def search(self, query: str) -> list[str]:
+        response = APIClient().get(reverse("events:event-list"), {"q": query})
+        return [event["title"] for event in response.data["results"]]
+
+    def test_searches_title_description_organization_and_categories(self, create_searchable_event, user):
+        create_searchable_event("jazz night")
+        create_searchable_event("open mic", description="bring your jazz standards")
+        other_organization = Organization.objects.create(name="jazz club", username="jazzclub", owner=user)
+        create_searchable_event("friday session", organization=other_organization)
+        categorized = create_searchable_event("saturday session")
+        categorized.categories.add(EventCategory.objects.create(title="jazz"))
+        create_searchable_event("rock night")
+
+        assert sorted(self.search("jazz")) == ["friday session", "jazz night", "open mic", "saturday session"]
+
+    def test_every_word_has_to_match(self, create_searchable_event):
+        create_searchable_event("jazz night")
+        create_searchable_event("rock night")
+
+        assert self.search("night jazz") == ["jazz night"]
+
+    def test_search_results_are_paginated_with_page_numbers(self, create_searchable_event):
+        create_searchable_event("jazz night")
+
+        response = APIClient().get(reverse("events:event-list"), {"q": "jazz"})
+
+        assert response.data["count"] == 1
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="search vectors only exist on PostgreSQL")
+    def test_search_vector_follows_related_changes(self, create_searchable_event, organization):
+        event = create_searchable_event("friday session")
+        category = EventCategory.objects.create(title="blues")
+        event.categories.add(category)
+
+        organization.name = "jazz club"
+        organization.save()
+        category.title = "soul"
+        category.save()
+
+        assert self.search("jazz") == ["friday session"]
+        assert self.search("soul") == ["friday session"]
+        assert self.search("blues") == []
+        assert Event.objects.get(pk=event.pk).search_vector
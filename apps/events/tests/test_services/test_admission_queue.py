@@ -0,0 +1,214 @@
+from datetime import timedelta
+
+import pytest
+import time_machine
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.events.models import Ticket
+from apps.events.services.admission import AdmissionQueue
+from apps.users.models import User
+
+
+@pytest.fixture
+def queue_event(event):
+    event.admission_queue_enabled = True
+    event.save()
+    return event
+
+
+@pytest.fixture
+def create_buyers(db):
+    def _create_buyers(count: int):
+        return [User.objects.create_user(email=f"buyer{index}@example.com") for index in range(count)]
+
+    return _create_buyers
+
+
+class TestAdmissionQueue:
+    @pytest.fixture(autouse=True)
+    def admit_rate(self, settings):
+        settings.ADMISSION_QUEUE_ADMIT_RATE = 2
+
+    def test_first_buyers_are_admitted_right_away(self, redis_client, queue_event, create_buyers):
+        queue = AdmissionQueue(queue_event.public_id)
+        first, second, third = create_buyers(3)
+
+        for buyer in (first, second, third):
+            queue.join(buyer)
+
+        assert queue.position(first) == 0
+        assert queue.position(second) == 0
+        assert queue.position(third) == 1
+
+    def test_queue_advances_at_admit_rate(self, redis_client, queue_event, create_buyers):
+        queue = AdmissionQueue(queue_event.public_id)
+        buyers = create_buyers(6)
+
+        with time_machine.travel(timezone.now(), tick=False) as traveller:
+            for buyer in buyers:
+                queue.join(buyer)
+            assert queue.position(buyers[-1]) == 4
+
+            traveller.shift(timedelta(seconds=1))
+            assert queue.position(buyers[-1]) == 2
+
+            traveller.shift(timedelta(seconds=1))
+            assert queue.position(buyers[-1]) == 0
+
+    def test_polling_does_not_write_the_head(self, redis_client, queue_event, create_buyers):
+        queue = AdmissionQueue(queue_event.public_id)
+        buyers = create_buyers(4)
+        for buyer in buyers:
+            queue.join(buyer)
+        keys = queue._key("head"), queue._key("head_at")
+        head = redis_client.mget(*keys)
+
+        with time_machine.travel(timezone.now() + timedelta(seconds=1)):
+            assert queue.position(buyers[-1]) == 0
+
+        assert redis_client.mget(*keys) == head
+
+    def test_rush_after_an_idle_queue_is_admitted_at_admit_rate(self, redis_client, queue_event, create_buyers):
+        queue = AdmissionQueue(queue_event.public_id)
+        first, *rush = create_buyers(5)
+        queue.join(first)
+
+        with time_machine.travel(timezone.now() + timedelta(hours=1), tick=False):
+            for buyer in rush:
+                queue.join(buyer)
+
+            assert [queue.position(buyer) for buyer in rush] == [0, 0, 1, 2]
+
+    def test_joining_twice_keeps_the_place_in_the_queue(self, redis_client, queue_event, create_buyers):
+        queue = AdmissionQueue(queue_event.public_id)
+        buyer = create_buyers(1)[0]
+
+        assert queue.join(buyer) == queue.join(buyer) == 1
+
+    def test_position_of_unknown_buyer_is_none(self, redis_client, queue_event, user):
+        assert AdmissionQueue(queue_event.public_id).position(user) is None
+
+    def test_admission_token_is_bound_to_event_and_user(self, redis_client, queue_event, user, another_user):
+        queue = AdmissionQueue(queue_event.public_id)
+        token = queue.issue_token(user)
+
+        assert queue.is_valid_token(token, user) is True
+        assert queue.is_valid_token(token, another_user) is False
+        assert AdmissionQueue("other-event").is_valid_token(token, user) is False
+        assert queue.is_valid_token("forged", user) is False
+
+    def test_admission_token_is_single_use(self, redis_client, queue_event, user):
+        queue = AdmissionQueue(queue_event.public_id)
+        queue.join(user)
+        token = queue.issue_token(user)
+
+        assert queue.is_valid_token(token, user) is True
+        assert queue.consume_token(queue.issue_token(user), user) is True
+        assert queue.consume_token(token, user) is False
+        assert queue.is_valid_token(token, user) is False
+        assert queue.position(user) is None
+
+    def test_admission_token_expires(self, redis_client, queue_event, user, settings):
+        queue = AdmissionQueue(queue_event.public_id)
+        token = queue.issue_token(user)
+
+        with time_machine.travel(timedelta(seconds=settings.ADMISSION_TOKEN_MAX_AGE + 1)):
+            assert queue.is_valid_token(token, user) is False
+
+
+class TestAdmissionQueueViews:
+    @pytest.fixture
+    def client(self, another_user):
+        client = APIClient()
+        client.force_authenticate(another_user)
+        return client
+
+    def test_create_by_type_requires_admission_token(self, redis_client, client, queue_event, ticket_type):
+        url = reverse("events:ticket-create-by-type", kwargs={"event_public_id": queue_event.public_id})
+        data = [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}]
+
+        response = client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert Ticket.objects.count() == 0
+
+    def test_admitted_buyer_can_create_tickets(self, redis_client, client, queue_event, ticket_type):
+        queue_url = reverse("events:admission-queue", kwargs={"event_public_id": queue_event.public_id})
+        ticket_url = reverse("events:ticket-create-by-type", kwargs={"event_public_id": queue_event.public_id})
+
+        join_response = client.post(queue_url)
+        poll_response = client.get(queue_url)
+        response = client.post(
+            ticket_url,
+            [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}],
+            format="json",
+            headers={"X-Admission-Token": poll_response.data["admission_token"]},
+        )
+
+        assert join_response.status_code == status.HTTP_201_CREATED
+        assert poll_response.data["position"] == 0
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Ticket.objects.count() == 1
+
+    def test_admission_token_buys_once(self, redis_client, client, queue_event, ticket_type):
+        queue_url = reverse("events:admission-queue", kwargs={"event_public_id": queue_event.public_id})
+        ticket_url = reverse("events:ticket-create-by-type", kwargs={"event_public_id": queue_event.public_id})
+        client.post(queue_url)
+        token = client.get(queue_url).data["admission_token"]
+        data = [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}]
+
+        first = client.post(ticket_url, data, format="json", headers={"X-Admission-Token": token})
+        second = client.post(ticket_url, data, format="json", headers={"X-Admission-Token": token})
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.status_code == status.HTTP_403_FORBIDDEN
+        assert client.get(queue_url).status_code == status.HTTP_404_NOT_FOUND
+        assert Ticket.objects.count() == 1
+
+    def test_invalid_payload_keeps_the_admission(self, redis_client, client, queue_event, ticket_type):
+        queue_url = reverse("events:admission-queue", kwargs={"event_public_id": queue_event.public_id})
+        ticket_url = reverse("events:ticket-create-by-type", kwargs={"event_public_id": queue_event.public_id})
+        client.post(queue_url)
+        headers = {"X-Admission-Token": client.get(queue_url).data["admission_token"]}
+
+        invalid = client.post(ticket_url, [{"count": 1}], format="json", headers=headers)
+        retry = client.post(
+            ticket_url,
+            [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}],
+            format="json",
+            headers=headers,
+        )
+
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+        assert retry.status_code == status.HTTP_201_CREATED
+        assert Ticket.objects.count() == 1
+
+    def test_failed_purchase_gives_the_admission_back(
+        self, redis_client, client, queue_event, create_ticket_type, another_user
+    ):
+        ticket_type = create_ticket_type(max_participants=1, event=queue_event, price=0)
+        queue_url = reverse("events:admission-queue", kwargs={"event_public_id": queue_event.public_id})
+        ticket_url = reverse("events:ticket-create-by-type", kwargs={"event_public_id": queue_event.public_id})
+        client.post(queue_url)
+        token = client.get(queue_url).data["admission_token"]
+
+        response = client.post(
+            ticket_url,
+            [{"ticket_type_public_id": str(ticket_type.public_id), "count": 2}],
+            format="json",
+            headers={"X-Admission-Token": token},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert AdmissionQueue(queue_event.public_id).is_valid_token(token, another_user) is True
+        assert client.get(queue_url).data["position"] == 0
+
+    def test_polling_without_joining_returns_not_found(self, redis_client, client, queue_event):
+        queue_url = reverse("events:admission-queue", kwargs={"event_public_id": queue_event.public_id})
+
+        response = client.get(queue_url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,141 @@
+import io
+from datetime import timedelta
+
+import pytest
+import time_machine
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.events.models import FeaturedEvent
+from apps.events.services.featured import rank_featured_events
+from apps.events.services.tickets import TicketCreationService
+
+
+@pytest.fixture
+def add_event(organization, create_event, create_ticket_type):
+    def _add_event(max_participants: int = 10, days: int = 7):
+        start_date = timezone.now() + timedelta(days=days)
+        event = create_event(organization, start_date, start_date + timedelta(hours=2))
+        create_ticket_type(max_participants=max_participants, event=event, price=10000)
+        return event
+
+    return _add_event
+
+
+def buy(event, user, count: int):
+    ticket_types = [{"ticket_type_public_id": event.ticket_types.get().public_id, "count": count}]
+    TicketCreationService().handle_ticket_creation(event=event, user=user, ticket_types=ticket_types)
+
+
+def ranked_ids():
+    return list(FeaturedEvent.objects.values_list("event_id", flat=True))
+
+
+class TestRankFeaturedEvents:
+    def test_recent_sales_rank_first(self, add_event, another_user):
+        quiet, selling = add_event(), add_event()
+        buy(selling, another_user, 3)
+
+        rank_featured_events()
+
+        assert ranked_ids() == [selling.pk, quiet.pk]
+
+    def test_sales_outside_the_window_do_not_count(self, add_event, another_user, settings):
+        settings.FEATURED_WEIGHTS = {"sales": 1, "availability": 0, "recency": 0}
+        first, second = add_event(days=8), add_event(days=7)
+        buy(first, another_user, 3)
+
+        with time_machine.travel(timezone.now() + timedelta(seconds=settings.FEATURED_SALES_WINDOW + 1)):
+            rank_featured_events()
+
+        assert ranked_ids() == [second.pk, first.pk]  # equal scores, the sooner event first
+
+    def test_sold_out_events_rank_last(self, add_event, another_user, settings):
+        settings.FEATURED_WEIGHTS = {"sales": 0, "availability": 1, "recency": 0}
+        sold_out, available = add_event(max_participants=2, days=1), add_event(days=2)
+        buy(sold_out, another_user, 2)
+
+        rank_featured_events()
+
+        assert ranked_ids() == [available.pk, sold_out.pk]
+
+    def test_newer_events_rank_first_by_recency(self, add_event, settings):
+        settings.FEATURED_WEIGHTS = {"sales": 0, "availability": 0, "recency": 1}
+        with time_machine.travel(timezone.now() - timedelta(days=3)):
+            older = add_event(days=10)
+        newer = add_event(days=11)
+
+        ranking = rank_featured_events()
+
+        assert ranked_ids() == [newer.pk, older.pk]
+        assert ranking[1].score == pytest.approx(0.5 ** (3 / settings.FEATURED_RECENCY_HALF_LIFE), rel=1e-3)
+
+    def test_only_the_best_upcoming_active_events_are_kept(self, add_event, settings):
+        settings.FEATURED_EVENTS_COUNT = 2
+        settings.FEATURED_WEIGHTS = {"sales": 0, "availability": 1, "recency": 0}
+        events = [add_event(days=days) for days in (1, 2, 3)]
+        inactive = add_event()
+        inactive.is_active = False
+        inactive.save()
+        past = add_event(days=-1)
+
+        rank_featured_events()
+
+        assert ranked_ids() == [events[0].pk, events[1].pk]
+        assert not FeaturedEvent.objects.filter(event__in=[inactive, past]).exists()
+
+    def test_command_ranks_right_away(self, add_event):
+        event = add_event()
+        stdout = io.StringIO()
+
+        call_command("rank_featured_events", stdout=stdout)
+
+        assert ranked_ids() == [event.pk]
+        assert "Ranked 1 featured event(s)." in stdout.getvalue()
+
+
+class TestFeaturedEndpoint:
+    def test_events_in_rank_order(self, add_event, another_user, settings, django_assert_num_queries):
+        settings.FEATURED_EVENTS_COUNT = 2  # a full ranking is read alone
+        quiet, selling = add_event(), add_event()
+        buy(selling, another_user, 1)
+        rank_featured_events()
+
+        with django_assert_num_queries(1):
+            response = APIClient().get(reverse("events:event-featured"))
+
+        assert [event["public_id"] for event in response.json()] == [str(selling.public_id), str(quiet.public_id)]
+
+    def test_upcoming_events_are_listed_before_the_first_ranking(self, add_event):
+        soon, later = add_event(days=1), add_event(days=2)
+
+        response = APIClient().get(reverse("events:event-featured"))
+
+        assert [event["public_id"] for event in response.json()] == [str(later.public_id), str(soon.public_id)]
+
+    def test_events_created_since_the_ranking_fill_the_remaining_places(self, add_event, settings):
+        settings.FEATURED_EVENTS_COUNT = 2
+        ranked = add_event(days=1)
+        rank_featured_events()
+        add_event(days=2)
+        newer = add_event(days=3)
+
+        response = APIClient().get(reverse("events:event-featured"))
+
+        assert [event["public_id"] for event in response.json()] == [str(ranked.public_id), str(newer.public_id)]
+
+    def test_cached_response_follows_a_new_ranking(self, add_event, settings):
+        settings.FEATURED_WEIGHTS = {"sales": 0, "availability": 1, "recency": 0}
+        first, second = add_event(), add_event(days=8)
+        settings.FEATURED_EVENTS_COUNT = 1
+        rank_featured_events()
+        client = APIClient()
+        client.get(reverse("events:event-featured"))
+
+        settings.FEATURED_EVENTS_COUNT = 2
+        rank_featured_events()
+        response = client.get(reverse("events:event-featured"))
+
+        assert [event["public_id"] for event in response.json()] == [str(first.public_id), str(second.public_id)]
@@ -3,6 +3,9 @@ from datetime import timedelta
 
 import pytest
 import time_machine
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.exceptions import ValidationError
 
 from apps.core.exceptions import BadRequestException
@@ -10,7 +13,7 @@ from apps.events.choices import CommissionPayerChoice, EventStatusChoice, Ticket
 from apps.events.models import Ticket
 from apps.events.services.tickets import TicketCreationService
 from apps.payment.choices import BillStatusChoice, CommissionActionTypeChoice
-from apps.payment.models import TicketTransaction
+from apps.payment.models import CommissionRules, TicketTransaction
 from apps.payment.tasks import invalidate_transactions
 
 
@@ -105,6 +108,17 @@ class TestTicketCreationService:
         assert TicketTransaction.objects.count() == 1
         assert transaction.amount == ticket_type.price + ticket_type_commission.amount
 
+    def test_fractional_commission_is_rejected(self, create_ticket_type, event, another_user, create_commission_rule):
+        ticket_type = create_ticket_type(max_participants=10, event=event, price=10001)
+        create_commission_rule(10000, 20000, CommissionActionTypeChoice.PERCENTAGE, 3)
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+
+        with pytest.raises(DjangoValidationError, match="decimal places"):
+            TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+
+        assert Ticket.objects.count() == 0
+        assert TicketTransaction.objects.count() == 0
+
     def test_create_single_non_free_ticket_with_no_commission_rule(self, ticket_type, event, another_user):
         ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 1}]
 
@@ -231,3 +245,62 @@ class TestTicketCreationService:
         assert second_ticket_type_tickets[0].final_amount == second_ticket_type.price
         assert TicketTransaction.objects.count() == 1
         assert transaction.amount == second_ticket_type.price
+
+    def test_create_ticket_query_count_does_not_grow_with_ticket_count(self, create_ticket_type, event, another_user):
+        first_ticket_type = create_ticket_type(20, event, 10000)
+        second_ticket_type = create_ticket_type(20, event, 10000)
+        CommissionRules.objects.get_index()  # loaded once per process, not per order
+
+        with CaptureQueriesContext(connection) as single_ticket_queries:
+            TicketCreationService().handle_ticket_creation(
+                event=event,
+                user=another_user,
+                ticket_types=[{"ticket_type_public_id": first_ticket_type.public_id, "count": 1}],
+            )
+        with CaptureQueriesContext(connection) as many_tickets_queries:
+            TicketCreationService().handle_ticket_creation(
+                event=event,
+                user=another_user,
+                ticket_types=[{"ticket_type_public_id": second_ticket_type.public_id, "count": 10}],
+            )
+
+        assert Ticket.objects.count() == 11
+        assert len(many_tickets_queries) == len(single_ticket_queries)
+
+    def test_create_ticket_fails_for_ticket_type_of_another_event(
+        self, ticket_type, create_event, create_ticket_type, event, another_user
+    ):
+        other_event = create_event(event.organization, event.start_date, event.end_date)
+        other_ticket_type = create_ticket_type(10, other_event, 10000)
+        ticket_types = [
+            {"ticket_type_public_id": ticket_type.public_id, "count": 1},
+            {"ticket_type_public_id": other_ticket_type.public_id, "count": 1},
+        ]
+
+        with pytest.raises(ValidationError, match="Wrong ticket type is sent."):
+            TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+        assert Ticket.objects.count() == 0
+
+    def test_ticket_types_are_reserved_in_a_fixed_order_before_the_event_totals(
+        self, create_ticket_type, event, another_user
+    ):
+        first_ticket_type = create_ticket_type(20, event, 10000)
+        second_ticket_type = create_ticket_type(20, event, 10000)
+        ticket_types = [
+            {"ticket_type_public_id": second_ticket_type.public_id, "count": 1},
+            {"ticket_type_public_id": first_ticket_type.public_id, "count": 2},
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+
+        updates = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith(('UPDATE "events_tickettype" SET "reserved"', 'UPDATE "events_event"'))
+        ]
+        assert len(updates) == 3
+        assert f"= {first_ticket_type.pk})" in updates[0] and f"= {second_ticket_type.pk})" in updates[1]
+        assert updates[2].startswith('UPDATE "events_event"')
+        event.refresh_from_db()
+        assert event.tickets_reserved == 3
@@ -0,0 +1,119 @@
+import pytest
+from celery import current_app
+from django.db import OperationalError
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.events.choices import TicketOrderStatusChoice
+from apps.events.models import Ticket, TicketOrder, TicketType
+from apps.events.services.tickets import ORDER_FAILED_ERRORS, TicketCreationService, TicketOrderService
+from apps.events.tasks import process_ticket_order
+from apps.payment.models import TicketTransaction
+
+
+@pytest.fixture
+def eager_celery(monkeypatch):
+    monkeypatch.setattr(current_app.conf, "task_always_eager", True)
+
+
+class TestTicketOrderService:
+    def test_process_order_creates_tickets(self, ticket_type, event, another_user):
+        items = [{"ticket_type_public_id": str(ticket_type.public_id), "count": 2}]
+        order = TicketOrder.objects.create(event=event, user=another_user, items=items)
+
+        TicketOrderService().process_order(order.pk)
+        order.refresh_from_db()
+
+        assert order.status == TicketOrderStatusChoice.COMPLETED
+        assert order.result["transaction_public_id"] == str(TicketTransaction.objects.get().public_id)
+        assert len(order.result["ticket_data"][0]["ticket_public_ids"]) == 2
+        assert Ticket.objects.count() == 2
+
+    def test_process_order_records_validation_errors(self, ticket_type, event, another_user):
+        TicketType.objects.filter(pk=ticket_type.pk).update(sold=ticket_type.max_participants)
+        items = [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}]
+        order = TicketOrder.objects.create(event=event, user=another_user, items=items)
+
+        TicketOrderService().process_order(order.pk)
+        order.refresh_from_db()
+
+        assert order.status == TicketOrderStatusChoice.FAILED
+        assert order.errors == [f"No ticket is available for {ticket_type.public_id} ticket type"]
+        assert Ticket.objects.count() == 0
+        assert TicketTransaction.objects.count() == 0
+
+    def test_processed_order_is_not_processed_again(self, ticket_type, event, another_user):
+        items = [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}]
+        order = TicketOrder.objects.create(event=event, user=another_user, items=items)
+
+        TicketOrderService().process_order(order.pk)
+        TicketOrderService().process_order(order.pk)
+
+        assert Ticket.objects.count() == 1
+
+    def test_unexpected_errors_fail_the_order(self, ticket_type, event, another_user, monkeypatch):
+        def broken_ticket_creation(*args, **kwargs):
+            raise ValueError("No commission rule covers the price")
+
+        monkeypatch.setattr(TicketCreationService, "handle_ticket_creation", broken_ticket_creation)
+        items = [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}]
+        order = TicketOrder.objects.create(event=event, user=another_user, items=items)
+
+        TicketOrderService().process_order(order.pk)
+        order.refresh_from_db()
+
+        assert order.status == TicketOrderStatusChoice.FAILED
+        assert order.errors == ORDER_FAILED_ERRORS
+
+    def test_order_fails_once_the_task_runs_out_of_retries(self, ticket_type, event, another_user, monkeypatch):
+        calls = []
+
+        def broken_processing(self, order_id):
+            calls.append(order_id)
+            raise OperationalError("server closed the connection unexpectedly")
+
+        monkeypatch.setattr(TicketOrderService, "process_order", broken_processing)
+        order = TicketOrder.objects.create(event=event, user=another_user, items=[])
+
+        result = process_ticket_order.apply(args=[order.pk])
+        order.refresh_from_db()
+
+        assert isinstance(result.result, OperationalError)
+        assert len(calls) == process_ticket_order.max_retries + 1
+        assert order.status == TicketOrderStatusChoice.FAILED
+        assert order.errors == ORDER_FAILED_ERRORS
+
+
+class TestTicketOrderViews:
+    @pytest.fixture(autouse=True)
+    def async_orders(self, settings, eager_celery):
+        settings.TICKET_ORDER_ASYNC = True
+
+    @pytest.fixture
+    def client(self, another_user):
+        client = APIClient()
+        client.force_authenticate(another_user)
+        return client
+
+    def test_create_by_type_queues_the_order(self, client, event, ticket_type, django_capture_on_commit_callbacks):
+        url = reverse("events:ticket-create-by-type", kwargs={"event_public_id": event.public_id})
+        data = [{"ticket_type_public_id": str(ticket_type.public_id), "count": 1}]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(url, data, format="json")
+        order_response = client.get(
+            reverse("events:ticket-order", kwargs={"order_public_id": response.data["public_id"]})
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["status"] == TicketOrderStatusChoice.QUEUED
+        assert order_response.data["status"] == TicketOrderStatusChoice.COMPLETED
+        assert order_response.data["result"]["transaction_public_id"] == str(TicketTransaction.objects.get().public_id)
+
+    def test_order_of_another_user_is_not_found(self, client, event, user):
+        order = TicketOrder.objects.create(event=event, user=user, items=[])
+
+        response = client.get(reverse("events:ticket-order", kwargs={"order_public_id": order.public_id}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
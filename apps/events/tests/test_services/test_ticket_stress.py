@@ -0,0 +1,35 @@
+import pytest
+from django.db import connection
+
+from apps.events.services.stress import run_ticket_stress, setup_stress_event
+
+pytestmark = [pytest.mark.stress, pytest.mark.django_db(transaction=True)]
+
+
+@pytest.fixture(autouse=True)
+def postgresql_only():
+    if connection.vendor != "postgresql":
+        pytest.skip("stress tests need PostgreSQL, set TEST_DATABASE_URL")
+
+
+class TestTicketStress:
+    def test_concurrent_buyers_of_one_ticket_type_never_oversell(self):
+        event, ticket_types, buyers = setup_stress_event(buyers=200, capacity=50)
+
+        report = run_ticket_stress(event, ticket_types, buyers, workers=20)
+
+        assert report.oversold == 0
+        assert report.drifted_ticket_types == 0
+        assert report.succeeded == 50
+        assert report.rejected == 150
+
+    def test_concurrent_buyers_of_several_ticket_types_never_oversell(self):
+        event, ticket_types, buyers = setup_stress_event(buyers=200, ticket_types=3, capacity=50)
+
+        report = run_ticket_stress(event, ticket_types, buyers, tickets_per_buyer=2, workers=20)
+
+        assert report.oversold == 0
+        assert report.drifted_ticket_types == 0
+        assert report.deadlocks == 0
+        assert report.serialization_failures == 0
+        assert report.errors == 0
@@ -0,0 +1,143 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from apps.core.sparse_fields import FieldSelection
+from apps.events.models import EventCategory, Ticket
+from apps.events.serializers import EventSerializer, TicketSerializer
+from apps.events.services.tickets import TicketCreationService
+from apps.organizations.models import OrganizationSocialLink
+from apps.socials.choices import PlatformChoices
+
+
+@pytest.fixture
+def detail_url(event):
+    return reverse("events:event-detail", kwargs={"public_id": event.public_id})
+
+
+@pytest.fixture
+def category(event):
+    category = EventCategory.objects.create(title="music")
+    event.categories.add(category)
+    return category
+
+
+class TestFieldSelection:
+    def test_nested_selection(self):
+        selection = FieldSelection(frozenset({"title", "organization.name"}), frozenset({"organization"}))
+
+        assert selection.includes("organization") and not selection.includes("description")
+        assert selection.expands("organization") and not selection.expands("ticket_types")
+        assert selection.nested("organization") == FieldSelection(frozenset({"name"}), frozenset())
+
+    def test_everything_by_default(self):
+        selection = FieldSelection()
+
+        assert selection.includes("description") and selection.expands("organization")
+        assert selection.nested("organization") == FieldSelection()
+
+
+class TestEventSparseFields:
+    def test_full_response_by_default(self, detail_url, event, ticket_type, category):
+        OrganizationSocialLink.objects.create(
+            organization=event.organization, platform=PlatformChoices.TELEGRAM, url="https://t.me/hamgerd"
+        )
+
+        response = APIClient().get(detail_url)
+
+        event.refresh_from_db()
+        assert response.data == EventSerializer(event, context={"request": Request(response.wsgi_request)}).data
+        assert response.data["organization"]["social_links"] == [{"platform": "tg", "url": "https://t.me/hamgerd"}]
+
+    def test_fields(self, detail_url, event):
+        response = APIClient().get(detail_url, {"fields": "title,organization.name"})
+
+        assert response.json() == {
+            "public_id": str(event.public_id),
+            "title": event.title,
+            "organization": {"public_id": str(event.organization.public_id), "name": event.organization.name},
+        }
+
+    def test_unexpanded_relations_render_their_identifiers(self, detail_url, event, ticket_type, category):
+        response = APIClient().get(detail_url, {"fields": "organization,ticket_types,categories", "expand": ""})
+
+        assert response.json() == {
+            "public_id": str(event.public_id),
+            "organization": event.organization.username,
+            "ticket_types": [str(ticket_type.public_id)],
+            "categories": ["music"],
+        }
+
+    def test_unrequested_relations_are_not_loaded(self, detail_url, ticket_type, category):
+        with CaptureQueriesContext(connection) as context:
+            APIClient().get(detail_url, {"fields": "title"})
+
+        assert len(context) == 1
+        assert '"description"' not in context.captured_queries[0]["sql"]
+
+    def test_unexpanded_relations_load_their_identifiers_only(self, detail_url, event, ticket_type):
+        with CaptureQueriesContext(connection) as context:
+            APIClient().get(detail_url, {"fields": "organization", "expand": ""})
+
+        organization_query = context.captured_queries[1]["sql"]
+        assert '"username"' in organization_query and '"description"' not in organization_query
+        assert "COUNT" not in organization_query
+
+    def test_listing_fields(self, event):
+        response = APIClient().get(reverse("events:event-list"), {"fields": "title"})
+
+        assert response.json()["results"] == [{"public_id": str(event.public_id), "title": event.title}]
+
+    def test_writes_render_every_field(self, detail_url, event, user):
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.patch(f"{detail_url}?fields=title", {"location": "Tehran"}, format="json")
+
+        assert "description" in response.data
+
+
+class TestTicketSparseFields:
+    @pytest.fixture
+    def client(self, another_user):
+        client = APIClient()
+        client.force_authenticate(another_user)
+        return client
+
+    @pytest.fixture
+    def tickets(self, event, ticket_type, another_user):
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+        TicketCreationService().handle_ticket_creation(event=event, user=another_user, ticket_types=ticket_types)
+        return Ticket.objects.filter(user=another_user).order_by("-created_at", "-id")
+
+    def test_ticket_list(self, client, event, ticket_type, tickets):
+        url = reverse("events:ticket-list", kwargs={"event_public_id": event.public_id})
+
+        response = client.get(url, {"fields": "status,ticket_type", "expand": ""})
+
+        assert response.json()["results"] == [
+            {"public_id": str(ticket.public_id), "status": ticket.status, "ticket_type": str(ticket_type.public_id)}
+            for ticket in tickets
+        ]
+
+    def test_user_ticket_list_matches_the_serializer(self, client, tickets):
+        selection = FieldSelection(frozenset({"ticket_number", "ticket_type.title"}))
+
+        response = client.get(reverse("events:user-tickets"), {"fields": "ticket_number,ticket_type.title"})
+
+        assert response.data["results"] == TicketSerializer(tickets, many=True, selection=selection).data
+
+    def test_ticket_detail(self, client, event, tickets):
+        ticket = tickets.first()
+        url = reverse(
+            "events:ticket-detail", kwargs={"event_public_id": event.public_id, "public_id": ticket.public_id}
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, {"fields": "notes"})
+
+        assert response.json() == {"public_id": str(ticket.public_id), "notes": ticket.notes}
+        assert len(context) == 1
@@ -21,4 +21,6 @@ urlpatterns = [
     *events_router.urls,
     *tickets_router.urls,
     path("tickets/me/", views.UserTicketsView.as_view(), name="user-tickets"),
+    path("orders/<uuid:order_public_id>/", views.TicketOrderView.as_view(), name="ticket-order"),
+    path("<uuid:event_public_id>/queue/", views.AdmissionQueueView.as_view(), name="admission-queue"),
 ]
@@ -1,3 +1,3 @@
 from .events import EventCategoryViewSet, EventViewSet
 from .speakers import SpeakerViewSet
-from .tickets import TicketViewSet, UserPresenceView, UserTicketsView
+from .tickets import AdmissionQueueView, TicketOrderView, TicketViewSet, UserPresenceView, UserTicketsView
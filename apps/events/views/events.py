@@ -1,19 +1,39 @@
 from django_filters import rest_framework as filters
+from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from apps.core.response_cache import cached_response
+from apps.core.sparse_fields import expand_parameter, fields_parameter
+
+from ..cache import (
+    CATEGORIES_VERSION,
+    EVENTS_VERSION,
+    FEATURED_VERSION,
+    availability_state,
+    event_version,
+    refresh_availability,
+)
 from ..filters import EventFilter
 from ..models import Event
 from ..models.event import EventCategory
+from ..pagination import EventPagination
 from ..permissions import OrganizationOwnerPermission
 from ..serializers import (
     EventCreateSerializer,
+    EventListingSerializer,
     EventSerializer,
 )
 from ..serializers.event import EventCategorySerializer
+from ..services.listing import listings_of
 
 
+@extend_schema_view(
+    list=extend_schema(parameters=[fields_parameter]),
+    featured=extend_schema(parameters=[fields_parameter]),
+    retrieve=extend_schema(parameters=[fields_parameter, expand_parameter]),
+)
 class EventViewSet(viewsets.ModelViewSet):
     queryset = Event.get_all_events()
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, OrganizationOwnerPermission]
@@ -21,21 +41,57 @@ class EventViewSet(viewsets.ModelViewSet):
     lookup_url_kwarg = "public_id"
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = EventFilter
+    pagination_class = EventPagination
+
+    def get_queryset(self):
+        if self.action == "list":
+            return Event.get_all_events().with_listing()
+        # prefetches the relations and loads the columns of the fields the request selects, nothing else
+        return EventSerializer(context=self.get_serializer_context()).prune_queryset(super().get_queryset())
 
     def get_serializer_class(self):
         if self.action == "create":
             return EventCreateSerializer
+        elif self.action in ["list", "featured"]:
+            return EventListingSerializer
         else:
             return EventSerializer
 
+    @cached_response(
+        lambda request, **kwargs: [EVENTS_VERSION], refresh=refresh_availability, volatile=availability_state
+    )
+    def list(self, request, *args, **kwargs):
+        events = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        serializer = self.get_serializer(listings_of(events), many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @cached_response(
+        lambda request, public_id: [event_version(public_id)], refresh=refresh_availability, volatile=availability_state
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @action(methods=["get"], detail=False)
+    @cached_response(
+        lambda request, **kwargs: [EVENTS_VERSION, FEATURED_VERSION],
+        refresh=refresh_availability,
+        volatile=availability_state,
+    )
     def featured(self, request):
-        """Get all upcoming events"""
-        queryset = Event.get_featured_events()
-        serializer = EventSerializer(queryset, many=True)
+        """Get the featured upcoming events, ranked by recent ticket sales, availability and recency"""
+        events = Event.get_featured_events()
+        serializer = self.get_serializer(listings_of(events), many=True)
         return Response(serializer.data)
 
 
 class EventCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = EventCategory.objects.all()
     serializer_class = EventCategorySerializer
+
+    @cached_response(lambda request, **kwargs: [CATEGORIES_VERSION])
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cached_response(lambda request, **kwargs: [CATEGORIES_VERSION])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
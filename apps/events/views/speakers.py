@@ -3,6 +3,8 @@ from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
+from apps.core.conditional import collection_validators, conditional_response, object_validators
+
 from ..models import Event, Speaker
 from ..permissions import IsOrganizationOwnerThroughPermission
 from ..serializers import (
@@ -34,13 +36,25 @@ class SpeakerViewSet(
             return Speaker.objects.none()
 
         event_id = self.kwargs["event_public_id"]
-        return Speaker.objects.filter(event__public_id=event_id)
+        return Speaker.objects.filter(event__public_id=event_id).order_by("created_at", "id")
 
     def get_permissions(self):
         if self.action in ["retrieve", "list"]:
             return [permissions.AllowAny()]
         return [permissions.IsAuthenticated(), IsOrganizationOwnerThroughPermission()]
 
+    @conditional_response(lambda view, request, **kwargs: collection_validators(request, view.get_queryset()))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_response(
+        lambda view, request, public_id, **kwargs: object_validators(
+            request, view.get_queryset().filter(public_id=public_id)
+        )
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def create(self, request, event_public_id=None):
         """Create a new speaker for a specific event"""
         event = self.get_event(request.user, event_public_id)
@@ -1,45 +1,65 @@
-from drf_spectacular.types import OpenApiTypes
+from contextlib import nullcontext
+
+from django.conf import settings
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view, inline_serializer
 from rest_framework import mixins, permissions, serializers, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.exceptions import NotAcceptable, PermissionDenied
-from rest_framework.generics import GenericAPIView, get_object_or_404
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotAcceptable, NotFound, PermissionDenied
+from rest_framework.generics import GenericAPIView, RetrieveAPIView, get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from ..models import Event, Ticket
+from apps.core.idempotency import idempotency_key_parameter, idempotent
+from apps.core.pagination import cursor_parameter, page_parameter
+from apps.core.projection import ProjectionListMixin
+from apps.core.sparse_fields import expand_parameter, fields_parameter
+
+from ..models import Event, Ticket, TicketOrder
+from ..pagination import TicketPagination
 from ..serializers import (
     TicketCreateSerializer,
     TicketSerializer,
 )
-from ..serializers.ticket import TicketCreateResponseSerializer
-from ..services.tickets import TicketCreationService
+from ..serializers.ticket import (
+    AdmissionStatusSerializer,
+    TicketCreateResponseSerializer,
+    TicketOrderSerializer,
+    ticket_projection,
+)
+from ..services.admission import AdmissionQueue
+from ..services.tickets import TicketCreationService, TicketOrderService
 from .common import public_event_id_parameter, public_ticket_id_parameter
 
 
 @extend_schema_view(
-    retrieve=extend_schema(parameters=[public_event_id_parameter]),
+    retrieve=extend_schema(parameters=[public_event_id_parameter, fields_parameter, expand_parameter]),
     update=extend_schema(parameters=[public_event_id_parameter]),
     partial_update=extend_schema(parameters=[public_event_id_parameter]),
-    list=extend_schema(parameters=[public_event_id_parameter]),
+    list=extend_schema(parameters=[public_event_id_parameter, fields_parameter, expand_parameter]),
     create_by_type=extend_schema(parameters=[public_event_id_parameter]),
 )
 class TicketViewSet(
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
+    ProjectionListMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet,
 ):
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = "public_id"
+    pagination_class = TicketPagination
+    projection = ticket_projection
 
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Ticket.objects.none()
 
         event_id = self.kwargs["event_public_id"]
-        return Ticket.objects.filter(ticket_type__event__public_id=event_id)
+        queryset = Ticket.objects.filter(ticket_type__event__public_id=event_id)
+        if self.action == "list":
+            # rendered from values() by the projection
+            return queryset
+        return TicketSerializer(context=self.get_serializer_context()).prune_queryset(queryset)
 
     def get_serializer_class(self):
         if self.action == "create_by_type":
@@ -49,51 +69,109 @@ class TicketViewSet(
 
     @extend_schema(
         request=TicketCreateSerializer(many=True),
-        responses={201: TicketCreateResponseSerializer()},
+        responses={201: TicketCreateResponseSerializer(), 202: TicketOrderSerializer()},
+        parameters=[
+            OpenApiParameter(
+                "X-Admission-Token",
+                description="Admission token of the event's admission queue, required when the queue is enabled.",
+                type=str,
+                location="header",
+                required=False,
+            ),
+            idempotency_key_parameter,
+        ],
     )
     @action(methods=["post"], detail=False)
+    @idempotent
     def create_by_type(self, request, event_public_id=None):
+        event = get_object_or_404(Event, public_id=event_public_id)
         serializer = self.get_serializer(data=request.data, many=True)
         serializer.is_valid(raise_exception=True)
-        event = get_object_or_404(Event, public_id=event_public_id)
-        response_serializer = TicketCreationService().handle_ticket_creation(
-            event, request.user, serializer.validated_data
-        )
+
+        admission = nullcontext()
+        if event.admission_queue_enabled:
+            token = request.headers.get("X-Admission-Token")
+            admission = AdmissionQueue(event.public_id).admission(token, request.user)
+        with admission:
+            if settings.TICKET_ORDER_ASYNC:
+                order = TicketOrderService.handle_order_creation(event, request.user, serializer.data)
+                return Response(TicketOrderSerializer(order).data, status.HTTP_202_ACCEPTED)
+
+            response_serializer = TicketCreationService().handle_ticket_creation(
+                event, request.user, serializer.validated_data
+            )
         return Response(response_serializer.data, status.HTTP_201_CREATED)
 
 
-class UserTicketsView(GenericAPIView):
+class TicketOrderView(RetrieveAPIView):
+    """Status of a ticket order accepted while asynchronous ordering is on"""
+
+    serializer_class = TicketOrderSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = "public_id"
+    lookup_url_kwarg = "order_public_id"
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return TicketOrder.objects.none()
+        return TicketOrder.objects.filter(user=self.request.user)
+
+
+class AdmissionQueueView(GenericAPIView):
+    """Virtual waiting room in front of ticket creation for events with an admission queue"""
+
+    serializer_class = AdmissionStatusSerializer
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(request=None, responses={201: AdmissionStatusSerializer()}, parameters=[public_event_id_parameter])
+    def post(self, request, event_public_id):
+        """Join the admission queue of the event"""
+        event = get_object_or_404(Event, public_id=event_public_id, admission_queue_enabled=True)
+        queue = AdmissionQueue(event.public_id)
+        queue.join(request.user)
+        return Response(self._get_status(queue, queue.position(request.user)), status.HTTP_201_CREATED)
+
+    @extend_schema(parameters=[public_event_id_parameter])
+    def get(self, request, event_public_id):
+        """Poll the queue position, admitted users get a single-use admission token"""
+        queue = AdmissionQueue(event_public_id)
+        position = queue.position(request.user)
+        if position is None:
+            raise NotFound("You have not joined the admission queue of this event.")
+        return Response(self._get_status(queue, position))
+
+    def _get_status(self, queue: AdmissionQueue, position: int):
+        admission_token = queue.issue_token(self.request.user) if position == 0 else None
+        serializer = self.get_serializer({"position": position, "admission_token": admission_token})
+        return serializer.data
+
+
+class UserTicketsView(ProjectionListMixin, GenericAPIView):
     serializer_class = TicketSerializer
+    projection = ticket_projection
     permission_classes = [IsAuthenticated]
-    pagination_class = PageNumberPagination
+    pagination_class = TicketPagination
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return Ticket.objects.none()
+        return Ticket.objects.filter(user=self.request.user)
 
     @extend_schema(
         responses={
             200: inline_serializer(
                 name="PaginatedTicketResponse",
                 fields={
-                    "count": serializers.IntegerField(),
                     "next": serializers.CharField(allow_null=True),
                     "previous": serializers.CharField(allow_null=True),
                     "results": TicketSerializer(many=True),
                 },
             )
         },
-        parameters=[
-            OpenApiParameter(
-                "page",
-                description="A page number within the paginated result set.",
-                type=OpenApiTypes.INT,
-                location="query",
-            )
-        ],
+        parameters=[cursor_parameter, page_parameter, fields_parameter, expand_parameter],
     )
     def get(self, request):
-        queryset = Ticket.objects.select_related("user").filter(user=request.user)
-        queryset = self.filter_queryset(queryset)
-        page = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(page, many=True)
-        return self.get_paginated_response(serializer.data)
+        return self.list(request)
 
 
 @extend_schema_view(
@@ -0,0 +1,8 @@
+from apps.core.query_audit import hot_query
+
+from .feeds import LatestNewsFeed
+
+
+@hot_query("news.latest")
+def latest_news():
+    return LatestNewsFeed().items()
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:04
+
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # indexes are built concurrently on PostgreSQL, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("news", "0001_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="news",
+            index=models.Index(fields=["-created_at"], name="news_created_at_idx"),
+        ),
+    ]
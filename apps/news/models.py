@@ -8,6 +8,12 @@ class News(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # latest news, see LatestNewsFeed
+            models.Index(fields=["-created_at"], name="news_created_at_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
@@ -1,9 +1,11 @@
 from django_filters import rest_framework as filters
 
+from apps.core.filters import GeoProximityFilterSet
+
 from .models import Organization
 
 
-class OrganizationFilter(filters.FilterSet):
+class OrganizationFilter(GeoProximityFilterSet):
     name = filters.CharFilter(lookup_expr="icontains")
 
     class Meta:
@@ -0,0 +1,8 @@
+from apps.core.query_audit import hot_query
+
+from .models import Organization
+
+
+@hot_query("organizations.username")
+def organization_by_username():
+    return Organization.objects.filter(username__iexact="")
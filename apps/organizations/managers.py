@@ -0,0 +1,8 @@
+from django.db import models
+from django.db.models import Count
+
+
+class OrganizationQuerySet(models.QuerySet):
+    def with_event_count(self):
+        """Annotate ``annotated_event_count``, which ``Organization.event_count`` prefers over its cache"""
+        return self.annotate(annotated_event_count=Count("events"))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:10
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organizations", "0005_organization_phone"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="organization",
+            index=models.Index(django.db.models.functions.text.Upper("username"), name="organization_username_ci_idx"),
+        ),
+    ]
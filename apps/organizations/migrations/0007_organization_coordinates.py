@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_coordinates(apps, schema_editor):
+    Organization = apps.get_model("organizations", "Organization")
+
+    rows = []
+    for row in Organization.objects.filter(geo_location__isnull=False).only("pk", "geo_location").iterator():
+        row.latitude = row.geo_location.get("latitude")
+        row.longitude = row.geo_location.get("longitude")
+        rows.append(row)
+
+    Organization.objects.bulk_update(rows, ["latitude", "longitude"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organizations", "0006_organization_username_ci_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="latitude",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="longitude",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="organization",
+            index=models.Index(fields=["latitude", "longitude"], name="organization_coordinates_idx"),
+        ),
+        migrations.RunPython(backfill_coordinates, migrations.RunPython.noop),
+    ]
@@ -1,14 +1,22 @@
 from django.conf import settings
 from django.contrib.auth.validators import UnicodeUsernameValidator
-from django.core.cache import cache
 from django.core.validators import MinLengthValidator, RegexValidator
 from django.db import models
+from django.db.models.functions import Upper
 
+from apps.core.cache import cache
+from apps.core.geo import sync_coordinates
 from apps.core.models import BaseModel
 from apps.core.utils.identicon import add_default_image
 from apps.core.validators import geo_location_validator
 from apps.socials.models import AbstractSocialLink
 
+from .managers import OrganizationQuerySet
+
+
+def event_count_cache_key(organization_id) -> str:
+    return f"organization:{organization_id}:event-count"
+
 
 class Organization(BaseModel):
     name = models.CharField(max_length=255)
@@ -26,18 +34,27 @@ class Organization(BaseModel):
     address = models.TextField(blank=True, null=True)
     website = models.URLField(blank=True, null=True)
     geo_location = models.JSONField(null=True, blank=True, validators=[geo_location_validator])
+    # extracted from geo_location on save for proximity lookups, see apps.core.geo
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OrganizationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # organization_username event filter, iexact compares upper cased values
+            models.Index(Upper("username"), name="organization_username_ci_idx"),
+            models.Index(fields=["latitude", "longitude"], name="organization_coordinates_idx"),
+        ]
+
     @property
     def event_count(self) -> int:
-        key = f"{self.username}:event-count"
-        event_count_data = cache.get(key)
-        if not event_count_data:
-            event_count_data = self.events.count()
-            cache.set(key, event_count_data, timeout=60 * 60 * 12)
+        if hasattr(self, "annotated_event_count"):
+            return self.annotated_event_count
 
-        return event_count_data
+        return cache.get_or_set(event_count_cache_key(self.pk), self.events.count, timeout=60 * 60 * 12)
 
     def __str__(self):
         return self.name
@@ -45,6 +62,7 @@ class Organization(BaseModel):
     def save(self, *args, **kwargs):
         if not self.logo:
             add_default_image(self, image_field_name="logo")
+        kwargs["update_fields"] = sync_coordinates(self, kwargs.get("update_fields"))
         super().save(*args, **kwargs)
 
 
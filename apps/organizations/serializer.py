@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from apps.core.serializers import GeoLocationSerializer
+from apps.core.sparse_fields import SparseFieldsMixin
 
 from .models import Organization, OrganizationSocialLink
 
@@ -11,7 +12,7 @@ class OrganizationSocialLinkSerializer(serializers.ModelSerializer):
         fields = ["platform", "url"]
 
 
-class OrganizationSerializer(serializers.ModelSerializer):
+class OrganizationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     social_links = OrganizationSocialLinkSerializer(required=False, many=True)
 
     class Meta:
@@ -31,6 +32,13 @@ class OrganizationSerializer(serializers.ModelSerializer):
             "social_links",
         ]
         read_only_fields = ["event_count", "public_id"]
+        expandable_fields = {"social_links": "url"}
+
+    def prune_queryset(self, queryset):
+        queryset = super().prune_queryset(queryset)
+        if "event_count" in self.fields:
+            queryset = queryset.with_event_count()
+        return queryset
 
 
 class OrganizationCreateSerializer(serializers.ModelSerializer):
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Organization, OrganizationSocialLink
+
+
+@receiver([post_save, post_delete], sender=OrganizationSocialLink)
+def touch_organization_of_social_link(sender, instance, **kwargs):
+    # the social links are part of the organization's responses, move their validators along
+    Organization.objects.filter(pk=instance.organization_id).update(updated_at=timezone.now())
@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+import time_machine
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.organizations.models import OrganizationSocialLink
+from apps.socials.choices import PlatformChoices
+
+
+class TestOrganizationConditionalRequests:
+    def test_list_is_not_modified_until_an_organization_changes(self, organization):
+        client = APIClient()
+        url = reverse("organizations:organization-list")
+        response = client.get(url)
+        assert client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == status.HTTP_304_NOT_MODIFIED
+
+        organization.name = "renamed"
+        organization.save()
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == status.HTTP_200_OK
+
+    def test_new_event_modifies_the_event_count(self, organization, create_event):
+        client = APIClient()
+        url = reverse("organizations:organization-detail", kwargs={"org_username": organization.username})
+        response = client.get(url)
+        assert response["Cache-Control"] == "no-cache"
+
+        with time_machine.travel(timedelta(minutes=1)):
+            create_event(organization, timezone.now() + timedelta(days=1), timezone.now() + timedelta(days=2))
+        revalidated = client.get(
+            url, HTTP_IF_NONE_MATCH=response["ETag"], HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+
+        assert revalidated.status_code == status.HTTP_200_OK
+        assert revalidated.data["event_count"] == response.data["event_count"] + 1
+
+    def test_social_link_change_modifies_the_organization(self, organization):
+        client = APIClient()
+        detail_url = reverse("organizations:organization-detail", kwargs={"org_username": organization.username})
+        list_url = reverse("organizations:organization-list")
+        detail, listing = client.get(detail_url), client.get(list_url)
+
+        with time_machine.travel(timedelta(minutes=1)):
+            OrganizationSocialLink.objects.create(
+                organization=organization, platform=PlatformChoices.choices[0][0], url="https://example.com"
+            )
+
+        assert client.get(detail_url, HTTP_IF_NONE_MATCH=detail["ETag"]).status_code == status.HTTP_200_OK
+        assert client.get(list_url, HTTP_IF_NONE_MATCH=listing["ETag"]).status_code == status.HTTP_200_OK
+
+    def test_unknown_organization_is_not_found(self, db):
+        response = APIClient().get(reverse("organizations:organization-detail", kwargs={"org_username": "nobody"}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
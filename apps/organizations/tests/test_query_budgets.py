@@ -0,0 +1,35 @@
+import pytest
+from django.urls import reverse
+from faker import Faker
+from rest_framework.test import APIClient
+
+from apps.core.tests.utils import assert_query_budget
+from apps.organizations.models import Organization, OrganizationSocialLink
+from apps.socials.choices import PlatformChoices
+
+faker = Faker()
+
+
+class TestOrganizationQueryBudgets:
+    @pytest.fixture
+    def add_organizations(self, user):
+        def _add_organizations(count: int = 3):
+            for _ in range(count):
+                organization = Organization.objects.create(name=faker.word(), username=faker.user_name(), owner=user)
+                OrganizationSocialLink.objects.create(
+                    organization=organization, platform=PlatformChoices.TELEGRAM, url=faker.url()
+                )
+
+        return _add_organizations
+
+    def test_organization_list(self, add_organizations):
+        add_organizations(1)
+        client = APIClient()
+
+        assert_query_budget(lambda: client.get(reverse("organizations:organization-list")), 4, add_organizations)
+
+    def test_organization_detail(self, organization):
+        client = APIClient()
+        url = reverse("organizations:organization-detail", kwargs={"org_username": organization.username})
+
+        assert_query_budget(lambda: client.get(url), 3, lambda: None)
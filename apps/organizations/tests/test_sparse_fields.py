@@ -0,0 +1,27 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.organizations.models import OrganizationSocialLink
+from apps.socials.choices import PlatformChoices
+
+
+class TestOrganizationSparseFields:
+    def test_fields_skip_the_event_count(self, organization):
+        url = reverse("organizations:organization-detail", kwargs={"org_username": organization.username})
+
+        with CaptureQueriesContext(connection) as context:
+            response = APIClient().get(url, {"fields": "name"})
+
+        assert response.json() == {"public_id": str(organization.public_id), "name": organization.name}
+        assert not any("COUNT" in query["sql"] or "sociallink" in query["sql"] for query in context.captured_queries)
+
+    def test_unexpanded_social_links_render_their_urls(self, organization):
+        link = OrganizationSocialLink.objects.create(
+            organization=organization, platform=PlatformChoices.TELEGRAM, url="https://t.me/hamgerd"
+        )
+
+        response = APIClient().get(reverse("organizations:organization-list"), {"fields": "social_links", "expand": ""})
+
+        assert response.json()["results"] == [{"public_id": str(organization.public_id), "social_links": [link.url]}]
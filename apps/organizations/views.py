@@ -1,21 +1,52 @@
 from django_filters import rest_framework as filters
+from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import permissions
 from rest_framework.mixins import CreateModelMixin, ListModelMixin, RetrieveModelMixin, UpdateModelMixin
 from rest_framework.viewsets import GenericViewSet
 
+from apps.core.conditional import collection_validators, conditional_response, object_validators
+from apps.core.sparse_fields import expand_parameter, fields_parameter
+
 from .filters import OrganizationFilter
 from .models import Organization
 from .permissions import IsOwnerOrReadOnly
 from .serializer import OrganizationCreateSerializer, OrganizationSerializer
 
 
+@extend_schema_view(
+    list=extend_schema(parameters=[fields_parameter, expand_parameter]),
+    retrieve=extend_schema(parameters=[fields_parameter, expand_parameter]),
+)
 class OrganizationViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin, CreateModelMixin, UpdateModelMixin):
-    queryset = Organization.objects.all()
+    queryset = Organization.objects.with_event_count().prefetch_related("social_links")
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = OrganizationFilter
     lookup_field = "username"
     lookup_url_kwarg = "org_username"
 
+    @conditional_response(
+        # the filters alone, the event count annotation would make the aggregate count every event
+        lambda view, request, **kwargs: collection_validators(request, view.filter_queryset(Organization.objects.all()))
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_response(
+        # creating or deleting an event touches its organization, its event count is covered too
+        lambda view, request, org_username: object_validators(
+            request, Organization.objects.filter(username=org_username)
+        )
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    def get_queryset(self):
+        if self.action in ["list", "retrieve"]:
+            return OrganizationSerializer(context=self.get_serializer_context()).prune_queryset(
+                Organization.objects.all()
+            )
+        return super().get_queryset()
+
     def get_serializer_class(self):
         if self.action in ["create", "update", "partial_update"]:
             return OrganizationCreateSerializer
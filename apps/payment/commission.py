@@ -0,0 +1,48 @@
+import logging
+from bisect import bisect_right
+from decimal import Decimal
+from uuid import uuid4
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+RULES_VERSION_CACHE_KEY = "commission-rules:version"
+
+
+class CommissionRuleIndex:
+    """
+    Sorted, non-overlapping ``[start, end)`` intervals of commission rules searched with bisect.
+
+    Saving a rule rejects overlaps, a rule overlapping an earlier one anyway, e.g. written with
+    ``bulk_create``, is logged and left out instead of failing every lookup.
+    """
+
+    def __init__(self, rules):
+        self.rules = []
+        for rule in sorted(rules, key=lambda rule: (rule.start, rule.pk or 0)):
+            if self.rules and rule.start < self.rules[-1].end:
+                logger.error("Commission rule %s overlaps %s and is ignored.", rule.public_id, self.rules[-1].public_id)
+                continue
+            self.rules.append(rule)
+        self.starts = [rule.start for rule in self.rules]
+
+    def find(self, amount: Decimal):
+        position = bisect_right(self.starts, amount) - 1
+        if position >= 0 and amount < self.rules[position].end:
+            return self.rules[position]
+        return None
+
+
+def get_rules_version() -> str:
+    """Version of the commission rules shared by all processes through the cache"""
+    version = cache.get(RULES_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(RULES_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(RULES_VERSION_CACHE_KEY)
+    return version
+
+
+def bump_rules_version():
+    """Make every process reload its commission rule index on the next lookup"""
+    cache.set(RULES_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
@@ -0,0 +1,20 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.core.query_audit import hot_query
+
+from .choices import BillStatusChoice
+from .models import TicketTransaction
+
+
+@hot_query("payment.expired_transactions")
+def expired_transactions():
+    return TicketTransaction.objects.filter(
+        status=BillStatusChoice.PENDING.value, created_at__lt=timezone.now() - timedelta(minutes=15)
+    )
+
+
+@hot_query("payment.transaction_by_authority")
+def transaction_by_authority():
+    return TicketTransaction.objects.filter(authority="")
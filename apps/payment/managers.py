@@ -1,11 +1,31 @@
+from collections.abc import Iterable
+from decimal import Decimal
+
 from django.db import models
 
+from .commission import CommissionRuleIndex, get_rules_version
+
 
 class CommissionRulesManager(models.Manager):
+    _index = None
+    _index_version = None
+
+    def get_index(self) -> CommissionRuleIndex:
+        """In-process interval index of all rules, reloaded when another process changed the rules"""
+        version = get_rules_version()
+        if self._index is None or self._index_version != version:
+            self._index = CommissionRuleIndex(self.all())
+            self._index_version = version
+        return self._index
+
     def get_commission_rule(self, amount):
-        rules = self.filter(start__lte=amount, end__gt=amount)
-        if rules.count() > 1:
-            raise ValueError(f"Two rules matched for amount {amount}.")
-        if rules.count() == 1:
-            return rules[0]
-        return None
+        return self.get_index().find(amount)
+
+    def get_commissions(self, prices: Iterable[Decimal]) -> dict[Decimal, Decimal]:
+        """Map each price to the commission charged on it"""
+        index = self.get_index()
+        commissions = {}
+        for price in prices:
+            rule = index.find(price)
+            commissions[price] = rule.calculate_commission(price) if rule else Decimal(0)
+        return commissions
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payment", "0002_commissionrules_alter_tickettransaction_amount_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tickettransaction",
+            index=models.Index(fields=["-created_at", "-id"], name="transaction_created_at_id_idx"),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:04
+
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # indexes are built concurrently on PostgreSQL, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("payment", "0003_keyset_pagination_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="tickettransaction",
+            index=models.Index(fields=["status", "created_at"], name="transaction_status_created_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="tickettransaction",
+            index=models.Index(fields=["authority"], name="transaction_authority_idx"),
+        ),
+    ]
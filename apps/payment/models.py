@@ -1,7 +1,9 @@
 from datetime import timedelta
+from decimal import Decimal
 
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from apps.core.models import BaseModel
@@ -20,6 +22,16 @@ class TicketTransaction(BaseModel):
     paid_at = models.DateTimeField(default=timezone.now, null=True)
     transaction_id = models.CharField(blank=True, null=True, max_length=128)
 
+    class Meta:
+        indexes = [
+            # keyset pagination of the transactions of a user, see UsersTransactionsView
+            models.Index(fields=["-created_at", "-id"], name="transaction_created_at_id_idx"),
+            # pending transactions expiring, see the invalidate_transactions task
+            models.Index(fields=["status", "created_at"], name="transaction_status_created_idx"),
+            # payment verification, see VerifyPaymentView
+            models.Index(fields=["authority"], name="transaction_authority_idx"),
+        ]
+
     def __str__(self):
         return f"Transaction {self.id}/{self.public_id} - {self.amount}"
 
@@ -28,18 +40,20 @@ class TicketTransaction(BaseModel):
         return self.created_at + timedelta(minutes=15)
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        self.validate_on_save()
         super().save(*args, **kwargs)
 
+    @transaction.atomic
     def cancel(self):
         self.status = BillStatusChoice.CANCELLED
-        self.tickets.update(status=TicketStatusChoice.CANCELLED)
+        self.tickets.set_status(TicketStatusChoice.CANCELLED)
         self.save()
 
+    @transaction.atomic
     def confirm(self, ref_id):
         self.transaction_id = ref_id
         self.status = BillStatusChoice.SUCCESS
-        self.tickets.update(status=TicketStatusChoice.SUCCESS)
+        self.tickets.set_status(TicketStatusChoice.SUCCESS)
         self.save()
 
 
@@ -51,6 +65,30 @@ class CommissionRules(BaseModel):
 
     objects = CommissionRulesManager()
 
+    def __str__(self):
+        return f"Commission rule [{self.start}, {self.end})"
+
+    def clean(self):
+        if self.start >= self.end:
+            raise ValidationError("Start must be lesser than end.")
+        overlapping_rules = CommissionRules.objects.filter(start__lt=self.end, end__gt=self.start).exclude(pk=self.pk)
+        if overlapping_rules.exists():
+            raise ValidationError("Commission rule overlaps with another rule.")
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        # concurrent saves of rules wait for each other, so neither misses the overlap of the other
+        list(CommissionRules.objects.select_for_update().values_list("pk", flat=True))
+        self.validate_on_save()
+        super().save(*args, **kwargs)
+
+    def calculate_commission(self, price: Decimal) -> Decimal:
+        if self.action == CommissionActionTypeChoice.PERCENTAGE:
+            return self.amount * price / 100
+        if self.action == CommissionActionTypeChoice.CONSTANT:
+            return self.amount
+        raise ValueError("Unhandled commission type")
+
 
 class OrganizationAccounting(BaseModel):
     organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name="accounts")
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from apps.core.projection import Projection
+
 from .choices import BillStatusChoice
 from .models import TicketTransaction
 
@@ -32,6 +34,10 @@ class TicketTransactionSerializerPublic(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+# fast read path of transaction lists, renders exactly what TicketTransactionSerializerPublic does
+transaction_projection = Projection(TicketTransactionSerializerPublic)
+
+
 class TransactionResultSerializer(serializers.Serializer):
     transaction_id = serializers.UUIDField()
     status = serializers.ChoiceField(choices=BillStatusChoice)
@@ -0,0 +1,11 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .commission import bump_rules_version
+from .models import CommissionRules
+
+
+@receiver([post_save, post_delete], sender=CommissionRules)
+def invalidate_commission_rule_index(sender, **kwargs):
+    transaction.on_commit(bump_rules_version)
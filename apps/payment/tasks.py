@@ -3,6 +3,8 @@ from datetime import timedelta
 from celery import shared_task
 from django.utils import timezone
 
+from apps.core.models import relaxed_validation
+
 from .models import BillStatusChoice, TicketTransaction
 
 
@@ -12,5 +14,8 @@ def invalidate_transactions():
         status=BillStatusChoice.PENDING.value, created_at__lt=timezone.now() - timedelta(minutes=15)
     )
 
-    for transaction in unpaid_tickets_list:
-        transaction.cancel()
+    # cancel() releases the reserved inventory of the tickets through the ticket type counters,
+    # the transactions only change their status, so their saves skip the field validation
+    with relaxed_validation():
+        for transaction in unpaid_tickets_list:
+            transaction.cancel()
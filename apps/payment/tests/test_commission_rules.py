@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from apps.payment.choices import CommissionActionTypeChoice
+from apps.payment.commission import CommissionRuleIndex, bump_rules_version
+from apps.payment.models import CommissionRules
+
+
+class TestCommissionRuleIndex:
+    def test_lookup_matches_half_open_intervals(self, create_commission_rule):
+        low = create_commission_rule(0, 1000, CommissionActionTypeChoice.CONSTANT, 10)
+        high = create_commission_rule(1000, 5000, CommissionActionTypeChoice.CONSTANT, 20)
+
+        assert CommissionRules.objects.get_commission_rule(Decimal(0)) == low
+        assert CommissionRules.objects.get_commission_rule(Decimal(999)) == low
+        assert CommissionRules.objects.get_commission_rule(Decimal(1000)) == high
+        assert CommissionRules.objects.get_commission_rule(Decimal(5000)) is None
+
+    def test_lookups_after_load_do_not_query_the_database(self, create_commission_rule, django_assert_num_queries):
+        create_commission_rule(0, 1000, CommissionActionTypeChoice.CONSTANT, 10)
+        CommissionRules.objects.get_commission_rule(Decimal(10))
+
+        with django_assert_num_queries(0):
+            CommissionRules.objects.get_commission_rule(Decimal(20))
+
+    def test_index_is_reloaded_when_rules_change(self, create_commission_rule, django_capture_on_commit_callbacks):
+        rule = create_commission_rule(0, 1000, CommissionActionTypeChoice.CONSTANT, 10)
+        assert CommissionRules.objects.get_commission_rule(Decimal(1500)) is None
+
+        with django_capture_on_commit_callbacks(execute=True):
+            rule.end = 2000
+            rule.save()
+
+        assert CommissionRules.objects.get_commission_rule(Decimal(1500)) == rule
+
+    def test_overlapping_rules_loaded_are_logged_and_ignored(self, create_commission_rule, caplog):
+        rule = create_commission_rule(0, 1000, CommissionActionTypeChoice.CONSTANT, 10)
+        CommissionRules.objects.bulk_create(
+            [CommissionRules(start=500, end=1500, action=CommissionActionTypeChoice.CONSTANT, amount=10)]
+        )
+        bump_rules_version()
+
+        assert CommissionRules.objects.get_commission_rule(Decimal(10)) == rule
+        assert CommissionRules.objects.get_commission_rule(Decimal(1200)) is None
+        assert "overlaps" in caplog.text
+
+    def test_overlapping_rule_fails_validation(self, create_commission_rule):
+        create_commission_rule(0, 1000, CommissionActionTypeChoice.CONSTANT, 10)
+        rule = CommissionRules(start=999, end=2000, action=CommissionActionTypeChoice.CONSTANT, amount=10)
+
+        with pytest.raises(ValidationError):
+            rule.full_clean()
+
+    def test_overlapping_rule_is_rejected_on_save(self, create_commission_rule):
+        create_commission_rule(0, 1000, CommissionActionTypeChoice.CONSTANT, 10)
+
+        with pytest.raises(ValidationError, match="overlaps"):
+            create_commission_rule(999, 2000, CommissionActionTypeChoice.CONSTANT, 10)
+
+        assert CommissionRules.objects.count() == 1
+
+    def test_index_is_not_reloaded_before_the_change_commits(
+        self, create_commission_rule, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks() as callbacks:
+            create_commission_rule(0, 1000, CommissionActionTypeChoice.CONSTANT, 10)
+
+        assert bump_rules_version in callbacks
+
+    def test_get_commissions_calculates_many_prices_at_once(self, create_commission_rule):
+        create_commission_rule(0, 10000, CommissionActionTypeChoice.CONSTANT, 100)
+        create_commission_rule(10000, 100000, CommissionActionTypeChoice.PERCENTAGE, 10)
+
+        commissions = CommissionRules.objects.get_commissions([Decimal(5000), Decimal(20000), Decimal(200000)])
+
+        assert commissions == {Decimal(5000): 100, Decimal(20000): 2000, Decimal(200000): 0}
+
+    def test_empty_index_finds_nothing(self):
+        assert CommissionRuleIndex([]).find(Decimal(10)) is None
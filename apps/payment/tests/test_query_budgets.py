@@ -0,0 +1,24 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.core.tests.utils import assert_query_budget
+from apps.events.services.tickets import TicketCreationService
+
+
+class TestPaymentQueryBudgets:
+    def test_user_transaction_list(self, event, ticket_type, another_user):
+        client = APIClient()
+        client.force_authenticate(another_user)
+        ticket_types = [{"ticket_type_public_id": ticket_type.public_id, "count": 2}]
+
+        def add_transactions(count: int = 3):
+            for _ in range(count):
+                TicketCreationService().handle_ticket_creation(event, another_user, ticket_types)
+
+        def request():
+            response = client.get(reverse("payment:user_transactions"))
+            assert response.status_code == status.HTTP_200_OK
+
+        add_transactions(1)
+        assert_query_budget(request, 1, add_transactions)
@@ -1,13 +1,18 @@
 from decouple import config
 from django.conf import settings
-from rest_framework import permissions
+from drf_spectacular.utils import extend_schema, inline_serializer
+from rest_framework import permissions, serializers
 from rest_framework.generics import GenericAPIView, get_object_or_404
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.idempotency import idempotency_key_parameter, idempotent
+from apps.core.pagination import KeysetPagination, cursor_parameter, page_parameter
+from apps.core.projection import ProjectionListMixin
+
 from .choices import BillStatusChoice, CurrencyChoice
 from .models import TicketTransaction
-from .serializer import TicketTransactionSerializer, TicketTransactionSerializerPublic
+from .serializer import TicketTransactionSerializer, TicketTransactionSerializerPublic, transaction_projection
 from .service import TransactionRequest, send_payment_request, verify_payment_request
 from .utils import build_transaction_result
 
@@ -20,6 +25,8 @@ class PayTransactionView(GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = TicketTransactionSerializer
 
+    @extend_schema(parameters=[idempotency_key_parameter])
+    @idempotent
     def post(self, request, transaction):
         ticket_transaction = TicketTransaction.objects.filter(
             public_id=transaction, tickets__user=request.user, status=BillStatusChoice.PENDING.value
@@ -84,13 +91,29 @@ class VerifyPaymentView(APIView):
         return Response(trs)
 
 
-class UsersTransactionsView(GenericAPIView):
+class UsersTransactionsView(ProjectionListMixin, GenericAPIView):
     serializer_class = TicketTransactionSerializerPublic
+    projection = transaction_projection
     permission_classes = [permissions.IsAuthenticated]
-
-    def retrieve(self, request):
-        transactions = TicketTransaction.objects.filter(
-            tickets__user=request.user,
-        ).distinct()
-        serializer = self.serializer_class(transactions, many=True)
-        return Response(serializer.data)
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return TicketTransaction.objects.none()
+        return TicketTransaction.objects.filter(tickets__user=self.request.user).distinct()
+
+    @extend_schema(
+        responses={
+            200: inline_serializer(
+                name="PaginatedTicketTransactionResponse",
+                fields={
+                    "next": serializers.CharField(allow_null=True),
+                    "previous": serializers.CharField(allow_null=True),
+                    "results": TicketTransactionSerializerPublic(many=True),
+                },
+            )
+        },
+        parameters=[cursor_parameter, page_parameter],
+    )
+    def get(self, request):
+        return self.list(request)
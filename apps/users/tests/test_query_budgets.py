@@ -0,0 +1,13 @@
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core.tests.utils import assert_max_queries
+
+
+class TestUserQueryBudgets:
+    def test_user_me(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+
+        with assert_max_queries(1):
+            client.get(reverse("users:me"))
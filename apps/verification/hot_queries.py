@@ -0,0 +1,15 @@
+from django.utils import timezone
+
+from apps.core.query_audit import hot_query
+
+from .models import VerificationToken
+
+
+@hot_query("verification.token")
+def token():
+    return VerificationToken.objects.filter(token="")
+
+
+@hot_query("verification.expired_tokens")
+def expired_tokens():
+    return VerificationToken.objects.filter(expire_at__lt=timezone.now())
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # indexes are built concurrently on PostgreSQL, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("verification", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="verificationtoken",
+            index=models.Index(fields=["token"], name="verification_token_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="verificationtoken",
+            index=models.Index(fields=["expire_at"], name="verification_expire_at_idx"),
+        ),
+    ]
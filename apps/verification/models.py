@@ -35,3 +35,9 @@ class VerificationToken(BaseModel):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # token verification, see the verification views
+            models.Index(fields=["token"], name="verification_token_idx"),
+            # expired tokens, see the auto_delete_expired_verification_tokens task
+            models.Index(fields=["expire_at"], name="verification_expire_at_idx"),
+        ]
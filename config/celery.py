@@ -1,6 +1,7 @@
 import os
 
 from celery import Celery
+from celery.signals import beat_init
 from decouple import config
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", config("DJANGO_SETTINGS_MODULE"))
@@ -9,3 +10,9 @@ app = Celery("config")
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+
+@beat_init.connect
+def rank_featured_events_on_start(sender, **kwargs):
+    # the featured ranking is otherwise only filled by the first scheduled run after a deploy
+    app.send_task("apps.events.tasks.rank_featured_events")
@@ -40,6 +40,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "apps.core.middleware.QueryCountMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -105,8 +106,20 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "users.User"
 
+# encode and decode JSON with orjson, see apps.core.renderers
+USE_ORJSON = config("USE_ORJSON", cast=bool, default=True)
+
 REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "drf_standardized_errors.handler.exception_handler",
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.core.renderers.ORJSONRenderer" if USE_ORJSON else "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "apps.core.parsers.ORJSONParser" if USE_ORJSON else "rest_framework.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ],
@@ -159,6 +172,63 @@ CELERY_BEAT_SCHEDULE = {
         "task": "apps.events.tasks.end_up_events_on_end_date",
         "schedule": timedelta(minutes=15),
     },
+    "rank_featured_events": {
+        "task": "apps.events.tasks.rank_featured_events",
+        "schedule": timedelta(minutes=10),
+    },
+}
+# ticket orders run on their own single-process worker, so purchases are written one at a time
+CELERY_TASK_ROUTES = {
+    "apps.events.tasks.process_ticket_order": {"queue": "ticket_orders"},
+}
+
+# Redis
+REDIS_URL = config("REDIS_URL", default="redis://localhost:6379/2")
+
+# Cache, see apps.core.cache for the two-tier cache in front of it
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config("CACHE_REDIS_URL", default="redis://localhost:6379/3"),
+    },
+}
+LOCAL_CACHE_MAX_ENTRIES = config("LOCAL_CACHE_MAX_ENTRIES", cast=int, default=1024)
+# other processes may serve a deleted or replaced value for this many seconds
+LOCAL_CACHE_TIMEOUT = config("LOCAL_CACHE_TIMEOUT", cast=float, default=5)  # seconds
+# cache timeouts are spread by this fraction in both directions
+CACHE_TTL_JITTER = config("CACHE_TTL_JITTER", cast=float, default=0.1)
+
+# Admission queue
+ADMISSION_QUEUE_ADMIT_RATE = config("ADMISSION_QUEUE_ADMIT_RATE", cast=float, default=10)  # buyers per second
+ADMISSION_TOKEN_MAX_AGE = config("ADMISSION_TOKEN_MAX_AGE", cast=int, default=60 * 10)  # seconds
+
+# Query budget, see apps.core.middleware.QueryCountMiddleware
+QUERY_COUNT_WARNING_THRESHOLD = config("QUERY_COUNT_WARNING_THRESHOLD", cast=int, default=30)
+QUERY_COUNT_HEADERS = config("QUERY_COUNT_HEADERS", cast=bool, default=False)
+
+# Response cache of public endpoints, see apps.core.response_cache
+RESPONSE_CACHE_TIMEOUT = config("RESPONSE_CACHE_TIMEOUT", cast=int, default=60 * 5)  # seconds
+# ticket availability of cached event responses is refreshed after this many seconds
+RESPONSE_CACHE_AVAILABILITY_TIMEOUT = config("RESPONSE_CACHE_AVAILABILITY_TIMEOUT", cast=int, default=5)
+
+# Idempotency keys
+IDEMPOTENCY_KEY_TTL = config("IDEMPOTENCY_KEY_TTL", cast=int, default=60 * 60 * 24)  # seconds
+IDEMPOTENCY_WAIT_TIMEOUT = config("IDEMPOTENCY_WAIT_TIMEOUT", cast=float, default=30)  # seconds
+# lifetime of the record of a request still running, has to exceed the longest request by far
+IDEMPOTENCY_IN_FLIGHT_TTL = config("IDEMPOTENCY_IN_FLIGHT_TTL", cast=int, default=60 * 10)  # seconds
+
+# Ticket orders
+# accept purchases with 202 and create the tickets in the ticket_orders queue
+TICKET_ORDER_ASYNC = config("TICKET_ORDER_ASYNC", cast=bool, default=False)
+
+# Featured events, see apps.events.services.featured
+FEATURED_EVENTS_COUNT = config("FEATURED_EVENTS_COUNT", cast=int, default=10)
+FEATURED_SALES_WINDOW = config("FEATURED_SALES_WINDOW", cast=int, default=60 * 60 * 24)  # seconds
+FEATURED_RECENCY_HALF_LIFE = config("FEATURED_RECENCY_HALF_LIFE", cast=float, default=7)  # days
+FEATURED_WEIGHTS = {
+    "sales": config("FEATURED_SALES_WEIGHT", cast=float, default=0.6),
+    "availability": config("FEATURED_AVAILABILITY_WEIGHT", cast=float, default=0.15),
+    "recency": config("FEATURED_RECENCY_WEIGHT", cast=float, default=0.25),
 }
 
 # Minio
@@ -5,6 +5,8 @@ DEBUG = True
 ALLOWED_HOSTS += ["0.0.0.0", "127.0.0.1", "localhost"]
 AWS_S3_PROXIES = {"http": "minio:9000"}
 
+QUERY_COUNT_HEADERS = True
+
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
@@ -58,6 +58,11 @@ LOGGING = {
             "level": config("DJANGO_LOG_LEVEL", "WARNING"),
             "propagate": True,
         },
+        "apps": {
+            "handlers": ["console", "file"],
+            "level": config("APPS_LOG_LEVEL", "WARNING"),
+            "propagate": False,
+        },
     },
 }
 
@@ -1,12 +1,25 @@
+import dj_database_url
+import fakeredis
+
 from .base import *  # noqa: F403
 
+# in-memory SQLite unless a real database is given, the stress tests need PostgreSQL
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": ":memory:",
-    },
+    "default": dj_database_url.parse(config("TEST_DATABASE_URL", default="sqlite://:memory:")),  # noqa: F405
 }
 
+# fakeredis unless a real server is given, like the redis_client fixture
+if test_redis_url := config("TEST_REDIS_URL", default=""):  # noqa: F405
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": test_redis_url}}
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": "redis://localhost:6379/0",
+            "OPTIONS": {"connection_class": fakeredis.FakeRedisConnection},
+        },
+    }
+
 
 class DisableMigrations:
     def __contains__(self, item):
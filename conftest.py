@@ -1,6 +1,7 @@
 import django
 from django.conf import settings
 
+from apps.core.tests.fixtures import *  # noqa: F403
 from apps.events.tests.fixtures import *  # noqa: F403
 from apps.organizations.tests.fixtures import *  # noqa: F403
 from apps.payment.tests.fixtures import *  # noqa: F403